@@ -164,24 +164,39 @@ async function parseJsonBody(request) {
   }
 }
 
-function allowedSort(sort) {
+// bm25 column weights for tools_fts (migrations/0003_tools_fts.sql): name, tags, description.
+const FTS_RANK = "bm25(tools_fts, 10.0, 3.0, 1.0)";
+
+function allowedSort(sort, ranked = false) {
   switch (sort) {
     case "name_desc":
-      return "name DESC";
+      return "tools.name DESC";
     case "newest":
-      return "id DESC";
+      return "tools.id DESC";
+    case "name_asc":
+      return "tools.name ASC";
     default:
-      return "name ASC";
+      // "relevance" and no sort at all: bm25 order for searches, name order otherwise.
+      return ranked ? `${FTS_RANK}, tools.name ASC` : "tools.name ASC";
   }
 }
 
+function ftsQuery(q) {
+  // Every word must match as a prefix ("vid edit" -> "vid"* "edit"*); quoting keeps FTS5 syntax out of user input.
+  const terms = q.toLowerCase().match(/[\p{L}\p{N}]+/gu) || [];
+  return terms
+    .slice(0, 8)
+    .map((term) => `"${term}"*`)
+    .join(" ");
+}
+
 async function handleToolsList(request, env) {
   const url = new URL(request.url);
   const q = normalizeInput(url.searchParams.get("q"), 100);
   const category = normalizeInput(url.searchParams.get("category"), 60);
   const page = parsePositiveInt(url.searchParams.get("page"), 1);
   const pageSize = Math.min(parsePositiveInt(url.searchParams.get("pageSize"), DEFAULT_PAGE_SIZE), MAX_PAGE_SIZE);
-  const sort = allowedSort(normalizeInput(url.searchParams.get("sort"), 20));
+  const sortParam = normalizeInput(url.searchParams.get("sort"), 20);
 
   if (q && !/^[\w\s\-+.#@/:]{1,100}$/i.test(q)) {
     return badRequest("Invalid search query.");
@@ -192,8 +207,17 @@ async function handleToolsList(request, env) {
 
   const whereClauses = ["quality_status NOT LIKE 'invalid%'"];
   const binds = [];
-  if (q) {
-    whereClauses.push("(LOWER(name) LIKE LOWER(?) OR LOWER(tags) LIKE LOWER(?) OR LOWER(description) LIKE LOWER(?))");
+  const match = q ? ftsQuery(q) : "";
+  let fromSQL = "tools";
+  if (match) {
+    fromSQL = "tools_fts JOIN tools ON tools.id = tools_fts.rowid";
+    whereClauses.push("tools_fts MATCH ?");
+    binds.push(match);
+  } else if (q) {
+    // Punctuation-only queries have no indexable terms; keep the substring scan for them.
+    whereClauses.push(
+      "(LOWER(tools.name) LIKE LOWER(?) OR LOWER(tools.tags) LIKE LOWER(?) OR LOWER(tools.description) LIKE LOWER(?))"
+    );
     const query = `%${q}%`;
     binds.push(query, query, query);
   }
@@ -204,14 +228,17 @@ async function handleToolsList(request, env) {
   const whereSQL = whereClauses.length ? `WHERE ${whereClauses.join(" AND ")}` : "";
   const offset = (page - 1) * pageSize;
 
+  const sort = allowedSort(sortParam, Boolean(match));
+
   const listSQL = `
-    SELECT slug, name, category, tags, description, website_url, domain, quality_status
-    FROM tools
+    SELECT tools.slug, tools.name, tools.category, tools.tags, tools.description,
+      tools.website_url, tools.domain, tools.quality_status
+    FROM ${fromSQL}
     ${whereSQL}
     ORDER BY ${sort}
     LIMIT ? OFFSET ?
   `;
-  const countSQL = `SELECT COUNT(*) AS total FROM tools ${whereSQL}`;
+  const countSQL = `SELECT COUNT(*) AS total FROM ${fromSQL} ${whereSQL}`;
 
   const [listResult, countResult] = await Promise.all([
     env.DB.prepare(listSQL).bind(...binds, pageSize, offset).all(),
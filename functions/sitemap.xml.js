@@ -9,6 +9,21 @@ export async function onRequestGet(context) {
   const { env, request } = context;
   const origin = "https://findaidir.com";
 
+  // scripts/build_dataset.py writes a sitemap index over gzip shards; D1 is only the fallback.
+  const asset = await context.next();
+  if (asset.ok) {
+    const body = await asset.text();
+    if (body.startsWith("<?xml")) {
+      return new Response(body, {
+        status: 200,
+        headers: {
+          "content-type": "application/xml; charset=utf-8",
+          "cache-control": "public, max-age=3600",
+        },
+      });
+    }
+  }
+
   const rows = await env.DB.prepare(
     "SELECT slug, updated_at FROM tools WHERE quality_status NOT LIKE 'invalid%' ORDER BY id DESC LIMIT 50000"
   ).all();
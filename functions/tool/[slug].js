@@ -205,34 +205,54 @@ export async function onRequestGet(context) {
     .filter(Boolean);
   const primaryTag = tags[0] || row.category;
 
-  const similarResult = await env.DB.prepare(
-    `SELECT slug, name, category, tags, description, website_url, domain
-     FROM tools
-     WHERE slug <> ?
-       AND quality_status NOT LIKE 'invalid%'
-       AND (category = ? OR tags LIKE ?)
-     ORDER BY CASE WHEN category = ? THEN 0 ELSE 1 END, id DESC
+  // tool_similar is precomputed by scripts/build_dataset.py: one primary-key range read per page view.
+  const precomputed = await env.DB.prepare(
+    `SELECT tools.slug, tools.name, tools.category, tools.tags, tools.description, tools.website_url, tools.domain
+     FROM tool_similar
+     JOIN tools ON tools.slug = tool_similar.similar_slug
+     WHERE tool_similar.slug = ?
+       AND tools.quality_status NOT LIKE 'invalid%'
+     ORDER BY tool_similar.rank
      LIMIT 9`
   )
-    .bind(slug, row.category, `%${primaryTag}%`, row.category)
+    .bind(slug)
     .all();
 
-  let similarTools = similarResult.results || [];
+  let similarTools = precomputed.results || [];
+  const seen = new Set(similarTools.map((item) => item.slug));
+  seen.add(slug);
+  const appendUnseen = (candidates) => {
+    for (const candidate of candidates) {
+      if (similarTools.length >= 9) break;
+      if (!seen.has(candidate.slug)) {
+        similarTools.push(candidate);
+        seen.add(candidate.slug);
+      }
+    }
+  };
+
+  // Tools added since the last build (or with no shared terms) fall back to category/tag matches.
+  if (similarTools.length < 6) {
+    const similarResult = await env.DB.prepare(
+      `SELECT slug, name, category, tags, description, website_url, domain
+       FROM tools
+       WHERE slug <> ?
+         AND quality_status NOT LIKE 'invalid%'
+         AND (category = ? OR tags LIKE ?)
+       ORDER BY CASE WHEN category = ? THEN 0 ELSE 1 END, id DESC
+       LIMIT 9`
+    )
+      .bind(slug, row.category, `%${primaryTag}%`, row.category)
+      .all();
+    appendUnseen(similarResult.results || []);
+  }
   if (similarTools.length < 6) {
-    const seen = new Set(similarTools.map((item) => item.slug));
-    seen.add(slug);
     const fallbackResult = await env.DB.prepare(
       "SELECT slug, name, category, tags, description, website_url, domain FROM tools WHERE slug <> ? AND quality_status NOT LIKE 'invalid%' ORDER BY id DESC LIMIT 18"
     )
       .bind(slug)
       .all();
-    for (const candidate of fallbackResult.results || []) {
-      if (!seen.has(candidate.slug)) {
-        similarTools.push(candidate);
-        seen.add(candidate.slug);
-      }
-      if (similarTools.length >= 9) break;
-    }
+    appendUnseen(fallbackResult.results || []);
   }
   similarTools = similarTools.slice(0, 9);
 
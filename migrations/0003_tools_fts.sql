@@ -0,0 +1,28 @@
+-- Full-text index for /api/tools?q= search (external content over tools, kept in sync by triggers)
+CREATE VIRTUAL TABLE IF NOT EXISTS tools_fts USING fts5(
+  name,
+  tags,
+  description,
+  content = 'tools',
+  content_rowid = 'id',
+  tokenize = 'unicode61 remove_diacritics 2',
+  prefix = '2 3'
+);
+
+CREATE TRIGGER IF NOT EXISTS tools_fts_insert AFTER INSERT ON tools BEGIN
+  INSERT INTO tools_fts(rowid, name, tags, description) VALUES (new.id, new.name, new.tags, new.description);
+END;
+
+CREATE TRIGGER IF NOT EXISTS tools_fts_delete AFTER DELETE ON tools BEGIN
+  INSERT INTO tools_fts(tools_fts, rowid, name, tags, description)
+  VALUES ('delete', old.id, old.name, old.tags, old.description);
+END;
+
+CREATE TRIGGER IF NOT EXISTS tools_fts_update AFTER UPDATE OF name, tags, description ON tools BEGIN
+  INSERT INTO tools_fts(tools_fts, rowid, name, tags, description)
+  VALUES ('delete', old.id, old.name, old.tags, old.description);
+  INSERT INTO tools_fts(rowid, name, tags, description) VALUES (new.id, new.name, new.tags, new.description);
+END;
+
+-- Index rows seeded before this migration.
+INSERT INTO tools_fts(tools_fts) VALUES ('rebuild');
@@ -0,0 +1,8 @@
+-- Precomputed similar tools for /tool/:slug, written into the seed by scripts/build_dataset.py
+CREATE TABLE IF NOT EXISTS tool_similar (
+  slug TEXT NOT NULL,
+  similar_slug TEXT NOT NULL,
+  rank INTEGER NOT NULL,
+  score REAL NOT NULL,
+  PRIMARY KEY (slug, rank)
+) WITHOUT ROWID;
@@ -1,7 +1,7 @@
 const state = {
   q: "",
   category: "",
-  sort: "name_asc",
+  sort: "relevance",
   page: 1,
   pageSize: 20,
   totalPages: 1,
@@ -11,6 +11,7 @@ const state = {
 const els = {
   form: document.getElementById("filters"),
   searchInput: document.getElementById("searchInput"),
+  searchSuggest: document.getElementById("searchSuggest"),
   categorySelect: document.getElementById("categorySelect"),
   sortSelect: document.getElementById("sortSelect"),
   resetBtn: document.getElementById("resetBtn"),
@@ -27,6 +28,14 @@ const els = {
 
 let activeController = null;
 let debounceTimer = null;
+// Static listing snapshot written by scripts/build_dataset.py; null when not deployed.
+let snapshot = null;
+// Autocomplete prefix index written by scripts/build_dataset.py; shards are fetched once per prefix.
+let suggestIndex = null;
+const suggestShards = new Map();
+let suggestSeq = 0;
+// Same order as KIND_ORDER in scripts/prefix_index.py: name starts, later word, tag, category.
+const SUGGEST_KIND_ORDER = { n: 0, w: 1, t: 2, c: 3 };
 
 function truncate(text, maxLen) {
   if (!text) return "";
@@ -114,7 +123,7 @@ function readStateFromUrl() {
   const params = new URLSearchParams(window.location.search);
   state.q = (params.get("q") || "").trim();
   state.category = (params.get("category") || "").trim();
-  state.sort = (params.get("sort") || "name_asc").trim();
+  state.sort = (params.get("sort") || "relevance").trim();
   state.page = Math.max(1, Number(params.get("page") || "1"));
 }
 
@@ -122,7 +131,7 @@ function syncUrlFromState() {
   const params = new URLSearchParams();
   if (state.q) params.set("q", state.q);
   if (state.category) params.set("category", state.category);
-  if (state.sort && state.sort !== "name_asc") params.set("sort", state.sort);
+  if (state.sort && state.sort !== "relevance") params.set("sort", state.sort);
   if (state.page > 1) params.set("page", String(state.page));
   const next = params.toString();
   const url = `${window.location.pathname}${next ? `?${next}` : ""}`;
@@ -138,7 +147,7 @@ function syncFormFromState() {
 function syncStateFromForm() {
   state.q = els.searchInput.value.trim();
   state.category = els.categorySelect.value.trim();
-  state.sort = els.sortSelect.value.trim() || "name_asc";
+  state.sort = els.sortSelect.value.trim() || "relevance";
 }
 
 function renderTools(items) {
@@ -231,6 +240,16 @@ function buildQuery() {
   return params.toString();
 }
 
+function snapshotPath() {
+  if (!snapshot || state.q || state.pageSize !== snapshot.pageSize) return "";
+  const sort = state.sort === "relevance" ? "name_asc" : state.sort;
+  if (!snapshot.sorts.includes(sort)) return "";
+  const { categories } = snapshot;
+  const listing = state.category ? Object.hasOwn(categories, state.category) && categories[state.category] : snapshot.all;
+  if (!listing || state.page > listing.pages) return "";
+  return `/snapshot/v/${snapshot.version}/${listing.key}/${sort}-${state.page}.json`;
+}
+
 async function fetchJson(path, signal) {
   const response = await fetch(path, { headers: { Accept: "application/json" }, signal });
   if (!response.ok) {
@@ -272,8 +291,155 @@ function renderCategoryChips(categories) {
   }
 }
 
+async function loadSnapshotManifest() {
+  try {
+    snapshot = await fetchJson("/snapshot/manifest.json");
+  } catch (_) {
+    snapshot = null;
+  }
+}
+
+async function loadSuggestManifest() {
+  try {
+    suggestIndex = await fetchJson("/suggest/manifest.json");
+  } catch (_) {
+    suggestIndex = null;
+  }
+}
+
+function normalizeTerm(text) {
+  const words = String(text || "")
+    .toLowerCase()
+    .normalize("NFKD")
+    .replace(/\p{M}/gu, "")
+    .match(/[\p{L}\p{N}]+/gu);
+  return (words || []).join(" ");
+}
+
+function suggestShardPath(prefix) {
+  const hex = Array.from(new TextEncoder().encode(prefix), (byte) => byte.toString(16).padStart(2, "0")).join("");
+  return `/suggest/v/${suggestIndex.version}/${hex}.json`;
+}
+
+function loadSuggestShard(prefix) {
+  const path = suggestShardPath(prefix);
+  if (!suggestShards.has(path)) {
+    // A prefix without a shard has no terms (missing files come back as index.html, which fails to parse).
+    suggestShards.set(path, fetchJson(path).catch(() => null));
+  }
+  return suggestShards.get(path);
+}
+
+function compareSuggestTerms(a, b) {
+  return (
+    SUGGEST_KIND_ORDER[a[1]] - SUGGEST_KIND_ORDER[b[1]] ||
+    b[2] - a[2] ||
+    a[0].length - b[0].length ||
+    (a[0] < b[0] ? -1 : a[0] > b[0] ? 1 : 0)
+  );
+}
+
+async function lookupSuggestions(query) {
+  const chars = Array.from(normalizeTerm(query)).slice(0, suggestIndex.maxTermChars);
+  if (chars.length < suggestIndex.minChars) return null;
+  const term = chars.join("");
+  let length = suggestIndex.minChars;
+  let shard = await loadSuggestShard(chars.slice(0, length).join(""));
+  // Split shards only hold the best terms for their own prefix; longer queries continue one character deeper.
+  while (shard && shard.split && chars.length > length) {
+    length += 1;
+    shard = await loadSuggestShard(chars.slice(0, length).join(""));
+  }
+
+  const tools = [];
+  const filters = [];
+  if (!shard) return { tools, filters };
+  const seen = new Set();
+  const matches = shard.terms.filter((entry) => entry[0].startsWith(term)).sort(compareSuggestTerms);
+  for (const [, kind, count, value] of matches) {
+    if (kind === "t" || kind === "c") {
+      if (filters.length < 3) filters.push({ kind, label: value, count });
+      continue;
+    }
+    for (const id of value) {
+      const [slug, name] = shard.tools[id];
+      if (tools.length < 6 && !seen.has(slug)) {
+        seen.add(slug);
+        tools.push({ slug, name });
+      }
+    }
+  }
+  return { tools, filters };
+}
+
+function hideSuggestions() {
+  suggestSeq += 1;
+  els.searchSuggest.textContent = "";
+  els.searchSuggest.classList.add("hidden");
+}
+
+function renderSuggestions({ tools, filters }) {
+  els.searchSuggest.textContent = "";
+  for (const tool of tools) {
+    const li = document.createElement("li");
+    const link = document.createElement("a");
+    link.href = `/tool/${encodeURIComponent(tool.slug)}`;
+    link.textContent = tool.name;
+    li.appendChild(link);
+    els.searchSuggest.appendChild(li);
+  }
+  for (const filter of filters) {
+    const li = document.createElement("li");
+    const button = document.createElement("button");
+    button.type = "button";
+    button.textContent = filter.label;
+    const hint = document.createElement("small");
+    hint.textContent = `${filter.kind === "c" ? "Category" : "Tag"} (${filter.count})`;
+    button.appendChild(hint);
+    button.addEventListener("click", async () => {
+      hideSuggestions();
+      window.clearTimeout(debounceTimer);
+      if (filter.kind === "c") {
+        state.q = "";
+        state.category = filter.label;
+      } else {
+        // Raw tag labels can hold characters the API rejects in q ("Photo & Image Editor").
+        state.q = normalizeTerm(filter.label);
+      }
+      state.page = 1;
+      syncFormFromState();
+      try {
+        await loadTools();
+      } catch (error) {
+        if (error.name !== "AbortError") showLoadError(error);
+      }
+    });
+    li.appendChild(button);
+    els.searchSuggest.appendChild(li);
+  }
+  els.searchSuggest.classList.toggle("hidden", !tools.length && !filters.length);
+}
+
+async function updateSuggestions() {
+  if (!suggestIndex) return;
+  const seq = ++suggestSeq;
+  const result = await lookupSuggestions(els.searchInput.value);
+  if (seq !== suggestSeq) return;
+  if (!result) {
+    hideSuggestions();
+    return;
+  }
+  renderSuggestions(result);
+}
+
 async function loadCategories() {
-  const payload = await fetchJson("/api/categories");
+  let payload;
+  try {
+    if (!snapshot) throw new Error("no snapshot");
+    payload = await fetchJson(`/snapshot/v/${snapshot.version}/categories.json`);
+  } catch (_) {
+    payload = await fetchJson("/api/categories");
+  }
   const categories = payload.items || [];
   for (const row of categories) {
     const option = document.createElement("option");
@@ -298,7 +464,15 @@ async function loadTools() {
   els.resultCount.textContent = "Loading tools...";
   const started = performance.now();
 
-  const payload = await fetchJson(`/api/tools?${buildQuery()}`, activeController.signal);
+  // Only free-text searches (and pages past the snapshot) need D1.
+  const staticPath = snapshotPath();
+  let payload;
+  try {
+    payload = await fetchJson(staticPath || `/api/tools?${buildQuery()}`, activeController.signal);
+  } catch (error) {
+    if (!staticPath || error.name === "AbortError") throw error;
+    payload = await fetchJson(`/api/tools?${buildQuery()}`, activeController.signal);
+  }
   const items = payload.items || [];
   state.total = Number(payload.total || 0);
   state.totalPages = Number(payload.totalPages || 1);
@@ -321,21 +495,34 @@ function debounceLoad() {
 
 els.form.addEventListener("submit", async (event) => {
   event.preventDefault();
+  hideSuggestions();
   syncStateFromForm();
   state.page = 1;
   await loadTools();
 });
 
 els.resetBtn.addEventListener("click", async () => {
+  hideSuggestions();
   state.q = "";
   state.category = "";
-  state.sort = "name_asc";
+  state.sort = "relevance";
   state.page = 1;
   syncFormFromState();
   await loadTools();
 });
 
-els.searchInput.addEventListener("input", debounceLoad);
+// Typing only consults the static suggestion index; D1 is queried on submit or when a suggestion
+// is picked. Clearing the box goes back to the unfiltered listing, which the snapshot serves.
+els.searchInput.addEventListener("input", () => {
+  updateSuggestions();
+  if (!els.searchInput.value.trim() && state.q) debounceLoad();
+});
+els.searchInput.addEventListener("keydown", (event) => {
+  if (event.key === "Escape") hideSuggestions();
+});
+document.addEventListener("click", (event) => {
+  if (!event.target.closest(".search-field")) hideSuggestions();
+});
 els.categorySelect.addEventListener("change", debounceLoad);
 els.sortSelect.addEventListener("change", debounceLoad);
 
@@ -351,16 +538,23 @@ els.nextPage.addEventListener("click", async () => {
   await loadTools();
 });
 
+function showLoadError(error) {
+  els.resultCount.textContent = "Failed to load data. Check API setup.";
+  els.emptyState.classList.remove("hidden");
+  els.emptyState.textContent = String(error.message || error);
+}
+
 async function bootstrap() {
   try {
     readStateFromUrl();
+    // Suggestions are optional: the listing does not wait for their manifest.
+    loadSuggestManifest();
+    await loadSnapshotManifest();
     await loadCategories();
     syncFormFromState();
     await loadTools();
   } catch (error) {
-    els.resultCount.textContent = "Failed to load data. Check API setup.";
-    els.emptyState.classList.remove("hidden");
-    els.emptyState.textContent = String(error.message || error);
+    showLoadError(error);
   }
 }
 
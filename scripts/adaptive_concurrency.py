@@ -0,0 +1,200 @@
+"""AIMD in-flight limit for the async crawl scripts, driven by timeout/error rate and latency."""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+import aiohttp
+
+# Failures that point at our own link or the path being saturated rather than at one dead site.
+CONGESTION_ERRORS = (asyncio.TimeoutError, aiohttp.ServerDisconnectedError, aiohttp.ClientPayloadError)
+
+
+class AdaptiveLimiter:
+    """Resizable global slot pool.
+
+    The limit doubles per window until the first sign of congestion (slow start),
+    then grows by ``increase`` per window and is multiplied by ``decrease`` when a
+    window's error rate or median latency jumps. A window is at least ``min_window_sec``
+    and ``max(min_window, limit)`` completions of requests started after the last
+    change, so every decision reflects the current level. Requests still in flight
+    after ``overdue_factor`` times the window's p90 latency count as errors, since a
+    stalled request would otherwise only surface at its timeout.
+    """
+
+    def __init__(
+        self,
+        initial: int,
+        ceiling: int,
+        floor: int = 4,
+        increase: int | None = None,
+        decrease: float = 0.7,
+        max_error_rate: float = 0.1,
+        latency_tolerance: float = 2.5,
+        latency_slack_ms: float = 50.0,
+        min_window: int = 20,
+        min_window_sec: float = 1.0,
+        overdue_factor: float = 4.0,
+        verbose: bool = True,
+    ) -> None:
+        self.floor = max(1, floor)
+        self.ceiling = max(self.floor, ceiling)
+        self.limit = min(max(initial, self.floor), self.ceiling)
+        self.increase = increase or max(1, self.ceiling // 50)
+        self.decrease = decrease
+        self.max_error_rate = max_error_rate
+        self.latency_tolerance = latency_tolerance
+        self.latency_slack = latency_slack_ms / 1000
+        self.min_window = min_window
+        self.min_window_sec = min_window_sec
+        self.overdue_factor = overdue_factor
+        self.verbose = verbose
+        self.in_flight = 0
+        self.active: dict[int, float] = {}
+        self._tokens = itertools.count()
+        self.slow_start = True
+        self.saturated = False
+        self.background_error_rate: float | None = None
+        self.recent_latency: deque[float] = deque(maxlen=10)
+        self.window_latency: list[float] = []
+        self.window_errors = 0
+        self.changed_at = time.monotonic()
+        self.started_at = self.changed_at
+        self.history: list[dict] = [self._point("start", 0.0, 0.0)]
+        self._waiters: deque[asyncio.Future[None]] = deque()
+
+    @classmethod
+    def from_args(cls, concurrency: int, max_concurrency: int, adaptive: bool) -> AdaptiveLimiter | None:
+        if not adaptive:
+            return None
+        return cls(concurrency, max(concurrency, max_concurrency))
+
+    async def acquire(self) -> None:
+        if self.in_flight < self.limit and not self._waiters:
+            self._take()
+            return
+        future = asyncio.get_running_loop().create_future()
+        self._waiters.append(future)
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                self._release()
+            raise
+
+    def _take(self) -> None:
+        self.in_flight += 1
+        if self.in_flight >= self.limit:
+            self.saturated = True
+
+    def _release(self) -> None:
+        self.in_flight -= 1
+        self._wake()
+
+    def _wake(self) -> None:
+        while self._waiters and self.in_flight < self.limit:
+            future = self._waiters.popleft()
+            if not future.done():
+                self._take()
+                future.set_result(None)
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        await self.acquire()
+        started = time.monotonic()
+        token = next(self._tokens)
+        self.active[token] = started
+        congested = False
+        try:
+            yield
+        except CONGESTION_ERRORS:
+            congested = True
+            raise
+        except asyncio.CancelledError:
+            started = -1.0
+            raise
+        finally:
+            self.active.pop(token, None)
+            self._release()
+            if started >= 0:
+                self.observe(started, time.monotonic() - started, congested)
+
+    def observe(self, started: float, latency: float, congested: bool) -> None:
+        if started < self.changed_at:
+            return
+        self.window_latency.append(latency)
+        self.window_errors += congested
+        if (
+            len(self.window_latency) >= max(self.min_window, self.limit)
+            and time.monotonic() - self.changed_at >= self.min_window_sec
+        ):
+            self._adjust()
+
+    def _adjust(self) -> None:
+        ordered = sorted(self.window_latency)
+        latency = ordered[len(ordered) // 2]
+        overdue_after = max(self.min_window_sec, self.overdue_factor * ordered[int(len(ordered) * 0.9)])
+        now = time.monotonic()
+        overdue = sum(1 for started in self.active.values() if started >= self.changed_at and now - started > overdue_after)
+        error_rate = (self.window_errors + overdue) / (len(self.window_latency) + overdue)
+        baseline = min(self.recent_latency) if self.recent_latency else latency
+        background = self.background_error_rate
+        # Dead sites time out at a steady rate; only errors well above that rate count as congestion.
+        error_limit = max(self.max_error_rate, 2 * background) if background is not None else self.max_error_rate
+        latency_limit = self.latency_tolerance * baseline + self.latency_slack
+        if error_rate > error_limit or latency > latency_limit:
+            self.slow_start = False
+            reason = "errors" if error_rate > error_limit else "latency"
+            self._set_limit(max(self.floor, int(self.limit * self.decrease)), reason, error_rate, latency)
+            return
+
+        self.recent_latency.append(latency)
+        self.background_error_rate = error_rate if background is None else 0.8 * background + 0.2 * error_rate
+        if self.saturated and self.limit < self.ceiling:
+            grown = self.limit * 2 if self.slow_start else self.limit + self.increase
+            self._set_limit(min(self.ceiling, grown), "grow", error_rate, latency)
+        else:
+            self._reset_window()
+
+    def _set_limit(self, limit: int, reason: str, error_rate: float, latency: float) -> None:
+        previous = self.limit
+        self.limit = limit
+        self.changed_at = time.monotonic()
+        self._reset_window()
+        self.history.append(self._point(reason, error_rate, latency))
+        if self.verbose and limit < previous:
+            print(
+                f"concurrency={limit} (was {previous}) reason={reason} "
+                f"error_rate={error_rate:.2f} p50_ms={latency * 1000:.0f}"
+            )
+        self._wake()
+
+    def _reset_window(self) -> None:
+        self.window_latency = []
+        self.window_errors = 0
+        self.saturated = self.in_flight >= self.limit
+
+    def _point(self, reason: str, error_rate: float, latency: float) -> dict:
+        return {
+            "t_sec": round(time.monotonic() - self.started_at, 2),
+            "limit": self.limit,
+            "reason": reason,
+            "error_rate": round(error_rate, 3),
+            "p50_ms": round(latency * 1000, 1),
+        }
+
+    def to_dict(self) -> dict:
+        limits = [point["limit"] for point in self.history]
+        return {
+            "final": self.limit,
+            "max": max(limits),
+            "min": min(limits),
+            "ceiling": self.ceiling,
+            "floor": self.floor,
+            "history": self.history,
+        }
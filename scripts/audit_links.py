@@ -5,14 +5,27 @@ from __future__ import annotations
 
 import argparse
 import asyncio
+import csv
 import json
 import time
-from dataclasses import asdict, dataclass
+from collections import Counter
+from dataclasses import asdict, dataclass, fields
+from itertools import islice
 from pathlib import Path
+from typing import Iterable, Iterator
 
 import aiohttp
 import pandas as pd
 
+from adaptive_concurrency import AdaptiveLimiter
+from audit_placeholder_pages import detect_signatures
+from crawl_metrics import CrawlMetrics
+from dns_stage import DnsCache, DnsEntry, PreResolvedResolver, SystemResolver, resolve_hosts
+from host_scheduler import HostScheduler
+from probe import probe_url
+from sheet_loader import DEFAULT_CACHE_DIR, SHEET_COLUMNS, load_table
+from url_cache import CachedCheck, UrlHealthCache
+
 
 @dataclass
 class AuditResult:
@@ -22,80 +35,306 @@ class AuditResult:
     final_url: str
     ok: int
     error: str
+    etag: str = ""
+    last_modified: str = ""
+    redirects: int = 0
+    elapsed_ms: float = 0.0
+    signature_hits: str = ""
 
 
-RETRY_STATUSES = {400, 401, 403, 405, 406, 409, 418, 421, 429, 500, 501, 502, 503, 504, 520, 521, 525, 526, 530}
+RESULT_FIELDS = [field.name for field in fields(AuditResult)]
+PLACEHOLDER_BODY_BYTES = 65536
 
 
 async def check_url(
     session: aiohttp.ClientSession,
-    sem: asyncio.Semaphore,
+    scheduler: HostScheduler,
     url: str,
-    idx: int,
-    total: int,
-    started_at: float,
-    progress_every: int,
+    cached: CachedCheck | None = None,
+    detect_placeholders: bool = False,
+    metrics: CrawlMetrics | None = None,
 ) -> AuditResult:
-    async with sem:
-        status = -1
-        final_url = url
-        method = "HEAD"
-        error = ""
-        try:
-            async with session.head(url, allow_redirects=True) as response:
-                status = response.status
-                final_url = str(response.url)
-            if status in RETRY_STATUSES:
-                method = "GET"
-                async with session.get(url, allow_redirects=True, headers={"Range": "bytes=0-1024"}) as response:
-                    status = response.status
-                    final_url = str(response.url)
-        except Exception:
-            method = "GET"
-            try:
-                async with session.get(url, allow_redirects=True, headers={"Range": "bytes=0-1024"}) as response:
-                    status = response.status
-                    final_url = str(response.url)
-            except Exception as inner:
-                error = str(inner).replace("\n", " ")[:220]
-
-        if idx % progress_every == 0 or idx == total:
-            elapsed = time.time() - started_at
-            print(f"progress={idx}/{total} elapsed_sec={elapsed:.1f}")
-
-        return AuditResult(
-            url=url,
-            status=status,
-            method=method,
-            final_url=final_url,
-            ok=1 if 200 <= status < 400 else 0,
-            error=error,
-        )
+    conditional = cached.conditional_headers() if cached is not None and 200 <= cached.status < 400 else {}
+    probe = await probe_url(
+        session,
+        scheduler,
+        url,
+        body_bytes=PLACEHOLDER_BODY_BYTES if detect_placeholders else 0,
+        conditional=conditional,
+        metrics=metrics,
+    )
+    method = probe.method
+    status = probe.status
+    final_url = probe.final_url
+    etag = probe.etag
+    last_modified = probe.last_modified
+    if status == 304 and cached is not None:
+        method = "REVALIDATED"
+        status = cached.status
+        final_url = cached.final_url
+        etag = etag or cached.etag
+        last_modified = last_modified or cached.last_modified
+
+    hits = detect_signatures(probe.body, final_url) if detect_placeholders and 200 <= status < 400 else []
+    return AuditResult(
+        url=url,
+        status=status,
+        method=method,
+        final_url=final_url,
+        ok=1 if 200 <= status < 400 and not hits else 0,
+        error=probe.error,
+        etag=etag,
+        last_modified=last_modified,
+        redirects=len(probe.redirect_chain),
+        elapsed_ms=round(probe.elapsed_ms, 1),
+        signature_hits="|".join(hits),
+    )
+
+
+def result_from_cache(cached: CachedCheck) -> AuditResult:
+    return AuditResult(
+        url=cached.url,
+        status=cached.status,
+        method="CACHE",
+        final_url=cached.final_url,
+        ok=1 if 200 <= cached.status < 400 else 0,
+        error="",
+        etag=cached.etag,
+        last_modified=cached.last_modified,
+    )
+
+
+class ResultStream:
+    """Append-only CSV of audit results that is flushed while the crawl runs."""
+
+    def __init__(self, path: Path, resume: bool, cache: UrlHealthCache | None, flush_every: int = 200) -> None:
+        self.path = path
+        self.cache = cache
+        self.flush_every = flush_every
+        self.done = load_done_urls(path) if resume else set()
+        if resume and path.exists() and path.stat().st_size:
+            with path.open("rb") as handle:
+                handle.seek(-1, 2)
+                needs_newline = handle.read(1) != b"\n"
+            self.handle = path.open("a", newline="", encoding="utf-8")
+            if needs_newline:
+                self.handle.write("\n")
+        else:
+            self.handle = path.open("w", newline="", encoding="utf-8")
+        self.writer = csv.DictWriter(self.handle, fieldnames=RESULT_FIELDS)
+        if self.handle.tell() == 0:
+            self.writer.writeheader()
+        self.pending: list[CachedCheck] = []
+        self.written = 0
+        self.methods: Counter[str] = Counter()
+
+    def write(self, result: AuditResult) -> None:
+        self.writer.writerow(asdict(result))
+        self.written += 1
+        self.methods[result.method] += 1
+        if self.cache is not None and result.method not in ("CACHE", "CARRIED"):
+            self.pending.append(
+                CachedCheck(result.url, result.status, result.final_url, result.etag, result.last_modified, time.time())
+            )
+        if self.written % self.flush_every == 0:
+            self.flush()
+
+    def flush(self) -> None:
+        self.handle.flush()
+        if self.cache is not None and self.pending:
+            self.cache.put_many(self.pending)
+            self.pending = []
+
+    def close(self) -> None:
+        self.flush()
+        self.handle.close()
+
+
+def result_from_dns(url: str, entry: DnsEntry) -> AuditResult:
+    return AuditResult(url=url, status=-1, method="DNS", final_url=url, ok=0, error=f"dns_{entry.outcome}")
+
+
+def row_hashes(frame: pd.DataFrame, columns: list[str]) -> pd.Series:
+    return pd.util.hash_pandas_object(frame[columns].astype(str), index=False)
+
+
+def carried_over_results(df: pd.DataFrame, previous_path: Path) -> list[AuditResult]:
+    """Reuse previous results for URLs whose source rows are all unchanged since the last audit."""
+    previous = pd.read_csv(previous_path)
+    previous = previous[previous["ok"].isin([0, 1])]
+    columns = [column for column in df.columns if column in previous.columns]
+    changed_urls = set(df.loc[~row_hashes(df, columns).isin(set(row_hashes(previous, columns))), "Website Link"])
+    previous = previous.drop_duplicates(subset=["url"], keep="last")
+    previous = previous[previous["url"].isin(set(df["Website Link"])) & ~previous["url"].isin(changed_urls)]
+
+    defaults = AuditResult(url="", status=-1, method="", final_url="", ok=0, error="")
+    carried = []
+    for record in previous.to_dict("records"):
+        values = {}
+        for name in RESULT_FIELDS:
+            value = record.get(name)
+            values[name] = getattr(defaults, name) if pd.isna(value) else type(getattr(defaults, name))(value)
+        values["method"] = "CARRIED"
+        carried.append(AuditResult(**values))
+    return carried
+
+
+def load_done_urls(path: Path) -> set[str]:
+    if not path.exists():
+        return set()
+    with path.open(newline="", encoding="utf-8") as handle:
+        return {row["url"] for row in csv.DictReader(handle) if row.get("url") and row.get("ok") in ("0", "1")}
+
 
+def batched(items: Iterable[str], size: int) -> Iterator[list[str]]:
+    iterator = iter(items)
+    while batch := list(islice(iterator, size)):
+        yield batch
 
-async def run_audit(urls: list[str], concurrency: int, progress_every: int) -> list[AuditResult]:
+
+async def run_audit(
+    urls: Iterable[str],
+    total: int,
+    concurrency: int,
+    progress_every: int,
+    stream: ResultStream,
+    cache: UrlHealthCache | None = None,
+    cache_ttl_sec: float = 0.0,
+    per_host: int = 4,
+    per_domain: int = 8,
+    detect_placeholders: bool = False,
+    dns_entries: dict[str, DnsEntry] | None = None,
+    trace_configs: list[aiohttp.TraceConfig] | None = None,
+    metrics: CrawlMetrics | None = None,
+    limiter: AdaptiveLimiter | None = None,
+) -> None:
     started_at = time.time()
+    trace_configs = list(trace_configs or [])
+    if metrics is not None:
+        trace_configs.append(metrics.trace_config())
+    dns_entries = dns_entries or {}
+    scheduler = HostScheduler(concurrency, per_host=per_host, per_domain=per_domain, limiter=limiter)
     timeout = aiohttp.ClientTimeout(total=20, connect=8, sock_connect=8, sock_read=12)
-    connector = aiohttp.TCPConnector(limit=max(concurrency + 20, 40), ttl_dns_cache=300)
+    connector = aiohttp.TCPConnector(
+        limit=max(scheduler.capacity + 20, 40),
+        ttl_dns_cache=300,
+        resolver=PreResolvedResolver(dns_entries) if dns_entries else None,
+    )
     headers = {
         "User-Agent": "Mozilla/5.0 (compatible; AIToolsDirectoryAudit/1.0)",
         "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
     }
-    sem = asyncio.Semaphore(concurrency)
-    async with aiohttp.ClientSession(timeout=timeout, connector=connector, headers=headers) as session:
-        tasks = [
-            check_url(session, sem, url, idx + 1, len(urls), started_at, progress_every)
-            for idx, url in enumerate(urls)
-        ]
-        return await asyncio.gather(*tasks)
+    # Extra workers let URLs on other hosts proceed while some wait on host slots or backoff.
+    worker_count = scheduler.capacity * 2
+    queue: asyncio.Queue[tuple[str, CachedCheck | None] | None] = asyncio.Queue(maxsize=worker_count * 2)
+    completed = 0
+
+    def emit(result: AuditResult) -> None:
+        nonlocal completed
+        stream.write(result)
+        completed += 1
+        if completed % progress_every == 0 or completed == total:
+            elapsed = time.time() - started_at
+            print(f"progress={completed}/{total} elapsed_sec={elapsed:.1f} concurrency={scheduler.level}")
+
+    async def produce() -> None:
+        for batch in batched(urls, 500):
+            cached = cache.get_many(batch) if cache else {}
+            for url in batch:
+                entry = cached.get(url)
+                if entry is not None and entry.is_fresh(cache_ttl_sec):
+                    emit(result_from_cache(entry))
+                    continue
+                dns_entry = dns_entries.get(HostScheduler.host_of(url))
+                if dns_entry is not None and dns_entry.dead:
+                    emit(result_from_dns(url, dns_entry))
+                    continue
+                await queue.put((url, entry))
+        for _ in range(worker_count):
+            await queue.put(None)
+
+    async with aiohttp.ClientSession(
+        timeout=timeout, connector=connector, headers=headers, trace_configs=trace_configs
+    ) as session:
+
+        async def work() -> None:
+            while (item := await queue.get()) is not None:
+                url, entry = item
+                emit(await check_url(session, scheduler, url, entry, detect_placeholders, metrics))
+
+        await asyncio.gather(produce(), *(work() for _ in range(worker_count)))
 
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description=__doc__)
     parser.add_argument("--xlsx", required=True, type=Path, help="Path to source xlsx file")
     parser.add_argument("--out-dir", default=Path("audit"), type=Path, help="Directory for audit files")
-    parser.add_argument("--concurrency", default=80, type=int, help="Concurrent URL checks")
+    parser.add_argument(
+        "--concurrency", default=80, type=int, help="Concurrent URL checks (starting level when adaptive)"
+    )
+    parser.add_argument("--max-concurrency", default=400, type=int, help="Ceiling for the adaptive limit")
+    parser.add_argument(
+        "--adaptive",
+        action=argparse.BooleanOptionalAction,
+        default=True,
+        help="Tune the in-flight limit from timeout/error rate and latency (AIMD)",
+    )
+    parser.add_argument("--per-host", default=4, type=int, help="Concurrent checks per host")
+    parser.add_argument("--per-domain", default=8, type=int, help="Concurrent checks per registrable domain")
     parser.add_argument("--progress-every", default=500, type=int, help="Progress log interval")
+    parser.add_argument(
+        "--cache-db",
+        default=Path("audit/url_cache.sqlite"),
+        type=Path,
+        help="SQLite URL health cache reused across runs",
+    )
+    parser.add_argument(
+        "--cache-ttl-hours",
+        default=24.0,
+        type=float,
+        help="Skip URLs checked within this window; older entries are revalidated conditionally",
+    )
+    parser.add_argument("--no-cache", action="store_true", help="Ignore and do not update the URL health cache")
+    parser.add_argument(
+        "--table-cache-dir",
+        default=DEFAULT_CACHE_DIR,
+        type=Path,
+        help="Directory for columnar snapshots of the parsed xlsx, keyed by file content",
+    )
+    parser.add_argument("--no-table-cache", action="store_true", help="Always parse the xlsx instead of using a snapshot")
+    parser.add_argument(
+        "--detect-placeholders",
+        action="store_true",
+        help="Fetch a bounded body prefix in the same request and flag parked/default pages (bypasses cache reuse)",
+    )
+    parser.add_argument(
+        "--dns-cache-db",
+        default=Path("audit/dns_cache.sqlite"),
+        type=Path,
+        help="SQLite cache of host resolutions reused across runs",
+    )
+    parser.add_argument("--dns-ttl-hours", default=12.0, type=float, help="Reuse cached DNS outcomes within this window")
+    parser.add_argument("--dns-concurrency", default=200, type=int, help="Concurrent DNS lookups in the pre-resolution stage")
+    parser.add_argument(
+        "--no-dns-stage",
+        action="store_true",
+        help="Skip bulk DNS pre-resolution and let each probe resolve its own host",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Carry over results for URLs whose rows are unchanged in the previous tools_with_audit.csv",
+    )
+    parser.add_argument(
+        "--previous-audit",
+        type=Path,
+        help="Previous tools_with_audit.csv for --incremental (defaults to the one in --out-dir)",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Keep results already streamed to url_audit_stream.csv and only check the remaining URLs",
+    )
     return parser.parse_args()
 
 
@@ -104,15 +343,71 @@ def main() -> None:
     out_dir = args.out_dir
     out_dir.mkdir(parents=True, exist_ok=True)
 
-    df = pd.read_excel(args.xlsx)
+    df = load_table(args.xlsx, SHEET_COLUMNS, cache_dir=None if args.no_table_cache else args.table_cache_dir)
     df["Website Link"] = df["Website Link"].astype(str).str.strip()
     urls = df["Website Link"].dropna().unique().tolist()
 
     print(f"rows={len(df)} unique_urls={len(urls)} concurrency={args.concurrency}")
     started_at = time.time()
-    results = asyncio.run(run_audit(urls, args.concurrency, args.progress_every))
 
-    result_df = pd.DataFrame([asdict(row) for row in results]).sort_values("url")
+    metrics = CrawlMetrics("audit_links")
+    metrics.limiter = AdaptiveLimiter.from_args(args.concurrency, args.max_concurrency, args.adaptive)
+    cache = None if args.no_cache else UrlHealthCache(args.cache_db)
+    stream_path = out_dir / "url_audit_stream.csv"
+    stream = ResultStream(stream_path, args.resume, cache)
+    pending = [url for url in urls if url not in stream.done]
+    resumed = len(urls) - len(pending)
+    print(f"resumed={resumed} pending={len(pending)}")
+
+    previous_path = args.previous_audit or out_dir / "tools_with_audit.csv"
+    if args.incremental and previous_path.exists():
+        pending_set = set(pending)
+        carried = [row for row in carried_over_results(df, previous_path) if row.url in pending_set]
+        for row in carried:
+            stream.write(row)
+        carried_urls = {row.url for row in carried}
+        pending = [url for url in pending if url not in carried_urls]
+        print(f"incremental_carried={len(carried)} incremental_pending={len(pending)}")
+    elif args.incremental:
+        print(f"incremental: no previous audit at {previous_path}, checking every URL")
+
+    dns_entries: dict[str, DnsEntry] = {}
+    if not args.no_dns_stage:
+        dns_cache = DnsCache(args.dns_cache_db)
+        hosts = {HostScheduler.host_of(url) for url in pending}
+        dns_entries = asyncio.run(
+            resolve_hosts(hosts, SystemResolver(), args.dns_concurrency, dns_cache, args.dns_ttl_hours * 3600)
+        )
+        dns_cache.close()
+        dead_hosts = sum(1 for entry in dns_entries.values() if entry.dead)
+        print(f"dns_hosts={len(dns_entries)} dns_dead={dead_hosts} elapsed_sec={time.time() - started_at:.1f}")
+    try:
+        asyncio.run(
+            run_audit(
+                pending,
+                len(pending),
+                args.concurrency,
+                args.progress_every,
+                stream,
+                cache,
+                0.0 if args.detect_placeholders else args.cache_ttl_hours * 3600,
+                args.per_host,
+                args.per_domain,
+                args.detect_placeholders,
+                dns_entries,
+                metrics=metrics,
+                limiter=metrics.limiter,
+            )
+        )
+    finally:
+        stream.close()
+        if cache:
+            cache.close()
+
+    result_df = pd.read_csv(stream_path, on_bad_lines="skip")
+    result_df = result_df[result_df["url"].isin(set(urls)) & result_df["ok"].isin([0, 1])]
+    result_df = result_df.astype({"status": int, "ok": int})
+    result_df = result_df.drop_duplicates(subset=["url"], keep="last").sort_values("url")
     result_df.to_csv(out_dir / "url_audit.csv", index=False)
 
     merged = df.merge(result_df, left_on="Website Link", right_on="url", how="left")
@@ -121,17 +416,29 @@ def main() -> None:
         out_dir / "invalid_rows.csv", index=False
     )
 
+    reused = resumed + stream.methods["CARRIED"] + stream.methods["CACHE"]
     summary = {
         "rows": int(len(df)),
         "unique_urls": int(len(urls)),
         "ok_urls": int(result_df["ok"].sum()),
         "bad_urls": int((1 - result_df["ok"]).sum()),
+        "resumed_urls": int(resumed),
+        "carried_over_urls": int(stream.methods["CARRIED"]),
+        "reused_pct": round(100 * reused / len(urls), 1) if urls else 0.0,
+        "cached_urls": int(stream.methods["CACHE"]),
+        "revalidated_urls": int(stream.methods["REVALIDATED"]),
+        "dns_dead_urls": int(stream.methods["DNS"]),
+        "placeholder_urls": int((result_df["signature_hits"].fillna("").astype(str) != "").sum()),
+        "probed_urls": int(
+            stream.written - stream.methods["CACHE"] - stream.methods["DNS"] - stream.methods["CARRIED"]
+        ),
         "ok_rows": int(merged["ok"].fillna(0).sum()),
         "bad_rows": int(len(merged) - merged["ok"].fillna(0).sum()),
         "elapsed_sec": round(time.time() - started_at, 2),
     }
     with (out_dir / "audit_summary.json").open("w", encoding="utf-8") as handle:
         json.dump(summary, handle, indent=2)
+    metrics.write(out_dir)
     print(json.dumps(summary, indent=2))
 
 
@@ -13,6 +13,12 @@ from urllib.parse import urlparse
 import aiohttp
 import pandas as pd
 
+from adaptive_concurrency import AdaptiveLimiter
+from crawl_metrics import CrawlMetrics
+from dns_stage import DnsEntry, PreResolvedResolver
+from host_scheduler import HostScheduler
+from probe import probe_url
+
 STRONG_PHRASES = {
     "nginx_default_1": "welcome to nginx",
     "nginx_default_2": "if you see this page, the nginx web server is successfully installed",
@@ -35,6 +41,8 @@ STRONG_HOSTS = {
     "parking-page.net",
 }
 
+PROBE_BODY_BYTES = 65536
+
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description=__doc__)
@@ -46,7 +54,16 @@ def parse_args() -> argparse.Namespace:
     )
     parser.add_argument("--out-all", default=Path("audit/live_link_audit.csv"), type=Path)
     parser.add_argument("--out-flagged", default=Path("audit/live_flagged_placeholder.csv"), type=Path)
-    parser.add_argument("--concurrency", default=80, type=int)
+    parser.add_argument("--concurrency", default=80, type=int, help="Concurrent fetches (starting level when adaptive)")
+    parser.add_argument("--max-concurrency", default=400, type=int, help="Ceiling for the adaptive limit")
+    parser.add_argument(
+        "--adaptive",
+        action=argparse.BooleanOptionalAction,
+        default=True,
+        help="Tune the in-flight limit from timeout/error rate and latency (AIMD)",
+    )
+    parser.add_argument("--per-host", default=4, type=int, help="Concurrent fetches per host")
+    parser.add_argument("--per-domain", default=8, type=int, help="Concurrent fetches per registrable domain")
     parser.add_argument("--progress-every", default=250, type=int)
     return parser.parse_args()
 
@@ -75,61 +92,79 @@ def detect_signatures(html: str, final_url: str) -> list[str]:
 
 async def fetch_one(
     session: aiohttp.ClientSession,
-    sem: asyncio.Semaphore,
+    scheduler: HostScheduler,
     row: dict[str, str],
     idx: int,
     total: int,
     started_at: float,
     progress_every: int,
+    metrics: CrawlMetrics | None = None,
 ) -> dict[str, str | int]:
-    async with sem:
-        url = normalize_url(row.get("website_url", ""))
-        result: dict[str, str | int] = {
-            "slug": row.get("slug", ""),
-            "name": row.get("name", ""),
-            "domain": row.get("domain", ""),
-            "website_url": url,
-            "quality_status": row.get("quality_status", ""),
-            "status": -1,
-            "final_url": "",
-            "signature_hits": "",
-            "error": "",
-            "ok": 0,
-        }
-        if not url:
-            result["error"] = "empty_url"
-            return result
-
-        try:
-            async with session.get(url, allow_redirects=True, headers={"Range": "bytes=0-65535"}) as response:
-                result["status"] = response.status
-                result["final_url"] = str(response.url)
-                body = (await response.text(errors="ignore"))[:80_000]
-                hits = detect_signatures(body, str(response.url))
-                result["signature_hits"] = "|".join(hits)
-                result["ok"] = 1 if (200 <= response.status < 400 and not hits) else 0
-        except Exception as exc:  # noqa: BLE001
-            result["error"] = str(exc).replace("\n", " ")[:220]
-
-        if idx % progress_every == 0 or idx == total:
-            elapsed = time.time() - started_at
-            print(f"progress={idx}/{total} elapsed_sec={elapsed:.1f}")
+    url = normalize_url(row.get("website_url", ""))
+    result: dict[str, str | int] = {
+        "slug": row.get("slug", ""),
+        "name": row.get("name", ""),
+        "domain": row.get("domain", ""),
+        "website_url": url,
+        "quality_status": row.get("quality_status", ""),
+        "status": -1,
+        "final_url": "",
+        "signature_hits": "",
+        "error": "",
+        "ok": 0,
+    }
+    if not url:
+        result["error"] = "empty_url"
         return result
 
+    probe = await probe_url(session, scheduler, url, body_bytes=PROBE_BODY_BYTES, metrics=metrics)
+    result["status"] = probe.status
+    result["error"] = probe.error
+    if probe.status != -1:
+        result["final_url"] = probe.final_url
+        hits = detect_signatures(probe.body, probe.final_url)
+        result["signature_hits"] = "|".join(hits)
+        result["ok"] = 1 if (probe.ok and not hits) else 0
 
-async def run(rows: list[dict[str, str]], concurrency: int, progress_every: int) -> list[dict[str, str | int]]:
+    if idx % progress_every == 0 or idx == total:
+        elapsed = time.time() - started_at
+        print(f"progress={idx}/{total} elapsed_sec={elapsed:.1f} concurrency={scheduler.level}")
+    return result
+
+
+async def run(
+    rows: list[dict[str, str]],
+    concurrency: int,
+    progress_every: int,
+    per_host: int = 4,
+    per_domain: int = 8,
+    dns_entries: dict[str, DnsEntry] | None = None,
+    trace_configs: list[aiohttp.TraceConfig] | None = None,
+    metrics: CrawlMetrics | None = None,
+    limiter: AdaptiveLimiter | None = None,
+) -> list[dict[str, str | int]]:
+    trace_configs = list(trace_configs or [])
+    if metrics is not None:
+        trace_configs.append(metrics.trace_config())
     timeout = aiohttp.ClientTimeout(total=22, connect=8, sock_connect=8, sock_read=14)
     headers = {
         "User-Agent": "Mozilla/5.0 (compatible; FindAIDirPlaceholderAudit/1.0)",
         "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
     }
-    connector = aiohttp.TCPConnector(limit=max(concurrency + 20, 40), ttl_dns_cache=300)
-    sem = asyncio.Semaphore(concurrency)
+    scheduler = HostScheduler(concurrency, per_host=per_host, per_domain=per_domain, limiter=limiter)
+    connector = aiohttp.TCPConnector(
+        limit=max(scheduler.capacity + 20, 40),
+        ttl_dns_cache=300,
+        resolver=PreResolvedResolver(dns_entries) if dns_entries else None,
+    )
     started = time.time()
 
-    async with aiohttp.ClientSession(timeout=timeout, connector=connector, headers=headers) as session:
+    async with aiohttp.ClientSession(
+        timeout=timeout, connector=connector, headers=headers, trace_configs=trace_configs
+    ) as session:
         tasks = [
-            fetch_one(session, sem, row, idx + 1, len(rows), started, progress_every) for idx, row in enumerate(rows)
+            fetch_one(session, scheduler, row, idx + 1, len(rows), started, progress_every, metrics)
+            for idx, row in enumerate(rows)
         ]
         return await asyncio.gather(*tasks)
 
@@ -140,13 +175,26 @@ def main() -> None:
     rows = payload[0]["results"]
     print(f"rows={len(rows)} concurrency={args.concurrency}")
 
-    audit_rows = asyncio.run(run(rows, args.concurrency, args.progress_every))
+    metrics = CrawlMetrics("audit_placeholder_pages")
+    metrics.limiter = AdaptiveLimiter.from_args(args.concurrency, args.max_concurrency, args.adaptive)
+    audit_rows = asyncio.run(
+        run(
+            rows,
+            args.concurrency,
+            args.progress_every,
+            args.per_host,
+            args.per_domain,
+            metrics=metrics,
+            limiter=metrics.limiter,
+        )
+    )
     all_df = pd.DataFrame(audit_rows)
     flagged_df = all_df[all_df["signature_hits"].astype(str) != ""].copy()
 
     args.out_all.parent.mkdir(parents=True, exist_ok=True)
     all_df.to_csv(args.out_all, index=False)
     flagged_df.to_csv(args.out_flagged, index=False)
+    metrics.write(args.out_all.parent, "placeholder_crawl_metrics")
 
     print(f"flagged={len(flagged_df)}")
     if len(flagged_df):
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""Check build_dataset's column transforms against the per-row functions and time both."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Callable
+from urllib.parse import urlparse
+
+import pandas as pd
+
+from build_dataset import (
+    canonical_homepage,
+    canonical_homepage_series,
+    name_domain_match_score,
+    name_domain_match_scores,
+    netloc_series,
+    root_domain,
+    root_domain_series,
+    slugify,
+    slugify_series,
+)
+from sheet_loader import load_table
+
+# Inputs the real sheet rarely has, chosen to exercise the scalar fallback and regex edges.
+EDGE_NAMES = ["", "  ", "AI", "The AI Tool", "Ünïcödé Tööl", "a--b__c", "x" * 200, "İstanbul GPT", "123 456 789", "nan"]
+EDGE_URLS = [
+    "",
+    "  https://Example.COM/path?q=1  ",
+    "HTTP://WWW.Example.co.uk",
+    "https://user:pw@host.io:8443/x#frag",
+    "ftp://files.example.com/",
+    "example.com",
+    "https://",
+    "https:///nohost",
+    "https://bücher.de/",
+    "https://[::1]:8080/",
+    "https://host.io/a b",
+    "https://host.io\\path",
+    "http://a..b.com/",
+    "https://www.example.com.au?x=1",
+    "mailto:someone@example.com",
+    "nan",
+    "https://sub.deep.example.org.uk/",
+    "https://www./",
+]
+
+
+def source_frame(xlsx: Path, rows: int) -> pd.DataFrame:
+    base = load_table(xlsx, ["Tool Name", "Category", "Website Link"]).astype(str)
+    base = pd.concat(
+        [base, pd.DataFrame({"Tool Name": EDGE_NAMES * 2, "Category": EDGE_NAMES * 2, "Website Link": EDGE_URLS + EDGE_URLS[:2]})],
+        ignore_index=True,
+    )
+    if rows <= len(base):
+        return base.head(rows).reset_index(drop=True)
+    # Grow the catalogue with renamed copies so slugs and domains stay realistic but distinct.
+    copies = -(-rows // len(base))
+    frames = []
+    for copy in range(copies):
+        frame = base.copy()
+        if copy:
+            frame["Tool Name"] = frame["Tool Name"] + f" v{copy}"
+            frame["Website Link"] = frame["Website Link"].str.replace("://", f"://c{copy}.", n=1, regex=False)
+        frames.append(frame)
+    return pd.concat(frames, ignore_index=True).head(rows)
+
+
+def timed(fn: Callable[[], object]) -> tuple[object, float]:
+    started = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - started
+
+
+def compare(frame: pd.DataFrame) -> dict[str, dict]:
+    names, links, categories = frame["Tool Name"], frame["Website Link"], frame["Category"]
+    # The scalar side is the per-row .apply code that build_dataset used before.
+    homepage_series = links.apply(canonical_homepage)
+    domain_series = homepage_series.apply(lambda url: urlparse(url).netloc.lower())
+    pairs = pd.DataFrame({"tool_name": names, "domain": domain_series})
+
+    checks = {
+        "slugify": (lambda: names.apply(slugify).tolist(), lambda: slugify_series(names).tolist()),
+        "slugify_category": (lambda: categories.apply(slugify).tolist(), lambda: slugify_series(categories).tolist()),
+        "canonical_homepage": (
+            lambda: links.apply(canonical_homepage).tolist(),
+            lambda: canonical_homepage_series(links).tolist(),
+        ),
+        "netloc": (
+            lambda: homepage_series.apply(lambda url: urlparse(url).netloc.lower()).tolist(),
+            lambda: netloc_series(homepage_series).tolist(),
+        ),
+        "root_domain": (lambda: domain_series.apply(root_domain).tolist(), lambda: root_domain_series(domain_series).tolist()),
+        "name_domain_match_score": (
+            lambda: pairs.apply(lambda row: name_domain_match_score(row["tool_name"], row["domain"]), axis=1).tolist(),
+            lambda: list(zip(*(column.tolist() for column in name_domain_match_scores(names, domain_series)))),
+        ),
+    }
+    report = {}
+    for name, (scalar, vector) in checks.items():
+        expected, scalar_sec = timed(scalar)
+        actual, vector_sec = timed(vector)
+        mismatches = [idx for idx, (left, right) in enumerate(zip(expected, actual)) if left != right]
+        if len(expected) != len(actual):
+            mismatches.append(-1)
+        report[name] = {
+            "scalar_sec": round(scalar_sec, 4),
+            "vector_sec": round(vector_sec, 4),
+            "speedup": round(scalar_sec / vector_sec, 1) if vector_sec else None,
+            "mismatches": len(mismatches),
+            "samples": [{"row": idx, "scalar": expected[idx], "vector": actual[idx]} for idx in mismatches[:5] if idx >= 0],
+        }
+    return report
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--xlsx", default=Path("All_ai_tools.xlsx"), type=Path, help="Source of realistic names and links")
+    parser.add_argument("--rows", default="6000,50000,500000", help="Comma-separated catalogue sizes")
+    parser.add_argument("--json-out", type=Path, help="Optional path for the JSON report")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    reports = []
+    for rows in (int(value) for value in args.rows.split(",")):
+        frame = source_frame(args.xlsx, rows)
+        checks = compare(frame)
+        reports.append(
+            {
+                "rows": len(frame),
+                "scalar_total_sec": round(sum(check["scalar_sec"] for check in checks.values()), 3),
+                "vector_total_sec": round(sum(check["vector_sec"] for check in checks.values()), 3),
+                "checks": checks,
+            }
+        )
+        print(
+            f"rows={len(frame):<8} scalar_sec={reports[-1]['scalar_total_sec']:<8} "
+            f"vector_sec={reports[-1]['vector_total_sec']:<8} "
+            f"mismatches={sum(check['mismatches'] for check in checks.values())}"
+        )
+
+    print(json.dumps(reports, indent=2, default=str))
+    if args.json_out:
+        args.json_out.parent.mkdir(parents=True, exist_ok=True)
+        args.json_out.write_text(json.dumps(reports, indent=2, default=str), encoding="utf-8")
+        print(f"saved={args.json_out}")
+    if any(check["mismatches"] for report in reports for check in report["checks"].values()):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,311 @@
+#!/usr/bin/env python3
+"""Benchmark the crawl scripts against a local stand-in HTTP farm on loopback."""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import csv
+import io
+import json
+import random
+import resource
+import socket
+import sys
+import tempfile
+import time
+from collections import defaultdict, deque
+from pathlib import Path
+
+import aiohttp
+from aiohttp import web
+
+from dns_stage import DnsEntry
+
+BEHAVIOURS = ("ok", "slow", "redirect", "head405", "ratelimit", "parked", "norange", "hang")
+DEFAULT_MIX = "ok=55,slow=10,redirect=8,head405=8,ratelimit=8,parked=5,norange=5,hang=1"
+SCRIPTS = ("audit", "enrich", "placeholder")
+FARM_TLD = "invalid"
+
+
+class Farm:
+    """Virtual hosts spread over several loopback ports, each path selecting a behaviour."""
+
+    def __init__(
+        self, ports: int, slow_ms: int, hang_sec: float, rate_limit_per_sec: int, capacity: int = 0
+    ) -> None:
+        self.port_count = ports
+        self.slow_ms = slow_ms
+        self.hang_sec = hang_sec
+        self.rate_limit_per_sec = rate_limit_per_sec
+        self.capacity = capacity
+        self.in_flight = 0
+        self.ports: list[int] = []
+        self.runners: list[web.AppRunner] = []
+        self.recent: dict[str, deque[float]] = defaultdict(deque)
+        self.requests = 0
+
+    async def start(self) -> None:
+        app = web.Application()
+        app.router.add_route("*", "/{behaviour}/{key}", self.handle)
+        app.router.add_route("*", "/{behaviour}/{key}/{hop}", self.handle)
+        for _ in range(self.port_count):
+            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            sock.bind(("127.0.0.1", 0))
+            # Cancelling on disconnect frees stalled slots once the client gives up, as a real link would.
+            runner = web.AppRunner(app, access_log=None, shutdown_timeout=0.1, handler_cancellation=True)
+            await runner.setup()
+            await web.SockSite(runner, sock, shutdown_timeout=0.1).start()
+            self.ports.append(sock.getsockname()[1])
+            self.runners.append(runner)
+
+    async def stop(self) -> None:
+        for runner in self.runners:
+            await runner.cleanup()
+
+    async def handle(self, request: web.Request) -> web.StreamResponse:
+        self.requests += 1
+        self.in_flight += 1
+        try:
+            if self.capacity and self.in_flight > self.capacity:
+                # Beyond the shared capacity requests are lost, as on a saturated egress link.
+                await asyncio.sleep(self.hang_sec)
+            return await self.respond(request)
+        finally:
+            self.in_flight -= 1
+
+    async def respond(self, request: web.Request) -> web.StreamResponse:
+        behaviour = request.match_info["behaviour"]
+        if behaviour == "slow":
+            await asyncio.sleep(self.slow_ms / 1000)
+        elif behaviour == "hang":
+            await asyncio.sleep(self.hang_sec)
+        elif behaviour == "redirect":
+            hop = int(request.match_info.get("hop", "0"))
+            if hop < 3:
+                raise web.HTTPFound(f"/redirect/{request.match_info['key']}/{hop + 1}")
+        elif behaviour == "head405" and request.method == "HEAD":
+            return web.Response(status=405)
+        elif behaviour == "ratelimit":
+            window = self.recent[request.host]
+            now = time.monotonic()
+            while window and now - window[0] > 1.0:
+                window.popleft()
+            window.append(now)
+            if len(window) > self.rate_limit_per_sec:
+                return web.Response(status=429, headers={"Retry-After": "1"})
+        elif behaviour == "parked":
+            return web.Response(text="<html><body>This domain is parked. Buy this domain today.</body></html>")
+        elif behaviour == "norange":
+            return web.Response(body=b"<html>" + b"x" * 1_000_000 + b"</html>", content_type="text/html")
+
+        body = "<html><head><title>Tool</title></head><body>" + "content " * 400 + "</body></html>"
+        if request.method != "HEAD" and request.headers.get("Range", "").startswith("bytes=0-"):
+            end = int(request.headers["Range"].split("-", 1)[1] or len(body) - 1)
+            return web.Response(status=206, text=body[: end + 1], content_type="text/html")
+        return web.Response(text=body, content_type="text/html")
+
+
+def parse_mix(value: str) -> dict[str, int]:
+    mix: dict[str, int] = {}
+    for part in value.split(","):
+        name, _, weight = part.partition("=")
+        if name.strip() not in BEHAVIOURS:
+            raise SystemExit(f"unknown behaviour in --mix: {name}")
+        mix[name.strip()] = int(weight or 0)
+    return mix
+
+
+def build_urls(count: int, hosts: int, ports: list[int], mix: dict[str, int], seed: int) -> tuple[list[str], list[str]]:
+    rng = random.Random(seed)
+    names = [name for name, weight in mix.items() if weight > 0]
+    weights = [mix[name] for name in names]
+    # One registrable domain per virtual host, so per-domain caps apply per site as they would live.
+    host_names = [f"bench-site{idx}.{FARM_TLD}" for idx in range(hosts)]
+    urls = []
+    for idx in range(count):
+        host_idx = rng.randrange(hosts)
+        behaviour = rng.choices(names, weights)[0]
+        urls.append(f"http://{host_names[host_idx]}:{ports[host_idx % len(ports)]}/{behaviour}/{idx}")
+    return urls, host_names
+
+
+def percentile(values: list[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def latency_trace(samples: list[float]) -> aiohttp.TraceConfig:
+    trace = aiohttp.TraceConfig()
+
+    async def on_start(_session, ctx, _params) -> None:
+        ctx.started = time.perf_counter()
+
+    async def on_done(_session, ctx, _params) -> None:
+        samples.append((time.perf_counter() - ctx.started) * 1000)
+
+    trace.on_request_start.append(on_start)
+    trace.on_request_end.append(on_done)
+    trace.on_request_exception.append(on_done)
+    return trace
+
+
+async def run_child(job: dict) -> dict:
+    from adaptive_concurrency import AdaptiveLimiter
+
+    urls: list[str] = job["urls"]
+    concurrency = int(job["concurrency"])
+    limiter = AdaptiveLimiter(concurrency, job["max_concurrency"], verbose=False) if job.get("adaptive") else None
+    dns_entries = {host: DnsEntry(host, "ok", ["127.0.0.1"], time.time()) for host in job["hosts"]}
+    samples: list[float] = []
+    traces = [latency_trace(samples)]
+    started = time.perf_counter()
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        if job["script"] == "audit":
+            from audit_links import ResultStream, run_audit
+
+            with tempfile.TemporaryDirectory() as tmp:
+                stream = ResultStream(Path(tmp) / "stream.csv", False, None)
+                await run_audit(
+                    urls,
+                    len(urls),
+                    concurrency,
+                    len(urls) + 1,
+                    stream,
+                    dns_entries=dns_entries,
+                    trace_configs=traces,
+                    limiter=limiter,
+                )
+                stream.close()
+                with (Path(tmp) / "stream.csv").open(newline="") as handle:
+                    ok = sum(1 for row in csv.DictReader(handle) if row["ok"] == "1")
+        elif job["script"] == "enrich":
+            from enrich_tools import validate_urls
+
+            statuses = await validate_urls(
+                urls, concurrency, dns_entries=dns_entries, trace_configs=traces, limiter=limiter
+            )
+            ok = sum(1 for status in statuses.values() if 200 <= status < 400)
+        else:
+            from audit_placeholder_pages import run
+
+            rows = [{"slug": str(idx), "website_url": url} for idx, url in enumerate(urls)]
+            results = await run(
+                rows, concurrency, len(rows) + 1, dns_entries=dns_entries, trace_configs=traces, limiter=limiter
+            )
+            ok = sum(int(row["ok"]) for row in results)
+
+    elapsed = time.perf_counter() - started
+    return {
+        "script": job["script"],
+        "concurrency": f"aimd:{concurrency}-{job['max_concurrency']}" if limiter else concurrency,
+        "final_limit": limiter.limit if limiter else concurrency,
+        "peak_limit": limiter.to_dict()["max"] if limiter else concurrency,
+        "urls": len(urls),
+        "ok": ok,
+        "elapsed_sec": round(elapsed, 3),
+        "urls_per_sec": round(len(urls) / elapsed, 1) if elapsed else 0.0,
+        "requests": len(samples),
+        "p50_ms": round(percentile(samples, 50), 1),
+        "p99_ms": round(percentile(samples, 99), 1),
+        "peak_rss_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+    }
+
+
+async def run_job(job: dict) -> dict:
+    process = await asyncio.create_subprocess_exec(
+        sys.executable,
+        str(Path(__file__).resolve()),
+        "--child",
+        stdin=asyncio.subprocess.PIPE,
+        stdout=asyncio.subprocess.PIPE,
+    )
+    stdout, _ = await process.communicate(json.dumps(job).encode("utf-8"))
+    if process.returncode != 0:
+        raise RuntimeError(f"benchmark child failed for {job['script']} at concurrency {job['concurrency']}")
+    return json.loads(stdout.decode("utf-8").strip().splitlines()[-1])
+
+
+async def run_benchmarks(args: argparse.Namespace) -> list[dict]:
+    farm = Farm(args.ports, args.slow_ms, args.hang_sec, args.rate_limit, args.capacity)
+    await farm.start()
+    try:
+        urls, hosts = build_urls(args.urls, args.hosts, farm.ports, parse_mix(args.mix), args.seed)
+        reports = []
+        levels = [int(value) for value in args.concurrency.split(",")]
+        runs = [(concurrency, False) for concurrency in levels]
+        if args.adaptive:
+            runs.append((args.adaptive_start, True))
+        for script in args.scripts.split(","):
+            for concurrency, adaptive in runs:
+                before = farm.requests
+                job = {
+                    "script": script,
+                    "concurrency": concurrency,
+                    "adaptive": adaptive,
+                    "max_concurrency": max(levels),
+                    "urls": urls,
+                    "hosts": hosts,
+                }
+                report = await run_job(job)
+                report["farm_requests"] = farm.requests - before
+                reports.append(report)
+                print(
+                    f"{report['script']:<12} c={report['concurrency']!s:<4} urls/s={report['urls_per_sec']:<8} "
+                    f"p50={report['p50_ms']:<7} p99={report['p99_ms']:<8} rss_mb={report['peak_rss_mb']:<7} "
+                    f"ok={report['ok']}/{report['urls']} requests={report['farm_requests']} "
+                    f"limit={report['final_limit']} peak_limit={report['peak_limit']}"
+                )
+        return reports
+    finally:
+        await farm.stop()
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--scripts", default=",".join(SCRIPTS), help="Comma-separated subset of audit,enrich,placeholder")
+    parser.add_argument("--concurrency", default="20,80,200", help="Comma-separated concurrency levels")
+    parser.add_argument("--urls", default=2000, type=int, help="Synthetic URLs per run")
+    parser.add_argument("--hosts", default=300, type=int, help="Virtual hosts the URLs are spread across")
+    parser.add_argument("--ports", default=8, type=int, help="Loopback ports the farm listens on")
+    parser.add_argument("--mix", default=DEFAULT_MIX, help=f"Behaviour weights ({', '.join(BEHAVIOURS)})")
+    parser.add_argument("--slow-ms", default=400, type=int, help="Delay for slow responses")
+    parser.add_argument("--hang-sec", default=30.0, type=float, help="How long hung responses stall")
+    parser.add_argument("--rate-limit", default=3, type=int, help="Requests per second per host before 429")
+    parser.add_argument(
+        "--capacity", default=0, type=int, help="Farm-wide in-flight requests before extra ones stall (0 = unlimited)"
+    )
+    parser.add_argument(
+        "--adaptive",
+        action=argparse.BooleanOptionalAction,
+        default=True,
+        help="Also run each script with the AIMD limiter, capped at the highest --concurrency level",
+    )
+    parser.add_argument("--adaptive-start", default=20, type=int, help="Starting limit for the adaptive run")
+    parser.add_argument("--seed", default=7, type=int)
+    parser.add_argument("--json-out", type=Path, help="Optional path for the JSON report")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    if args.child:
+        job = json.loads(sys.stdin.read())
+        print(json.dumps(asyncio.run(run_child(job))))
+        return
+
+    reports = asyncio.run(run_benchmarks(args))
+    if args.json_out:
+        args.json_out.parent.mkdir(parents=True, exist_ok=True)
+        args.json_out.write_text(json.dumps(reports, indent=2), encoding="utf-8")
+        print(f"saved={args.json_out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""Micro-benchmark: BeautifulSoup result parsing vs the streaming ddg_extract extractor."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import time
+from pathlib import Path
+from typing import Callable
+
+from bench_recover import FILLER_SITES, render_ddg_page, slugify
+from ddg_extract import extract_results
+from recover_links import DIRECTORY_DOMAIN_BLACKLIST, filter_hits, is_blacklisted
+from search_backends import SearchHit, parse_ddg_results
+
+
+def synthetic_pages(count: int, results_per_page: int, seed: int) -> list[str]:
+    rng = random.Random(seed)
+    directories = sorted(DIRECTORY_DOMAIN_BLACKLIST)
+    pages = []
+    for idx in range(count):
+        name = f"Tool {idx} & Co. \"AI\""
+        domains = [f"{slugify(name)}{idx}.ai", f"{slugify(name)}-app.test"]
+        domains += [rng.choice(directories + list(FILLER_SITES)) for _ in range(results_per_page)]
+        rng.shuffle(domains)
+        hits = [
+            (f"https://{domain}/p/{idx}?ref=ddg&q={name}", domain, f"{name} – {domain} <review>")
+            for domain in domains[:results_per_page]
+        ]
+        pages.append(render_ddg_page(f"{name} official website", hits))
+    return pages
+
+
+def time_parser(pages: list[str], parse: Callable[[str], list[SearchHit]], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for page in pages:
+            parse(page)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--pages", default=300, type=int, help="Synthetic result pages to generate")
+    parser.add_argument("--results-per-page", default=10, type=int)
+    parser.add_argument(
+        "--pages-dir", type=Path, help="Also time saved result pages (e.g. audit/search_fixtures from --record-fixtures)"
+    )
+    parser.add_argument("--candidate-limit", default=5, type=int, help="recover_links --candidate-limit")
+    parser.add_argument("--repeat", default=3, type=int, help="Timing runs per parser; the best is reported")
+    parser.add_argument("--seed", default=7, type=int)
+    parser.add_argument("--json-out", type=Path, help="Optional path for the JSON report")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    sets = {"synthetic": synthetic_pages(args.pages, args.results_per_page, args.seed)}
+    if args.pages_dir:
+        sets["saved"] = [path.read_text(encoding="utf-8") for path in sorted(args.pages_dir.glob("*.html"))]
+
+    keep = lambda hit: not is_blacklisted(hit[1])  # noqa: E731
+    limit = args.candidate_limit
+    parsers = {
+        "bs4": lambda page: filter_hits(parse_ddg_results(page), limit),
+        "stream_full": lambda page: filter_hits(extract_results(page), limit),
+        "stream_limited": lambda page: extract_results(page, limit, keep),
+    }
+    reports = []
+    for name, pages in sets.items():
+        if not pages:
+            continue
+        report = {
+            "pages": name,
+            "count": len(pages),
+            "avg_kb": round(sum(len(page) for page in pages) / len(pages) / 1024, 1),
+        }
+        for label, parse in parsers.items():
+            elapsed = time_parser(pages, parse, args.repeat)
+            report[f"{label}_pages_per_sec"] = round(len(pages) / elapsed, 1)
+        report["speedup_full"] = round(report["stream_full_pages_per_sec"] / report["bs4_pages_per_sec"], 2)
+        report["speedup_limited"] = round(report["stream_limited_pages_per_sec"] / report["bs4_pages_per_sec"], 2)
+        report["full_agreement_pct"] = round(
+            100 * sum(extract_results(page) == parse_ddg_results(page) for page in pages) / len(pages), 2
+        )
+        report["limited_agreement_pct"] = round(
+            100 * sum(parsers["stream_limited"](page) == parsers["bs4"](page) for page in pages) / len(pages), 2
+        )
+        reports.append(report)
+
+    print(json.dumps(reports, indent=2))
+    if args.json_out:
+        args.json_out.parent.mkdir(parents=True, exist_ok=True)
+        args.json_out.write_text(json.dumps(reports, indent=2), encoding="utf-8")
+        print(f"saved={args.json_out}")
+
+
+if __name__ == "__main__":
+    main()
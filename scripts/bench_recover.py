@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""Benchmark link recovery offline: synthetic DuckDuckGo fixture pages plus the loopback HTTP farm."""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import html
+import json
+import random
+import re
+import tempfile
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Callable
+from urllib.parse import quote
+
+import aiohttp
+
+from bench_crawl import Farm
+from crawl_metrics import CrawlMetrics
+from dns_stage import DnsEntry
+from recover_links import DIRECTORY_DOMAIN_BLACKLIST, parse_args as recover_args, recover
+from search_backends import FixtureBackend, SearchBackend, SearchCache, SearchHit
+from sheet_loader import load_table
+from url_cache import UrlHealthCache
+
+CANDIDATE_BEHAVIOURS = ("ok", "ok", "ok", "ok", "slow", "redirect", "head405", "parked")
+FILLER_SITES = ("news.example-media.test", "blog.example-reviews.test", "wiki.example-encyclopedia.test")
+
+
+class DelayedBackend:
+    """Adds a fixed per-query delay, standing in for live search latency and rate limiting."""
+
+    def __init__(self, backend: SearchBackend, delay_sec: float) -> None:
+        self.backend = backend
+        self.delay_sec = delay_sec
+        self.name = backend.name
+        self.calls = 0
+
+    async def fetch(self, session: aiohttp.ClientSession, query: str) -> str:
+        self.calls += 1
+        await asyncio.sleep(self.delay_sec)
+        return await self.backend.fetch(session, query)
+
+    def parse(
+        self, page: str, limit: int | None = None, keep: Callable[[SearchHit], bool] | None = None
+    ) -> list[SearchHit]:
+        return self.backend.parse(page, limit, keep)
+
+
+def render_ddg_page(query: str, hits: list[SearchHit], padding: int = 20) -> str:
+    """A results page shaped like duckduckgo.com/html, including the markup the parser must skip."""
+    blocks = []
+    for url, domain, title in hits:
+        href = f"//duckduckgo.com/l/?uddg={quote(url, safe='')}&amp;rut={abs(hash(url)):x}"
+        blocks.append(
+            '<div class="result results_links results_links_deep web-result ">'
+            '<div class="links_main links_deep result__body">'
+            f'<h2 class="result__title"><a rel="nofollow" class="result__a" href="{href}">{html.escape(title)}</a></h2>'
+            '<div class="result__extras"><div class="result__extras__url">'
+            f'<a class="result__url" href="{href}">{html.escape(domain)}</a></div></div>'
+            f'<a class="result__snippet" href="{href}">{html.escape(title)} '
+            + "lorem ipsum dolor sit amet " * padding
+            + "</a></div></div>"
+        )
+    return (
+        "<!DOCTYPE html><html><head><meta charset=\"utf-8\">"
+        f"<title>{html.escape(query)} at DuckDuckGo</title>"
+        + "<style>.result{margin:0}</style>" * 30
+        + '</head><body class="body--html"><div id="links" class="results">'
+        + "".join(blocks)
+        + '</div><div class="nav-link"><form action="/html/" method="post">'
+        '<input type="submit" class="btn btn--alt" value="Next"></form></div></body></html>'
+    )
+
+
+def slugify(name: str) -> str:
+    return re.sub(r"[^a-z0-9]+", "", name.lower())[:30] or "tool"
+
+
+def build_fixtures(
+    names: list[str], directory: Path, ports: list[int], results_per_page: int, seed: int
+) -> tuple[list[tuple[str, str]], dict[str, DnsEntry]]:
+    """Write one fixture page per tool and return recovery targets plus DNS entries for candidate hosts."""
+    rng = random.Random(seed)
+    fixtures = FixtureBackend(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    targets = []
+    hosts: set[str] = set()
+    directories = sorted(domain for domain in DIRECTORY_DOMAIN_BLACKLIST if not domain.startswith("www."))
+    for idx, name in enumerate(names):
+        slug = slugify(name)
+        old_url = f"https://{slug}-old.test/"
+        targets.append((name, old_url))
+        candidates: list[tuple[str, str]] = [
+            (f"{slug}.ai", f"{name} - Official Site"),
+            (f"{slug}-app.test", f"{name} | AI tool"),
+            (f"{slug}-old.test", f"{name} (old domain)"),
+        ]
+        candidates += [(rng.choice(directories), f"{name} reviews and alternatives") for _ in range(3)]
+        candidates += [(rng.choice(FILLER_SITES), f"Best AI tools like {name}") for _ in range(results_per_page)]
+        rng.shuffle(candidates)
+        hits = []
+        for domain, title in candidates[:results_per_page]:
+            port = rng.choice(ports)
+            behaviour = rng.choice(CANDIDATE_BEHAVIOURS)
+            hits.append((f"http://{domain}:{port}/{behaviour}/{idx}", f"{domain}:{port}", title))
+            hosts.add(domain)
+        query = f"{name} official website"
+        fixtures.path_for(query).write_text(render_ddg_page(query, hits), encoding="utf-8")
+    now = time.time()
+    return targets, {host: DnsEntry(host, "ok", ["127.0.0.1"], now) for host in hosts}
+
+
+def run_pass(
+    label: str,
+    targets: list[tuple[str, str]],
+    backend: DelayedBackend,
+    argv: list[str],
+    work_dir: Path,
+    dns_entries: dict[str, DnsEntry],
+) -> dict:
+    args = recover_args(argv)
+    search_cache = SearchCache(work_dir / "search_cache.sqlite", args.search_cache_ttl_hours * 3600)
+    status_cache = UrlHealthCache(work_dir / "status_cache.sqlite")
+    metrics = CrawlMetrics("recover_links")
+    stats: Counter[str] = Counter()
+    calls_before = backend.calls
+    started = time.perf_counter()
+    rows = asyncio.run(recover(targets, backend, args, search_cache, status_cache, metrics, dns_entries, stats))
+    elapsed = time.perf_counter() - started
+    report = {
+        "pass": label,
+        "min_confidence": args.min_confidence,
+        "elapsed_sec": round(elapsed, 2),
+        "searches": backend.calls - calls_before,
+        "search_cache": search_cache.summary(),
+        "candidates_scored": stats["candidates_scored"],
+        "validations_avoided": stats["validations_avoided"],
+        "probed_candidates": metrics.probes,
+        "accepted": sum(row.accepted for row in rows),
+    }
+    search_cache.close()
+    status_cache.close()
+    return report
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--xlsx", default=Path("All_ai_tools.xlsx"), type=Path, help="Source of realistic tool names")
+    parser.add_argument("--tools", default=300, type=int, help="Broken tools to recover")
+    parser.add_argument("--results-per-page", default=10, type=int)
+    parser.add_argument("--search-delay-ms", default=300, type=int, help="Simulated latency per live search")
+    parser.add_argument("--search-rate", default=20.0, type=float, help="recover_links --search-rate")
+    parser.add_argument("--search-concurrency", default=8, type=int, help="recover_links --search-concurrency")
+    parser.add_argument("--concurrency", default=60, type=int, help="recover_links --concurrency")
+    parser.add_argument("--min-confidence", default=0.62, type=float, help="Threshold for the cold pass")
+    parser.add_argument("--retune-confidence", default=0.5, type=float, help="Threshold for the warm rerun")
+    parser.add_argument("--ports", default=4, type=int, help="Loopback ports the farm listens on")
+    parser.add_argument("--seed", default=7, type=int)
+    parser.add_argument("--json-out", type=Path, help="Optional path for the JSON report")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    names = list(dict.fromkeys(load_table(args.xlsx, ["Tool Name"])["Tool Name"].dropna().astype(str)))
+    names = names[: args.tools]
+
+    # Each pass runs recover() under its own asyncio.run, so the farm lives on a loop in a thread.
+    loop = asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, daemon=True).start()
+    farm = Farm(args.ports, slow_ms=400, hang_sec=15.0, rate_limit_per_sec=1_000_000)
+    asyncio.run_coroutine_threadsafe(farm.start(), loop).result()
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            work_dir = Path(tmp)
+            targets, dns_entries = build_fixtures(
+                names, work_dir / "fixtures", farm.ports, args.results_per_page, args.seed
+            )
+            backend = DelayedBackend(FixtureBackend(work_dir / "fixtures"), args.search_delay_ms / 1000)
+            common = [
+                "--audit-csv", "unused.csv",
+                "--search-rate", str(args.search_rate),
+                "--search-concurrency", str(args.search_concurrency),
+                "--concurrency", str(args.concurrency),
+                "--per-host", "16",
+                "--per-domain", "16",
+            ]
+            reports = [
+                run_pass("cold", targets, backend, common + ["--min-confidence", str(args.min_confidence)], work_dir, dns_entries),
+                run_pass(
+                    "retune", targets, backend, common + ["--min-confidence", str(args.retune_confidence)], work_dir, dns_entries
+                ),
+            ]
+    finally:
+        asyncio.run_coroutine_threadsafe(farm.stop(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+
+    for report in reports:
+        print(
+            f"{report['pass']:<7} min_conf={report['min_confidence']:<5} elapsed_sec={report['elapsed_sec']:<7} "
+            f"searches={report['searches']:<5} cache_hit_rate={report['search_cache']['hit_rate']:<7} "
+            f"scored={report['candidates_scored']:<5} avoided={report['validations_avoided']:<5} "
+            f"probes={report['probed_candidates']:<5} accepted={report['accepted']}"
+        )
+    if args.json_out:
+        args.json_out.parent.mkdir(parents=True, exist_ok=True)
+        args.json_out.write_text(json.dumps(reports, indent=2), encoding="utf-8")
+        print(f"saved={args.json_out}")
+
+
+if __name__ == "__main__":
+    main()
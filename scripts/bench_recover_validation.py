@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""Compare recover_links candidate validation: curl subprocess per URL vs the pooled async client."""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import concurrent.futures
+import json
+import random
+import time
+from pathlib import Path
+
+from bench_crawl import Farm, parse_mix
+from recover_links import curl_status, validate_candidates
+
+DEFAULT_MIX = "ok=70,slow=10,redirect=10,head405=5,parked=5"
+
+
+def build_urls(count: int, ports: list[int], mix: dict[str, int], seed: int) -> list[str]:
+    rng = random.Random(seed)
+    names = [name for name, weight in mix.items() if weight > 0]
+    weights = [mix[name] for name in names]
+    return [
+        f"http://127.0.0.1:{rng.choice(ports)}/{rng.choices(names, weights)[0]}/{idx}" for idx in range(count)
+    ]
+
+
+async def run_curl(urls: list[str], workers: int) -> dict[str, int]:
+    loop = asyncio.get_running_loop()
+    # The farm shares this event loop, so the blocking curl calls must stay on worker threads.
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+        statuses = await asyncio.gather(*(loop.run_in_executor(executor, curl_status, url) for url in urls))
+    return dict(zip(urls, statuses))
+
+
+async def run_benchmark(args: argparse.Namespace) -> dict:
+    farm = Farm(args.ports, args.slow_ms, args.hang_sec, rate_limit_per_sec=1_000_000)
+    await farm.start()
+    try:
+        urls = build_urls(args.urls, farm.ports, parse_mix(args.mix), args.seed)
+        reports = {}
+        results = {}
+        for name in ("curl", "async"):
+            before = farm.requests
+            started = time.perf_counter()
+            if name == "curl":
+                results[name] = await run_curl(urls, args.workers)
+            else:
+                # Every URL is on 127.0.0.1, so the per-host caps are lifted to the global level.
+                results[name] = await validate_candidates(
+                    urls, args.concurrency, per_host=args.concurrency, per_domain=args.concurrency
+                )
+            elapsed = time.perf_counter() - started
+            reports[name] = {
+                "elapsed_sec": round(elapsed, 3),
+                "urls_per_sec": round(len(urls) / elapsed, 1) if elapsed else 0.0,
+                "farm_requests": farm.requests - before,
+                "processes_spawned": len(urls) if name == "curl" else 0,
+                "ok": sum(1 for status in results[name].values() if 200 <= status < 400),
+            }
+    finally:
+        await farm.stop()
+
+    mismatches = [url for url in urls if results["curl"][url] != results["async"][url]]
+    return {
+        "urls": len(urls),
+        "curl_workers": args.workers,
+        "async_concurrency": args.concurrency,
+        "curl": reports["curl"],
+        "async": reports["async"],
+        "speedup": round(reports["curl"]["elapsed_sec"] / reports["async"]["elapsed_sec"], 2),
+        "status_agreement_pct": round(100 * (1 - len(mismatches) / len(urls)), 2) if urls else 100.0,
+        "mismatch_samples": [
+            {"url": url, "curl": results["curl"][url], "async": results["async"][url]} for url in mismatches[:10]
+        ],
+    }
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--urls", default=1000, type=int, help="Synthetic candidate URLs")
+    parser.add_argument("--workers", default=10, type=int, help="Thread pool size for the curl path (recover_links --workers)")
+    parser.add_argument("--concurrency", default=60, type=int, help="In-flight limit for the async path")
+    parser.add_argument("--ports", default=8, type=int, help="Loopback ports the farm listens on")
+    parser.add_argument("--mix", default=DEFAULT_MIX, help="Behaviour weights, as in bench_crawl.py")
+    parser.add_argument("--slow-ms", default=400, type=int, help="Delay for slow responses")
+    parser.add_argument("--hang-sec", default=15.0, type=float, help="How long hung responses stall")
+    parser.add_argument("--seed", default=7, type=int)
+    parser.add_argument("--json-out", type=Path, help="Optional path for the JSON report")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    report = asyncio.run(run_benchmark(args))
+    print(json.dumps(report, indent=2))
+    if args.json_out:
+        args.json_out.parent.mkdir(parents=True, exist_ok=True)
+        args.json_out.write_text(json.dumps(report, indent=2), encoding="utf-8")
+        print(f"saved={args.json_out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""Compare the /api/tools?q= LIKE scan against the tools_fts MATCH query on local SQLite replicas."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import re
+import sqlite3
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+import pandas as pd
+
+from sqlite_replica import build_replica
+
+SEED_FIELDS = ["tool_slug", "tool_name", "category", "tags", "description", "website_link", "domain", "quality_status"]
+WORD = re.compile(r"[a-z0-9]{3,}")
+PAGE_SIZE = 20
+
+# Same WHERE/ORDER/LIMIT shape as handleToolsList in functions/api/[[path]].js, before and after FTS.
+LIKE_WHERE = (
+    "WHERE quality_status NOT LIKE 'invalid%' AND "
+    "(LOWER(name) LIKE LOWER(?) OR LOWER(tags) LIKE LOWER(?) OR LOWER(description) LIKE LOWER(?))"
+)
+LIKE_LIST = f"SELECT slug, name FROM tools {LIKE_WHERE} ORDER BY name ASC LIMIT ? OFFSET 0"
+LIKE_COUNT = f"SELECT COUNT(*) FROM tools {LIKE_WHERE}"
+FTS_FROM = "tools_fts JOIN tools ON tools.id = tools_fts.rowid"
+FTS_WHERE = "WHERE quality_status NOT LIKE 'invalid%' AND tools_fts MATCH ?"
+FTS_LIST = (
+    f"SELECT tools.slug, tools.name FROM {FTS_FROM} {FTS_WHERE} "
+    "ORDER BY bm25(tools_fts, 10.0, 3.0, 1.0), tools.name ASC LIMIT ? OFFSET 0"
+)
+FTS_COUNT = f"SELECT COUNT(*) FROM {FTS_FROM} {FTS_WHERE}"
+
+
+def scaled_rows(frame: pd.DataFrame, rows: int) -> list[tuple]:
+    base = list(frame.itertuples(index=False, name=None))
+    out = []
+    for copy in range(-(-rows // len(base))):
+        suffix = f"-{copy}" if copy else ""
+        name_suffix = f" v{copy}" if copy else ""
+        out += [(slug + suffix, name + name_suffix, *rest) for slug, name, *rest in base]
+    return out[:rows]
+
+
+def sample_queries(frame: pd.DataFrame, count: int, seed: int) -> list[str]:
+    """Whole words, 3-letter prefixes and two-word phrases drawn from names and tags."""
+    rng = random.Random(seed)
+    texts = frame["tool_name"].str.lower() + " " + frame["tags"].str.lower()
+    words = sorted({word for text in texts for word in WORD.findall(text)})
+    queries = []
+    for idx in range(count):
+        kind = idx % 3
+        if kind == 0:
+            queries.append(rng.choice(words))
+        elif kind == 1:
+            queries.append(rng.choice(words)[:3])
+        else:
+            queries.append(f"{rng.choice(words)} {rng.choice(words)[:3]}")
+    return queries
+
+
+def fts_query(q: str) -> str:
+    """Python twin of ftsQuery() in the API: every word becomes a quoted prefix term."""
+    return " ".join(f'"{term}"*' for term in re.findall(r"[^\W_]+", q.lower())[:8])
+
+
+def time_queries(conn: sqlite3.Connection, queries: list[str], fts: bool) -> tuple[list[float], list[int]]:
+    latencies, totals = [], []
+    for q in queries:
+        binds = (fts_query(q),) if fts else (f"%{q}%",) * 3
+        started = time.perf_counter()
+        conn.execute(FTS_LIST if fts else LIKE_LIST, (*binds, PAGE_SIZE)).fetchall()
+        total = conn.execute(FTS_COUNT if fts else LIKE_COUNT, binds).fetchone()[0]
+        latencies.append((time.perf_counter() - started) * 1000)
+        totals.append(total)
+    return latencies, totals
+
+
+def latency_stats(latencies: list[float]) -> dict:
+    ordered = sorted(latencies)
+    return {
+        "p50_ms": round(statistics.median(ordered), 3),
+        "p95_ms": round(ordered[int(0.95 * (len(ordered) - 1))], 3),
+        "mean_ms": round(statistics.fmean(ordered), 3),
+    }
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--seed-json", default=Path("data/tools_seed.json"), type=Path)
+    parser.add_argument("--migrations", default=Path("migrations"), type=Path)
+    parser.add_argument("--rows", default="5000,50000,500000", help="Comma-separated catalogue sizes")
+    parser.add_argument("--queries", default=60, type=int)
+    parser.add_argument("--seed", default=7, type=int)
+    parser.add_argument("--json-out", type=Path, help="Optional path for the JSON report")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    frame = pd.read_json(args.seed_json, dtype=False)[SEED_FIELDS].astype(str)
+    queries = sample_queries(frame, args.queries, args.seed)
+    reports = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for rows in (int(value) for value in args.rows.split(",")):
+            replica = build_replica(Path(tmp) / f"tools-{rows}.sqlite", scaled_rows(frame, rows), args.migrations)
+            conn = sqlite3.connect(replica["path"])
+            like_ms, like_totals = time_queries(conn, queries, fts=False)
+            fts_ms, fts_totals = time_queries(conn, queries, fts=True)
+            conn.close()
+            report = {
+                "rows": replica["rows"],
+                "load_sec": replica["load_sec"],
+                "db_bytes": Path(replica["path"]).stat().st_size,
+                "like": {**latency_stats(like_ms), "hits": sum(like_totals)},
+                "fts": {**latency_stats(fts_ms), "hits": sum(fts_totals)},
+            }
+            report["p50_speedup"] = round(report["like"]["p50_ms"] / report["fts"]["p50_ms"], 1)
+            reports.append(report)
+            print(
+                f"rows={report['rows']:<8} like_p50_ms={report['like']['p50_ms']:<9} "
+                f"fts_p50_ms={report['fts']['p50_ms']:<9} speedup={report['p50_speedup']}"
+            )
+
+    # LIKE matches substrings anywhere ("gpt" in "chatgpt"); FTS matches word prefixes, so hit counts differ.
+    print(json.dumps({"queries": len(queries), "sizes": reports}, indent=2))
+    if args.json_out:
+        args.json_out.parent.mkdir(parents=True, exist_ok=True)
+        args.json_out.write_text(json.dumps({"queries": len(queries), "sizes": reports}, indent=2), encoding="utf-8")
+        print(f"saved={args.json_out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""Compare single-row vs chunked multi-row seed SQL on a local SQLite copy of the D1 schema."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sqlite3
+import tempfile
+import time
+from pathlib import Path
+
+import pandas as pd
+
+from d1_seed import DEFAULT_CHUNK_BYTES, DEFAULT_STATEMENT_BYTES, TOOL_COLUMNS, insert_statements, pack_chunks, sql_literal
+
+SEED_FIELDS = ["tool_slug", "tool_name", "category", "tags", "description", "website_link", "domain", "quality_status"]
+
+
+def schema_connection(path: Path, migrations: Path) -> sqlite3.Connection:
+    conn = sqlite3.connect(path)
+    for migration in sorted(migrations.glob("*.sql")):
+        conn.executescript(migration.read_text(encoding="utf-8"))
+    return conn
+
+
+def single_row_statements(rows: list[tuple]) -> list[str]:
+    prefix = f"INSERT INTO tools ({', '.join(TOOL_COLUMNS)}) VALUES "
+    return ["DELETE FROM tools;"] + [prefix + "(" + ", ".join(sql_literal(item) for item in row) + ");" for row in rows]
+
+
+def run_requests(conn: sqlite3.Connection, requests: list[list[str]]) -> float:
+    """Each request is applied as one batch, as ``wrangler d1 execute`` does for a request body."""
+    started = time.perf_counter()
+    for statements in requests:
+        conn.executescript("BEGIN;\n" + "\n".join(statements) + "\nCOMMIT;")
+    return time.perf_counter() - started
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--seed-json", default=Path("data/tools_seed.json"), type=Path)
+    parser.add_argument("--migrations", default=Path("migrations"), type=Path)
+    parser.add_argument("--scale", default=1, type=int, help="Repeat the catalogue this many times (slugs suffixed)")
+    parser.add_argument("--statement-bytes", default=DEFAULT_STATEMENT_BYTES, type=int)
+    parser.add_argument("--chunk-bytes", default=DEFAULT_CHUNK_BYTES, type=int)
+    parser.add_argument("--json-out", type=Path, help="Optional path for the JSON report")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    frame = pd.read_json(args.seed_json)[SEED_FIELDS].astype(str)
+    rows = []
+    for copy in range(args.scale):
+        suffix = f"-{copy}" if copy else ""
+        rows += [(slug + suffix, *rest) for slug, *rest in frame.itertuples(index=False, name=None)]
+
+    single = single_row_statements(rows)
+    batched = ["DELETE FROM tools;"] + list(insert_statements("tools", TOOL_COLUMNS, rows, args.statement_bytes))
+    plans = {
+        # Statement-at-a-time seeding: every INSERT is its own request.
+        "single_row": [[statement] for statement in single],
+        "chunked": pack_chunks(batched, args.chunk_bytes),
+    }
+    report = {"rows": len(rows)}
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, requests in plans.items():
+            conn = schema_connection(Path(tmp) / f"{name}.sqlite", args.migrations)
+            elapsed = run_requests(conn, requests)
+            loaded = conn.execute("SELECT COUNT(*) FROM tools").fetchone()[0]
+            conn.close()
+            report[name] = {
+                "statements": sum(len(request) for request in requests),
+                "requests": len(requests),
+                "bytes": sum(len(statement.encode()) + 1 for request in requests for statement in request),
+                "max_statement_bytes": max(len(statement.encode()) for request in requests for statement in request),
+                "elapsed_sec": round(elapsed, 3),
+                "rows_loaded": loaded,
+            }
+    report["request_reduction"] = round(report["single_row"]["requests"] / report["chunked"]["requests"], 1)
+    report["speedup"] = round(report["single_row"]["elapsed_sec"] / report["chunked"]["elapsed_sec"], 1)
+    print(json.dumps(report, indent=2))
+    if args.json_out:
+        args.json_out.parent.mkdir(parents=True, exist_ok=True)
+        args.json_out.write_text(json.dumps(report, indent=2), encoding="utf-8")
+        print(f"saved={args.json_out}")
+
+
+if __name__ == "__main__":
+    main()
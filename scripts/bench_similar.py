@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""Time the offline similar-tools step at several catalogue sizes and check recall against exact cosine."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from pathlib import Path
+
+import pandas as pd
+
+from similar_tools import DEFAULT_TOP_K, similar_tools
+
+SEED_FIELDS = ["tool_slug", "tool_name", "category", "tags", "description"]
+
+
+def scaled_frame(frame: pd.DataFrame, rows: int) -> pd.DataFrame:
+    copies = []
+    for copy in range(-(-rows // len(frame))):
+        scaled = frame.copy()
+        if copy:
+            scaled["tool_slug"] = scaled["tool_slug"] + f"-{copy}"
+            scaled["tool_name"] = scaled["tool_name"] + f" v{copy}"
+        copies.append(scaled)
+    return pd.concat(copies, ignore_index=True).head(rows)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--seed-json", default=Path("data/tools_seed.json"), type=Path)
+    parser.add_argument("--rows", default="5000,50000,100000", help="Comma-separated catalogue sizes")
+    parser.add_argument("--top-k", default=DEFAULT_TOP_K, type=int)
+    parser.add_argument(
+        "--exact-max-rows", default=10_000, type=int, help="Also run the unpruned search up to this size, for recall"
+    )
+    parser.add_argument("--json-out", type=Path, help="Optional path for the JSON report")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    frame = pd.read_json(args.seed_json, dtype=False)[SEED_FIELDS].astype(str)
+    reports = []
+    for rows in (int(value) for value in args.rows.split(",")):
+        scaled = scaled_frame(frame, rows)
+        started = time.perf_counter()
+        similar = similar_tools(scaled, args.top_k)
+        elapsed = time.perf_counter() - started
+        category = scaled.set_index("tool_slug")["category"]
+        same_category = category.reindex(similar["slug"]).to_numpy() == category.reindex(similar["similar_slug"]).to_numpy()
+        report = {
+            "rows": len(scaled),
+            "sec": round(elapsed, 3),
+            "pairs": len(similar),
+            "tools_with_similar": int(similar["slug"].nunique()),
+            "same_category_share": round(float(same_category.mean()), 3) if len(similar) else None,
+        }
+        if len(scaled) <= args.exact_max_rows:
+            # Same term filter, no per-tool or per-term caps: the exact top-k cosine neighbours.
+            exact = similar_tools(scaled, args.top_k, terms_per_tool=None, posting_cap=None)
+            found = similar.merge(exact, on=["slug", "similar_slug"])
+            report["recall_vs_exact"] = round(len(found) / max(1, len(exact)), 3)
+        reports.append(report)
+        print(f"rows={report['rows']:<8} sec={report['sec']:<8} recall={report.get('recall_vs_exact', '-')}")
+
+    print(json.dumps(reports, indent=2))
+    if args.json_out:
+        args.json_out.parent.mkdir(parents=True, exist_ok=True)
+        args.json_out.write_text(json.dumps(reports, indent=2), encoding="utf-8")
+        print(f"saved={args.json_out}")
+
+
+if __name__ == "__main__":
+    main()
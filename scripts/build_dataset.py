@@ -6,11 +6,38 @@ from __future__ import annotations
 import argparse
 import json
 import re
+import time
+from datetime import datetime, timezone
 from pathlib import Path
 from urllib.parse import urlparse
 
+import numpy as np
 import pandas as pd
 
+try:
+    import pyarrow as pa
+except ImportError:  # pragma: no cover - the column transforms fall back to object lists
+    pa = None
+
+from d1_seed import (
+    DEFAULT_CHUNK_BYTES,
+    DEPLOYED_DIR,
+    DEFAULT_STATEMENT_BYTES,
+    FTS_REBUILD,
+    TOOL_COLUMNS,
+    delete_statements,
+    insert_statements,
+    upsert_suffix,
+    write_chunks,
+)
+from prefix_index import DEFAULT_SHARD_BYTES, write_prefix_index
+from sheet_loader import SHEET_COLUMNS, load_table
+from sitemaps import carry_lastmod, write_sitemaps
+from similar_tools import DEFAULT_TOP_K, SIMILAR_COLUMNS, similar_tools
+from sqlite_replica import DEFAULT_MIGRATIONS_DIR, build_replica, check_replica, fts_triggers
+from static_snapshot import DEFAULT_PAGE_SIZE, write_snapshot
+from tool_pages import render_tool_pages
+
 
 def slugify(value: str) -> str:
     value = re.sub(r"[^a-z0-9]+", "-", value.lower()).strip("-")
@@ -18,10 +45,6 @@ def slugify(value: str) -> str:
     return value[:110]
 
 
-def sql_escape(value: str) -> str:
-    return value.replace("'", "''")
-
-
 TRACKING_DOMAIN_BLACKLIST = {
     "sjv.io",
     "jvz8.com",
@@ -71,6 +94,135 @@ def name_domain_match_score(tool_name: str, domain: str) -> tuple[float, int]:
     return hits / len(tokens), len(tokens)
 
 
+# Plain ASCII http(s) URLs, which urlparse splits the same way; anything else takes the scalar path.
+SIMPLE_HTTP_URL = r"[Hh][Tt][Tt][Pp][Ss]?://[!-\"$-.0->@-Z^-~]+(?:[/?#][!-~]*)?"
+
+
+def _text(values: pd.Series) -> pd.Series:
+    """``str(value)`` per value: pandas' ``astype(str)`` keeps NaN/None missing, the scalar code sees "nan"/"None"."""
+    text = values.astype(str)
+    missing = values.isna()
+    if missing.any():
+        text.loc[missing] = [str(value) for value in values[missing].tolist()]
+    return text
+
+
+def _lower(values: pd.Series) -> pd.Series:
+    """``str.lower`` per value; non-ASCII rows use Python's own case mapping, as the scalar code does."""
+    values = _text(values)
+    lowered = values.str.lower()
+    ascii_rows = values.str.isascii()
+    if not ascii_rows.all():
+        lowered.loc[~ascii_rows] = [value.lower() for value in values[~ascii_rows].tolist()]
+    return lowered
+
+
+def _strip_www(domains: pd.Series) -> pd.Series:
+    return domains.where(~domains.str.startswith("www."), domains.str.slice(4))
+
+
+def slugify_series(values: pd.Series) -> pd.Series:
+    """Column version of ``slugify``, run once per distinct value (a few hundred categories per sheet)."""
+    codes, uniques = pd.factorize(_text(values))
+    # One pass: "-" is outside [a-z0-9], so replacing whole runs leaves no "--" for slugify's second sub.
+    slugs = _lower(pd.Series(uniques)).str.replace(r"[^a-z0-9]+", "-", regex=True).str.strip("-")
+    slugs = slugs.str.slice(0, 110).to_numpy(dtype=object)
+    return pd.Series(slugs[codes], index=values.index, dtype=str)
+
+
+def _split_http_urls(urls: pd.Series) -> tuple[pd.Series, pd.Series, pd.Series, pd.Series]:
+    """(stripped urls, fast-path mask, lowercase scheme, netloc) for the fast-path rows."""
+    urls = _text(urls).str.strip()
+    simple = urls.str.fullmatch(SIMPLE_HTTP_URL).fillna(False).astype(bool)
+    secure = urls.str.slice(4, 5).str.lower() == "s"
+    rest = urls.str.slice(8).where(secure, urls.str.slice(7))
+    netloc = rest.str.replace(r"[/?#].*", "", regex=True)
+    scheme = pd.Series(np.where(secure, "https", "http"), index=urls.index)
+    return urls, simple, scheme, netloc
+
+
+def canonical_homepage_series(urls: pd.Series) -> pd.Series:
+    """Column version of ``canonical_homepage``."""
+    urls, simple, scheme, netloc = _split_http_urls(urls)
+    result = (scheme + "://" + netloc.str.lower() + "/").where(simple, urls)
+    if not simple.all():
+        result.loc[~simple] = [canonical_homepage(url) for url in urls[~simple].tolist()]
+    return result
+
+
+def netloc_series(urls: pd.Series) -> pd.Series:
+    """Column version of ``urlparse(url).netloc.lower()``."""
+    urls, simple, _, netloc = _split_http_urls(urls)
+    result = netloc.str.lower().where(simple, "")
+    if not simple.all():
+        result.loc[~simple] = [urlparse(url).netloc.lower() for url in urls[~simple].tolist()]
+    return result
+
+
+def root_domain_series(domains: pd.Series) -> pd.Series:
+    """Column version of ``root_domain``; the scalar is cheap, so it runs once per distinct domain."""
+    codes, uniques = pd.factorize(_text(domains))
+    roots = np.array([root_domain(domain) for domain in uniques.tolist()], dtype=object)
+    return pd.Series(roots[codes], index=domains.index, dtype=str)
+
+
+def _name_tokens(names: pd.Series) -> tuple[pd.Series, np.ndarray]:
+    """Every [a-z0-9]+ run of each lowercased name, flattened, with the row position it came from."""
+    words = _lower(names).str.replace(r"[^a-z0-9]+", " ", regex=True)
+    if pa is not None:
+        lists = words.astype(pd.ArrowDtype(pa.string())).str.split(" ")
+        return lists.list.flatten().reset_index(drop=True), np.repeat(np.arange(len(lists)), lists.list.len().to_numpy())
+    tokens = words.str.split(" ").reset_index(drop=True).explode()
+    return tokens.reset_index(drop=True), tokens.index.to_numpy(dtype=np.int64)
+
+
+def name_domain_match_scores(tool_names: pd.Series, domains: pd.Series) -> tuple[np.ndarray, np.ndarray]:
+    """Column version of ``name_domain_match_score``: (scores, token counts) aligned by position."""
+    tokens, positions = _name_tokens(tool_names)
+    keep = ((tokens.str.len() > 2) & ~tokens.isin(NAME_TOKEN_STOPWORDS)).fillna(False).to_numpy(dtype=bool)
+    tokens, positions = tokens[keep].to_numpy(dtype=object).tolist(), positions[keep]
+    domain_text = _strip_www(_lower(domains)).str.replace(r"[^a-z0-9]+", " ", regex=True)
+    token_domains = domain_text.to_numpy(dtype=object)[positions].tolist()
+    hits = np.fromiter((token in text for token, text in zip(tokens, token_domains)), dtype=bool, count=len(tokens))
+    rows = len(tool_names)
+    counts = np.bincount(positions, minlength=rows)
+    scores = np.ones(rows)
+    np.divide(np.bincount(positions, weights=hits, minlength=rows), counts, out=scores, where=counts > 0)
+    return scores, counts
+
+
+# Scraped tools come from several sources with their own column names (mapped in main()).
+NEW_TOOL_COLUMNS = ["tool_name", "name", "category", "heading", "description", "desc", "website_link", "website", "domain"]
+SEED_FIELDS = ["tool_slug", "tool_name", "category", "tags", "description", "website_link", "domain", "quality_status"]
+
+
+def seed_hashes(rows: pd.DataFrame) -> pd.Series:
+    """Content hash of the seeded columns, indexed by slug."""
+    rows = rows[SEED_FIELDS].astype(str)
+    return pd.Series(pd.util.hash_pandas_object(rows, index=False).to_numpy(), index=rows["tool_slug"])
+
+
+def load_seed_hashes(path: Path) -> pd.Series | None:
+    if not path.exists():
+        return None
+    # dtype=False keeps slugs such as "1984" as strings.
+    return seed_hashes(pd.read_json(path, dtype=False))
+
+
+def similar_lists(similar: pd.DataFrame) -> pd.Series:
+    """Ranked ``neighbour:score`` pairs per tool, as one string per slug, for diffing two builds."""
+    similar = similar.sort_values(["slug", "rank"])
+    # similar_tools rounds scores to 4 places, so the formatted score is exact.
+    scores = similar["score"].astype(float).map("{:.4f}".format)
+    return (similar["similar_slug"] + ":" + scores).groupby(similar["slug"], sort=False).agg(" ".join)
+
+
+def load_similar_lists(path: Path) -> pd.Series:
+    if not path.exists():
+        return pd.Series(dtype=object, index=pd.Index([], dtype=str))
+    return similar_lists(pd.read_csv(path, dtype={"slug": str, "similar_slug": str}, keep_default_na=False))
+
+
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description=__doc__)
     parser.add_argument("--audit-csv", required=True, type=Path, help="Path to tools_with_audit.csv")
@@ -89,6 +241,72 @@ def parse_args() -> argparse.Namespace:
         default=0.0,
         help="Drop legacy rows where name-domain score is <= this threshold (0.0 drops exact mismatches only).",
     )
+    parser.add_argument(
+        "--seed-statement-bytes",
+        type=int,
+        default=DEFAULT_STATEMENT_BYTES,
+        help="Max size of one multi-row INSERT in the seed (D1 rejects statements over 100 KB)",
+    )
+    parser.add_argument(
+        "--previous-seed",
+        type=Path,
+        help="tools_seed.json of the deployed build, for the delta seed (defaults to <out-dir>/deployed/, "
+        "which scripts/seed_d1.py --remote updates after a successful seed)",
+    )
+    parser.add_argument(
+        "--replica-db",
+        type=Path,
+        help="Local SQLite replica built from the migrations and the seed rows (defaults to <out-dir>/tools.sqlite)",
+    )
+    parser.add_argument("--migrations", type=Path, default=DEFAULT_MIGRATIONS_DIR, help="D1 migrations for the replica")
+    parser.add_argument(
+        "--similar-top-k",
+        type=int,
+        default=DEFAULT_TOP_K,
+        help="Similar tools stored per tool in tool_similar (0 disables the table rows)",
+    )
+    parser.add_argument(
+        "--snapshot-dir",
+        type=Path,
+        default=Path("public/snapshot"),
+        help="Static listing snapshot served by Pages (manifest.json plus versioned JSON shards)",
+    )
+    parser.add_argument("--snapshot-page-size", type=int, default=DEFAULT_PAGE_SIZE, help="Must match public/app.js")
+    parser.add_argument(
+        "--snapshot-pages",
+        type=int,
+        default=3,
+        help="Pages per listing and sort in the snapshot (0 = all); deeper pages are served by the API",
+    )
+    parser.add_argument(
+        "--suggest-dir",
+        type=Path,
+        default=Path("public/suggest"),
+        help="Static autocomplete index over names, tags and categories (manifest.json plus prefix shards)",
+    )
+    parser.add_argument(
+        "--suggest-shard-bytes",
+        type=int,
+        default=DEFAULT_SHARD_BYTES,
+        help="Size cap of one autocomplete shard; bigger prefixes are split by their next character",
+    )
+    parser.add_argument(
+        "--sitemap-dir",
+        type=Path,
+        default=Path("public"),
+        help="Where sitemap.xml (the index) and the gzip shards under sitemaps/ are written",
+    )
+    parser.add_argument(
+        "--prerender-dir",
+        type=Path,
+        help="Optional directory for static tool pages (e.g. out/tool); only pages whose inputs changed are rendered",
+    )
+    parser.add_argument(
+        "--seed-chunk-bytes",
+        type=int,
+        default=DEFAULT_CHUNK_BYTES,
+        help="Max size of one seed chunk file under <out-dir>/seed/ (one wrangler d1 execute each)",
+    )
     return parser.parse_args()
 
 
@@ -97,7 +315,7 @@ def main() -> None:
     out_dir = args.out_dir
     out_dir.mkdir(parents=True, exist_ok=True)
 
-    df = pd.read_csv(args.audit_csv)
+    df = load_table(args.audit_csv, [*SHEET_COLUMNS, "ok", "status"], optional=["final_url"])
     df = df.rename(columns={"Website Link": "website_link"})
     df["Tool Name"] = df["Tool Name"].astype(str).str.strip()
     df["Category"] = df["Category"].astype(str).str.strip()
@@ -107,11 +325,11 @@ def main() -> None:
     if "final_url" in df.columns:
         has_final = df["final_url"].notna() & df["final_url"].astype(str).str.startswith(("http://", "https://"))
         df.loc[has_final, "website_link"] = df.loc[has_final, "final_url"].astype(str)
-    df["quality_status"] = df["ok"].apply(lambda x: "verified" if int(x) == 1 else "invalid")
+    df["quality_status"] = np.where(df["ok"].astype(int) == 1, "verified", "invalid")
 
     recovered_count = 0
     if args.recover_csv.exists():
-        recover_df = pd.read_csv(args.recover_csv)
+        recover_df = load_table(args.recover_csv, ["tool_name", "old_url", "candidate_url", "confidence", "accepted"])
         accepted = recover_df[recover_df["accepted"] == 1][["tool_name", "old_url", "candidate_url", "confidence"]]
         accepted = accepted.rename(
             columns={
@@ -131,12 +349,12 @@ def main() -> None:
 
     # Keep only verified or recovered rows.
     df = df[df["quality_status"].isin(["verified", "recovered"])].copy()
-    df["website_link"] = df["website_link"].apply(canonical_homepage)
+    df["website_link"] = canonical_homepage_series(df["website_link"])
 
-    df["domain"] = df["website_link"].apply(lambda x: urlparse(x).netloc.lower())
+    df["domain"] = netloc_series(df["website_link"])
     df = df[~df["domain"].isin(TRACKING_DOMAIN_BLACKLIST)].copy()
-    df["tool_slug"] = df["Tool Name"].apply(slugify)
-    df["category_slug"] = df["Category"].apply(slugify)
+    df["tool_slug"] = slugify_series(df["Tool Name"])
+    df["category_slug"] = slugify_series(df["Category"])
 
     # Remove obvious duplicates by canonical key.
     df = df.sort_values(
@@ -168,7 +386,7 @@ def main() -> None:
 
     added_new_tools = 0
     if args.new_tools_csv.exists():
-        new_df = pd.read_csv(args.new_tools_csv)
+        new_df = load_table(args.new_tools_csv, [], optional=NEW_TOOL_COLUMNS)
         if not new_df.empty:
             rename_map = {
                 "name": "tool_name",
@@ -186,13 +404,13 @@ def main() -> None:
                 new_df["tool_name"] = new_df["tool_name"].astype(str).str.strip()
                 new_df["category"] = new_df["category"].astype(str).str.strip()
                 new_df["description"] = new_df["description"].astype(str).str.strip()
-                new_df["website_link"] = new_df["website_link"].astype(str).str.strip().apply(canonical_homepage)
-                new_df["domain"] = new_df["website_link"].apply(lambda x: urlparse(x).netloc.lower())
+                new_df["website_link"] = canonical_homepage_series(new_df["website_link"])
+                new_df["domain"] = netloc_series(new_df["website_link"])
                 new_df["tags"] = new_df["category"].astype(str)
                 new_df["quality_status"] = "scraped_verified"
                 new_df["recovered_confidence"] = None
-                new_df["tool_slug"] = new_df["tool_name"].apply(slugify)
-                new_df["domain_root"] = new_df["domain"].apply(root_domain)
+                new_df["tool_slug"] = slugify_series(new_df["tool_name"])
+                new_df["domain_root"] = root_domain_series(new_df["domain"])
                 new_df = new_df[
                     [
                         "tool_slug",
@@ -218,9 +436,9 @@ def main() -> None:
     cleaned = cleaned.drop_duplicates(subset=["tool_name", "domain"], keep="first")
     cleaned = cleaned.drop_duplicates(subset=["tool_slug"], keep="first")
 
-    scores = cleaned.apply(lambda row: name_domain_match_score(row["tool_name"], row["domain"]), axis=1)
-    cleaned["name_domain_score"] = [score for score, _ in scores]
-    cleaned["name_domain_tokens"] = [token_count for _, token_count in scores]
+    cleaned["name_domain_score"], cleaned["name_domain_tokens"] = name_domain_match_scores(
+        cleaned["tool_name"], cleaned["domain"]
+    )
     legacy_mask = cleaned["quality_status"].isin(["verified", "recovered"])
     mismatch_mask = legacy_mask & (cleaned["name_domain_tokens"] > 0) & (cleaned["name_domain_score"] <= args.drop_mismatch_score)
     dropped_mismatch_rows = int(mismatch_mask.sum())
@@ -231,21 +449,100 @@ def main() -> None:
     cleaned.to_csv(out_dir / "tools_cleaned.csv", index=False)
     cleaned.to_json(out_dir / "tools_cleaned.json", orient="records", indent=2, force_ascii=True)
 
+    previous_seed = args.previous_seed or out_dir / DEPLOYED_DIR / "tools_seed.json"
+    previous_hashes = load_seed_hashes(previous_seed)
+    previous_similar = load_similar_lists(previous_seed.with_name("tool_similar.csv"))
     top_for_seed = cleaned.copy()
     top_for_seed.to_json(out_dir / "tools_seed.json", orient="records", indent=2, force_ascii=True)
 
-    sql_lines = [
-        "-- Generated by scripts/build_dataset.py",
-        "DELETE FROM tools;",
-    ]
-    for row in top_for_seed.itertuples(index=False):
-        sql_lines.append(
-            "INSERT INTO tools (slug, name, category, tags, description, website_url, domain, quality_status) "
-            f"VALUES ('{sql_escape(row.tool_slug)}', '{sql_escape(row.tool_name)}', '{sql_escape(row.category)}', "
-            f"'{sql_escape(row.tags)}', '{sql_escape(row.description)}', '{sql_escape(row.website_link)}', "
-            f"'{sql_escape(row.domain)}', '{sql_escape(row.quality_status)}');"
-        )
+    seed_rows = top_for_seed[SEED_FIELDS].astype(str)
+    # The tools_fts triggers are dropped for the reload and recreated for later delta upserts; one
+    # rebuild then indexes every row.
+    triggers = fts_triggers(args.migrations)
+    statements = [f"DROP TRIGGER IF EXISTS {name};" for name in triggers]
+    statements.append("DELETE FROM tools;")
+    statements += insert_statements(
+        "tools", TOOL_COLUMNS, seed_rows.itertuples(index=False, name=None), args.seed_statement_bytes
+    )
+    statements += [*triggers.values(), FTS_REBUILD]
+
+    similar_started = time.perf_counter()
+    similar = pd.DataFrame(columns=list(SIMILAR_COLUMNS))
+    if args.similar_top_k > 0:
+        similar = similar_tools(seed_rows, args.similar_top_k)
+    similar_sec = time.perf_counter() - similar_started
+    similar.to_csv(out_dir / "tool_similar.csv", index=False)
+    similar_rows = list(similar.itertuples(index=False, name=None))
+    statements.append("DELETE FROM tool_similar;")
+    statements += insert_statements("tool_similar", SIMILAR_COLUMNS, similar_rows, args.seed_statement_bytes)
+    sql_lines = ["-- Generated by scripts/build_dataset.py", *statements]
     (out_dir / "seed.sql").write_text("\n".join(sql_lines) + "\n", encoding="utf-8")
+    seed_sources = [out_dir / "tools_seed.json", out_dir / "tool_similar.csv"]
+    seed_manifest = write_chunks(statements, out_dir / "seed", args.seed_chunk_bytes, sources=seed_sources)
+
+    # Delta against the previous build: upsert new/changed slugs, delete removed ones.
+    current_hashes = seed_hashes(seed_rows)
+    if previous_hashes is None:
+        previous_hashes = pd.Series(dtype="uint64", index=pd.Index([], dtype=str))
+    added = ~current_hashes.index.isin(previous_hashes.index)
+    previous_for_current = previous_hashes.reindex(current_hashes.index, fill_value=0).to_numpy()
+    changed = ~added & (previous_for_current != current_hashes.to_numpy())
+    removed = sorted(set(previous_hashes.index) - set(current_hashes.index))
+    upserts = seed_rows[added | changed]
+    delta_statements = list(delete_statements("tools", "slug", removed, args.seed_statement_bytes))
+    delta_statements += insert_statements(
+        "tools",
+        TOOL_COLUMNS,
+        upserts.itertuples(index=False, name=None),
+        args.seed_statement_bytes,
+        upsert_suffix("slug", TOOL_COLUMNS),
+    )
+    # Neighbour lists and scores shift whenever the catalogue does, so they are diffed per tool, not per row.
+    current_similar = similar_lists(similar)
+    replaced = current_similar.index[previous_similar.reindex(current_similar.index).ne(current_similar)]
+    stale = previous_similar.index.difference(current_similar.index)
+    delta_statements += delete_statements("tool_similar", "slug", sorted([*replaced, *stale]), args.seed_statement_bytes)
+    delta_statements += insert_statements(
+        "tool_similar",
+        SIMILAR_COLUMNS,
+        similar[similar["slug"].isin(replaced)].itertuples(index=False, name=None),
+        args.seed_statement_bytes,
+    )
+    (out_dir / "seed_delta.sql").write_text(
+        "\n".join(["-- Generated by scripts/build_dataset.py (delta)", *delta_statements]) + "\n", encoding="utf-8"
+    )
+    delta_manifest = write_chunks(delta_statements, out_dir / "seed_delta", args.seed_chunk_bytes, sources=seed_sources)
+    delta = {
+        # Without a deployed seed every tool is an upsert and nothing is deleted.
+        "previous_seed": str(previous_seed) if previous_seed.exists() else None,
+        "added": int(added.sum()),
+        "changed": int(changed.sum()),
+        "removed": len(removed),
+        "unchanged": int(len(seed_rows) - added.sum() - changed.sum()),
+        "similar_replaced": len(replaced),
+        "similar_removed": len(stale),
+        "statements": delta_manifest["total_statements"],
+        "bytes": delta_manifest["total_bytes"],
+    }
+
+    snapshot = write_snapshot(seed_rows, args.snapshot_dir, args.snapshot_page_size, args.snapshot_pages)
+    suggest = write_prefix_index(seed_rows, args.suggest_dir, args.suggest_shard_bytes)
+
+    build_date = datetime.now(timezone.utc).date().isoformat()
+    lastmod = carry_lastmod(current_hashes, out_dir / "sitemap_lastmod.csv", build_date)
+    lastmod.to_csv(out_dir / "sitemap_lastmod.csv", index=False)
+    sitemaps = write_sitemaps(lastmod, args.sitemap_dir)
+    prerender = None
+    if args.prerender_dir:
+        prerender_started = time.perf_counter()
+        prerender = render_tool_pages(
+            seed_rows.set_axis(list(TOOL_COLUMNS), axis=1),
+            current_hashes,
+            similar,
+            args.prerender_dir,
+            out_dir / "tool_pages_state.csv",
+        )
+        prerender["sec"] = round(time.perf_counter() - prerender_started, 3)
 
     xlsx_df = cleaned.rename(
         columns={
@@ -261,12 +558,35 @@ def main() -> None:
     summary = {
         "final_tool_count": int(len(cleaned)),
         "seed_tool_count": int(len(top_for_seed)),
+        "seed_statements": seed_manifest["total_statements"],
+        "seed_chunks": len(seed_manifest["chunks"]),
+        "seed_delta": delta,
+        "similar": {
+            "rows": len(similar),
+            "tools": int(similar["slug"].nunique()),
+            "top_k": args.similar_top_k,
+            "sec": round(similar_sec, 3),
+        },
+        "snapshot": snapshot,
+        "suggest": suggest,
+        "sitemaps": sitemaps,
+        "prerender": prerender,
         "recovered_links_used": recovered_count,
         "new_scraped_tools_merged": added_new_tools,
         "legacy_mismatch_rows_dropped": dropped_mismatch_rows,
         "categories": int(cleaned["category"].nunique()) if not cleaned.empty else 0,
         "xlsx_output": str(args.xlsx_out),
     }
+    replica = build_replica(
+        args.replica_db or out_dir / "tools.sqlite",
+        seed_rows.itertuples(index=False, name=None),
+        args.migrations,
+        similar_rows,
+    )
+    problems = check_replica(Path(replica["path"]), summary, args.migrations)
+    if problems:
+        raise SystemExit("replica checks failed:\n" + "\n".join(problems))
+    summary["replica"] = replica
     (out_dir / "dataset_summary.json").write_text(json.dumps(summary, indent=2), encoding="utf-8")
     print(json.dumps(summary, indent=2))
 
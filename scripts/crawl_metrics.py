@@ -0,0 +1,214 @@
+"""Per-request crawl timing collected through aiohttp tracing, exported as JSON and Prometheus text."""
+
+from __future__ import annotations
+
+import json
+import time
+from collections import Counter
+from pathlib import Path
+
+import aiohttp
+from yarl import URL
+
+from adaptive_concurrency import AdaptiveLimiter
+
+BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 20000)
+PHASES = ("dns", "connect", "tls_connect", "ttfb", "total")
+
+
+class Histogram:
+    def __init__(self, buckets: tuple[float, ...] = BUCKETS_MS) -> None:
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.count += 1
+        self.sum += value
+        for idx, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[idx] += 1
+                return
+        self.counts[-1] += 1
+
+    def quantile(self, q: float) -> float:
+        """Upper bucket bound containing quantile ``q`` (the overflow bucket reports the largest bound)."""
+        if not self.count:
+            return 0.0
+        target = q * self.count
+        running = 0
+        for idx, bound in enumerate(self.buckets):
+            running += self.counts[idx]
+            if running >= target:
+                return float(bound)
+        return float(self.buckets[-1])
+
+    def cumulative(self) -> list[tuple[str, int]]:
+        running = 0
+        rows = []
+        for idx, bound in enumerate(self.buckets):
+            running += self.counts[idx]
+            rows.append((str(bound), running))
+        rows.append(("+Inf", self.count))
+        return rows
+
+    def to_dict(self) -> dict:
+        return {
+            "count": self.count,
+            "sum_ms": round(self.sum, 1),
+            "mean_ms": round(self.sum / self.count, 1) if self.count else 0.0,
+            "p50_ms": self.quantile(0.5),
+            "p90_ms": self.quantile(0.9),
+            "p99_ms": self.quantile(0.99),
+            "buckets": dict(self.cumulative()),
+        }
+
+
+class CrawlMetrics:
+    """Collects phase histograms from aiohttp trace hooks plus probe-level retry/fallback counters."""
+
+    def __init__(self, script: str) -> None:
+        self.script = script
+        self.phases = {phase: Histogram() for phase in PHASES}
+        self.responses: Counter[str] = Counter()
+        self.errors: Counter[str] = Counter()
+        self.paths: Counter[str] = Counter()
+        self.retries = 0
+        self.probes = 0
+        self.limiter: AdaptiveLimiter | None = None
+        self.started_at = time.time()
+
+    def trace_config(self) -> aiohttp.TraceConfig:
+        trace = aiohttp.TraceConfig()
+
+        async def on_request_start(_session, ctx, params) -> None:
+            ctx.start = time.perf_counter()
+            ctx.scheme = params.url.scheme
+            ctx.headers_sent = None
+
+        async def on_request_redirect(_session, ctx, params) -> None:
+            # The next hop's scheme is the Location target's, resolved as aiohttp does, not the response's.
+            location = params.response.headers.get("Location") or params.response.headers.get("URI")
+            if location:
+                try:
+                    ctx.scheme = params.response.url.join(URL(location)).scheme
+                except ValueError:
+                    pass
+
+        async def on_dns_start(_session, ctx, _params) -> None:
+            ctx.dns_start = time.perf_counter()
+
+        async def on_dns_end(_session, ctx, _params) -> None:
+            self.phases["dns"].observe((time.perf_counter() - ctx.dns_start) * 1000)
+
+        async def on_connect_start(_session, ctx, _params) -> None:
+            ctx.connect_start = time.perf_counter()
+
+        async def on_connect_end(_session, ctx, _params) -> None:
+            # aiohttp reports TCP and TLS setup as one step, so https connects are tracked separately.
+            phase = "tls_connect" if getattr(ctx, "scheme", "") == "https" else "connect"
+            self.phases[phase].observe((time.perf_counter() - ctx.connect_start) * 1000)
+
+        async def on_headers_sent(_session, ctx, _params) -> None:
+            ctx.headers_sent = time.perf_counter()
+
+        async def on_request_end(_session, ctx, params) -> None:
+            now = time.perf_counter()
+            if ctx.headers_sent is not None:
+                self.phases["ttfb"].observe((now - ctx.headers_sent) * 1000)
+            self.phases["total"].observe((now - ctx.start) * 1000)
+            self.responses[f"{params.response.status // 100}xx"] += 1
+
+        async def on_request_exception(_session, ctx, params) -> None:
+            self.phases["total"].observe((time.perf_counter() - ctx.start) * 1000)
+            self.errors[type(params.exception).__name__] += 1
+
+        trace.on_request_start.append(on_request_start)
+        trace.on_request_redirect.append(on_request_redirect)
+        trace.on_dns_resolvehost_start.append(on_dns_start)
+        trace.on_dns_resolvehost_end.append(on_dns_end)
+        trace.on_connection_create_start.append(on_connect_start)
+        trace.on_connection_create_end.append(on_connect_end)
+        trace.on_request_headers_sent.append(on_headers_sent)
+        trace.on_request_end.append(on_request_end)
+        trace.on_request_exception.append(on_request_exception)
+        return trace
+
+    def record_probe(self, path: str, attempts: int) -> None:
+        self.probes += 1
+        self.paths[path] += 1
+        self.retries += max(0, attempts - 1)
+
+    def to_dict(self) -> dict:
+        return {
+            "script": self.script,
+            "elapsed_sec": round(time.time() - self.started_at, 2),
+            "probes": self.probes,
+            "retries": self.retries,
+            "probe_paths": dict(self.paths),
+            "responses": dict(self.responses),
+            "errors": dict(self.errors),
+            "phases_ms": {phase: hist.to_dict() for phase, hist in self.phases.items()},
+            "concurrency": self.limiter.to_dict() if self.limiter else None,
+        }
+
+    def to_prometheus(self) -> str:
+        label = f'script="{self.script}"'
+        lines = [
+            "# HELP findaidir_crawl_phase_ms Crawl request phase duration in milliseconds.",
+            "# TYPE findaidir_crawl_phase_ms histogram",
+        ]
+        for phase, hist in self.phases.items():
+            for bound, count in hist.cumulative():
+                lines.append(f'findaidir_crawl_phase_ms_bucket{{{label},phase="{phase}",le="{bound}"}} {count}')
+            lines.append(f'findaidir_crawl_phase_ms_sum{{{label},phase="{phase}"}} {hist.sum:.3f}')
+            lines.append(f'findaidir_crawl_phase_ms_count{{{label},phase="{phase}"}} {hist.count}')
+        lines += [
+            "# HELP findaidir_crawl_probes_total URL probes by request path taken.",
+            "# TYPE findaidir_crawl_probes_total counter",
+        ]
+        lines += [f'findaidir_crawl_probes_total{{{label},path="{path}"}} {n}' for path, n in sorted(self.paths.items())]
+        lines += [
+            "# HELP findaidir_crawl_retries_total Requests repeated after a retryable status or error.",
+            "# TYPE findaidir_crawl_retries_total counter",
+            f"findaidir_crawl_retries_total{{{label}}} {self.retries}",
+            "# HELP findaidir_crawl_responses_total HTTP responses by status class.",
+            "# TYPE findaidir_crawl_responses_total counter",
+        ]
+        lines += [
+            f'findaidir_crawl_responses_total{{{label},class="{cls}"}} {n}' for cls, n in sorted(self.responses.items())
+        ]
+        lines += [
+            "# HELP findaidir_crawl_request_errors_total Request exceptions by type.",
+            "# TYPE findaidir_crawl_request_errors_total counter",
+        ]
+        lines += [
+            f'findaidir_crawl_request_errors_total{{{label},error="{name}"}} {n}' for name, n in sorted(self.errors.items())
+        ]
+        if self.limiter is not None:
+            concurrency = self.limiter.to_dict()
+            lines += [
+                "# HELP findaidir_crawl_concurrency_limit Adaptive in-flight limit at the end of the run.",
+                "# TYPE findaidir_crawl_concurrency_limit gauge",
+                f"findaidir_crawl_concurrency_limit{{{label}}} {concurrency['final']}",
+                "# HELP findaidir_crawl_concurrency_limit_max Highest adaptive in-flight limit reached.",
+                "# TYPE findaidir_crawl_concurrency_limit_max gauge",
+                f"findaidir_crawl_concurrency_limit_max{{{label}}} {concurrency['max']}",
+                "# HELP findaidir_crawl_concurrency_changes_total Adaptive limit changes by reason.",
+                "# TYPE findaidir_crawl_concurrency_changes_total counter",
+            ]
+            reasons = Counter(point["reason"] for point in concurrency["history"][1:])
+            lines += [
+                f'findaidir_crawl_concurrency_changes_total{{{label},reason="{reason}"}} {n}'
+                for reason, n in sorted(reasons.items())
+            ]
+        return "\n".join(lines) + "\n"
+
+    def write(self, out_dir: Path, name: str = "crawl_metrics") -> tuple[Path, Path]:
+        out_dir.mkdir(parents=True, exist_ok=True)
+        json_path = out_dir / f"{name}.json"
+        prom_path = out_dir / f"{name}.prom"
+        json_path.write_text(json.dumps(self.to_dict(), indent=2), encoding="utf-8")
+        prom_path.write_text(self.to_prometheus(), encoding="utf-8")
+        return json_path, prom_path
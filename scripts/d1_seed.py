@@ -0,0 +1,147 @@
+"""Chunked D1 seed files: multi-row INSERTs packed under D1's statement and request size limits."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from pathlib import Path
+from typing import Iterable, Iterator, Sequence
+
+# D1 rejects any single SQL statement over 100 KB; leave headroom for the INSERT prefix.
+MAX_STATEMENT_BYTES = 100_000
+DEFAULT_STATEMENT_BYTES = 90_000
+# Each chunk file is one `wrangler d1 execute --file` request.
+DEFAULT_CHUNK_BYTES = 1_000_000
+MANIFEST_VERSION = 1
+# Under the build's out dir: the tools_seed.json and tool_similar.csv that were last seeded remotely.
+DEPLOYED_DIR = "deployed"
+
+TOOL_COLUMNS = ("slug", "name", "category", "tags", "description", "website_url", "domain", "quality_status")
+# migrations/0003_tools_fts.sql keeps tools_fts in sync through triggers on tools; full seeds drop
+# them for the bulk load and rebuild the index in one pass afterwards.
+FTS_REBUILD = "INSERT INTO tools_fts(tools_fts) VALUES ('rebuild');"
+
+
+def sql_escape(value: str) -> str:
+    return value.replace("'", "''")
+
+
+def sql_literal(value: object) -> str:
+    if value is None:
+        return "NULL"
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return str(value)
+    return f"'{sql_escape(str(value))}'"
+
+
+def insert_statements(
+    table: str,
+    columns: Sequence[str],
+    rows: Iterable[Sequence[object]],
+    max_bytes: int = DEFAULT_STATEMENT_BYTES,
+    suffix: str = "",
+) -> Iterator[str]:
+    """Multi-row ``INSERT ... VALUES (...), (...)`` statements, each at most ``max_bytes`` long.
+
+    ``suffix`` is appended before the semicolon (e.g. an ``ON CONFLICT`` clause).
+    """
+    if max_bytes > MAX_STATEMENT_BYTES:
+        raise ValueError(f"statements over {MAX_STATEMENT_BYTES} bytes are rejected by D1")
+    prefix = f"INSERT INTO {table} ({', '.join(columns)}) VALUES\n"
+    tail = f"{suffix};"
+    fixed = len(prefix.encode()) + len(tail.encode())
+    values: list[str] = []
+    size = fixed
+    for row in rows:
+        value = "(" + ", ".join(sql_literal(item) for item in row) + ")"
+        value_bytes = len(value.encode()) + 2  # ",\n"
+        if fixed + value_bytes > max_bytes:
+            raise ValueError(f"row too large for one statement: {value[:80]}...")
+        if values and size + value_bytes > max_bytes:
+            yield prefix + ",\n".join(values) + tail
+            values, size = [], fixed
+        values.append(value)
+        size += value_bytes
+    if values:
+        yield prefix + ",\n".join(values) + tail
+
+
+def delete_statements(
+    table: str, column: str, values: Iterable[object], max_bytes: int = DEFAULT_STATEMENT_BYTES
+) -> Iterator[str]:
+    """``DELETE FROM table WHERE column IN (...)`` statements, each at most ``max_bytes`` long."""
+    prefix = f"DELETE FROM {table} WHERE {column} IN ("
+    fixed = len(prefix.encode()) + 2
+    batch: list[str] = []
+    size = fixed
+    for value in values:
+        literal = sql_literal(value)
+        literal_bytes = len(literal.encode()) + 2
+        if batch and size + literal_bytes > max_bytes:
+            yield prefix + ", ".join(batch) + ");"
+            batch, size = [], fixed
+        batch.append(literal)
+        size += literal_bytes
+    if batch:
+        yield prefix + ", ".join(batch) + ");"
+
+
+def upsert_suffix(key: str, columns: Sequence[str]) -> str:
+    """``ON CONFLICT`` clause for ``insert_statements`` that updates in place and keeps created_at."""
+    updates = ", ".join(f"{column} = excluded.{column}" for column in columns if column != key)
+    return f"\nON CONFLICT({key}) DO UPDATE SET {updates}, updated_at = CURRENT_TIMESTAMP"
+
+
+def pack_chunks(statements: Iterable[str], max_bytes: int = DEFAULT_CHUNK_BYTES) -> list[list[str]]:
+    chunks: list[list[str]] = []
+    size = 0
+    for statement in statements:
+        statement_bytes = len(statement.encode()) + 1
+        if not chunks or (chunks[-1] and size + statement_bytes > max_bytes):
+            chunks.append([])
+            size = 0
+        chunks[-1].append(statement)
+        size += statement_bytes
+    return chunks
+
+
+def write_chunks(
+    statements: Sequence[str],
+    out_dir: Path,
+    max_chunk_bytes: int = DEFAULT_CHUNK_BYTES,
+    header: str = "-- Generated by scripts/build_dataset.py",
+    sources: Sequence[Path] = (),
+) -> dict:
+    """Write ``seed-0001.sql``... plus ``manifest.json`` listing them in apply order.
+
+    D1 runs each file as one batch and refuses explicit BEGIN/COMMIT, so a chunk is the
+    unit of atomicity; chunk files from a previous build are removed first. ``sources`` are
+    the build outputs the chunks were generated from; their hashes let seed_d1.py record
+    exactly what went live.
+    """
+    out_dir.mkdir(parents=True, exist_ok=True)
+    for stale in out_dir.glob("seed-*.sql"):
+        stale.unlink()
+    entries = []
+    for idx, chunk in enumerate(pack_chunks(statements, max_chunk_bytes), 1):
+        name = f"seed-{idx:04d}.sql"
+        body = f"{header}\n" + "\n".join(chunk) + "\n"
+        (out_dir / name).write_text(body, encoding="utf-8")
+        encoded = body.encode()
+        entries.append(
+            {
+                "file": name,
+                "statements": len(chunk),
+                "bytes": len(encoded),
+                "sha256": hashlib.sha256(encoded).hexdigest(),
+            }
+        )
+    manifest = {
+        "version": MANIFEST_VERSION,
+        "chunks": entries,
+        "total_statements": sum(entry["statements"] for entry in entries),
+        "total_bytes": sum(entry["bytes"] for entry in entries),
+        "sources": {path.name: hashlib.sha256(path.read_bytes()).hexdigest() for path in sources},
+    }
+    (out_dir / "manifest.json").write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+    return manifest
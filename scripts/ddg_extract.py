@@ -0,0 +1,118 @@
+"""Streaming extraction of organic results from DuckDuckGo HTML result pages."""
+
+from __future__ import annotations
+
+from html.parser import HTMLParser
+from typing import Callable
+from urllib.parse import parse_qs, unquote, urlparse
+
+CHUNK_SIZE = 8192
+
+# (url, domain, title), the same shape as search_backends.SearchHit.
+Hit = tuple[str, str, str]
+
+
+def extract_ddg_target(href: str) -> str:
+    if not href:
+        return ""
+    if href.startswith("//duckduckgo.com/l/?"):
+        href = "https:" + href
+    if "duckduckgo.com/l/?" not in href:
+        return href
+    query = parse_qs(urlparse(href).query)
+    uddg = query.get("uddg", [""])[0]
+    return unquote(uddg)
+
+
+class ResultExtractor(HTMLParser):
+    """Collects the first ``.result__a`` anchor of each ``.result`` element and nothing else.
+
+    No tree is built: outside a result anchor, start/end tags only update a depth counter.
+    ``keep`` filters hits before they count towards ``limit``; once ``limit`` is reached
+    the remaining events are ignored and ``extract_results`` stops feeding.
+    """
+
+    def __init__(self, limit: int | None = None, keep: Callable[[Hit], bool] | None = None) -> None:
+        super().__init__(convert_charrefs=True)
+        self.limit = limit
+        self.keep = keep
+        self.hits: list[Hit] = []
+        self.done = limit is not None and limit <= 0
+        self.result_tag = ""
+        self.result_depth = 0
+        self.anchor_taken = False
+        self.href: str | None = None
+        self.title: list[str] = []
+        self.run: list[str] = []
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        if self.done:
+            return
+        if self.href is not None:
+            self._end_run()
+            return
+        classes = ()
+        for name, value in attrs:
+            if name == "class" and value:
+                classes = value.split()
+                break
+        if self.result_depth:
+            if tag == self.result_tag:
+                self.result_depth += 1
+            if tag == "a" and not self.anchor_taken and "result__a" in classes:
+                self.anchor_taken = True
+                self.href = next((value or "" for name, value in attrs if name == "href"), "")
+                self.title = []
+                self.run = []
+        elif "result" in classes:
+            self.result_tag = tag
+            self.result_depth = 1
+            self.anchor_taken = False
+
+    def handle_endtag(self, tag: str) -> None:
+        if self.done:
+            return
+        if self.href is not None:
+            self._end_run()
+            if tag == "a":
+                self._finish_anchor()
+            return
+        if self.result_depth and tag == self.result_tag:
+            self.result_depth -= 1
+
+    def handle_data(self, data: str) -> None:
+        if self.href is not None and not self.done:
+            self.run.append(data)
+
+    def _end_run(self) -> None:
+        # Matches BeautifulSoup's get_text(" ", strip=True): each text node stripped, blanks dropped.
+        text = "".join(self.run).strip()
+        if text:
+            self.title.append(text)
+        self.run = []
+
+    def _finish_anchor(self) -> None:
+        target = extract_ddg_target(self.href or "")
+        self.href = None
+        if not target.startswith(("http://", "https://")):
+            return
+        domain = urlparse(target).netloc.lower()
+        if not domain:
+            return
+        hit = (target, domain, " ".join(self.title))
+        if self.keep is not None and not self.keep(hit):
+            return
+        self.hits.append(hit)
+        if self.limit is not None and len(self.hits) >= self.limit:
+            self.done = True
+
+
+def extract_results(page: str, limit: int | None = None, keep: Callable[[Hit], bool] | None = None) -> list[Hit]:
+    """Result hits in page order, stopping after ``limit`` hits that pass ``keep``."""
+    parser = ResultExtractor(limit, keep)
+    for start in range(0, len(page), CHUNK_SIZE):
+        parser.feed(page[start : start + CHUNK_SIZE])
+        if parser.done:
+            return parser.hits
+    parser.close()
+    return parser.hits
@@ -0,0 +1,207 @@
+"""Bulk DNS pre-resolution with a persistent cache and an aiohttp resolver that reuses it."""
+
+from __future__ import annotations
+
+import asyncio
+import ipaddress
+import socket
+import sqlite3
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, Protocol
+
+from aiohttp.abc import AbstractResolver, ResolveResult
+from aiohttp.resolver import DefaultResolver
+
+DEAD_OUTCOMES = {"nxdomain", "servfail"}
+SQLITE_MAX_VARIABLES = 900
+
+
+class DnsLookupError(Exception):
+    def __init__(self, outcome: str, message: str = "") -> None:
+        super().__init__(message or outcome)
+        self.outcome = outcome
+
+
+class HostResolver(Protocol):
+    async def resolve(self, host: str) -> list[str]:
+        """Return addresses for ``host`` or raise DnsLookupError."""
+
+
+@dataclass
+class DnsEntry:
+    host: str
+    outcome: str
+    addresses: list[str]
+    resolved_at: float
+
+    @property
+    def dead(self) -> bool:
+        return self.outcome in DEAD_OUTCOMES
+
+
+class SystemResolver:
+    """Resolve through the OS resolver, mapping getaddrinfo errors to DNS outcomes."""
+
+    def __init__(self, timeout: float = 5.0) -> None:
+        self.timeout = timeout
+
+    async def resolve(self, host: str) -> list[str]:
+        loop = asyncio.get_running_loop()
+        try:
+            infos = await asyncio.wait_for(
+                loop.getaddrinfo(host, None, type=socket.SOCK_STREAM), timeout=self.timeout
+            )
+        except asyncio.TimeoutError as exc:
+            raise DnsLookupError("timeout") from exc
+        except socket.gaierror as exc:
+            if exc.errno in (socket.EAI_NONAME, getattr(socket, "EAI_NODATA", socket.EAI_NONAME)):
+                raise DnsLookupError("nxdomain", str(exc)) from exc
+            if exc.errno == socket.EAI_FAIL:
+                raise DnsLookupError("servfail", str(exc)) from exc
+            raise DnsLookupError("error", str(exc)) from exc
+        except ValueError as exc:
+            # UnicodeError from the idna codec: empty labels ("ex..com") or labels over 63 characters.
+            raise DnsLookupError("error", str(exc)) from exc
+        return list(dict.fromkeys(info[4][0] for info in infos))
+
+
+class StaticResolver:
+    """In-memory resolver for offline runs: values are address lists or a failure outcome."""
+
+    def __init__(self, table: dict[str, list[str] | str], default: list[str] | str = "nxdomain") -> None:
+        self.table = table
+        self.default = default
+        self.lookups = 0
+
+    async def resolve(self, host: str) -> list[str]:
+        self.lookups += 1
+        value = self.table.get(host, self.default)
+        if isinstance(value, str):
+            raise DnsLookupError(value)
+        return list(value)
+
+
+class DnsCache:
+    def __init__(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS dns_hosts (
+              host TEXT PRIMARY KEY,
+              outcome TEXT NOT NULL,
+              addresses TEXT NOT NULL,
+              resolved_at REAL NOT NULL
+            )
+            """
+        )
+        self.conn.commit()
+
+    def get_many(self, hosts: Iterable[str]) -> dict[str, DnsEntry]:
+        unique = list(dict.fromkeys(hosts))
+        found: dict[str, DnsEntry] = {}
+        for start in range(0, len(unique), SQLITE_MAX_VARIABLES):
+            batch = unique[start : start + SQLITE_MAX_VARIABLES]
+            placeholders = ",".join("?" for _ in batch)
+            rows = self.conn.execute(
+                f"SELECT host, outcome, addresses, resolved_at FROM dns_hosts WHERE host IN ({placeholders})", batch
+            )
+            for host, outcome, addresses, resolved_at in rows:
+                found[host] = DnsEntry(host, outcome, [a for a in addresses.split(",") if a], resolved_at)
+        return found
+
+    def put_many(self, entries: Iterable[DnsEntry]) -> None:
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO dns_hosts (host, outcome, addresses, resolved_at) VALUES (?, ?, ?, ?)",
+                [(e.host, e.outcome, ",".join(e.addresses), e.resolved_at) for e in entries],
+            )
+
+    def close(self) -> None:
+        self.conn.close()
+
+
+async def resolve_hosts(
+    hosts: Iterable[str],
+    resolver: HostResolver,
+    concurrency: int = 200,
+    cache: DnsCache | None = None,
+    ttl_sec: float = 12 * 3600,
+) -> dict[str, DnsEntry]:
+    """Resolve every unique host concurrently, reusing cache entries younger than ``ttl_sec``."""
+    unique = [host for host in dict.fromkeys(hosts) if host]
+    now = time.time()
+    entries = {
+        host: entry
+        for host, entry in (cache.get_many(unique) if cache else {}).items()
+        if now - entry.resolved_at < ttl_sec
+    }
+    sem = asyncio.Semaphore(concurrency)
+
+    async def lookup(host: str) -> DnsEntry:
+        async with sem:
+            try:
+                addresses = await resolver.resolve(host)
+                return DnsEntry(host, "ok" if addresses else "nxdomain", addresses, time.time())
+            except DnsLookupError as exc:
+                return DnsEntry(host, exc.outcome, [], time.time())
+            except Exception:
+                # One bad host must not abort the whole stage; "error" is retried on the next run.
+                return DnsEntry(host, "error", [], time.time())
+
+    fresh = await asyncio.gather(*(lookup(host) for host in unique if host not in entries))
+    if cache and fresh:
+        # Transient failures are not worth persisting; the next run should retry them.
+        cache.put_many(entry for entry in fresh if entry.outcome in DEAD_OUTCOMES or entry.outcome == "ok")
+    entries.update((entry.host, entry) for entry in fresh)
+    return entries
+
+
+class PreResolvedResolver(AbstractResolver):
+    """aiohttp resolver that answers from pre-resolved entries and falls back to the default resolver."""
+
+    def __init__(self, entries: dict[str, DnsEntry], fallback: AbstractResolver | None = None) -> None:
+        self.entries = entries
+        self.fallback = fallback
+        self.hits = 0
+        self.misses = 0
+
+    async def resolve(
+        self, host: str, port: int = 0, family: socket.AddressFamily = socket.AF_INET
+    ) -> list[ResolveResult]:
+        entry = self.entries.get(host)
+        results: list[ResolveResult] = []
+        if entry is not None and entry.outcome == "ok":
+            for address in entry.addresses:
+                try:
+                    addr_family = socket.AF_INET6 if ipaddress.ip_address(address).version == 6 else socket.AF_INET
+                except ValueError:
+                    continue
+                if family not in (socket.AF_UNSPEC, addr_family):
+                    continue
+                results.append(
+                    ResolveResult(
+                        hostname=host,
+                        host=address,
+                        port=port,
+                        family=addr_family,
+                        proto=0,
+                        flags=socket.AI_NUMERICHOST,
+                    )
+                )
+        if results:
+            self.hits += 1
+            return results
+        if entry is not None and entry.dead:
+            raise OSError(f"DNS lookup failed for {host}: {entry.outcome}")
+        self.misses += 1
+        if self.fallback is None:
+            self.fallback = DefaultResolver()
+        return await self.fallback.resolve(host, port, family)
+
+    async def close(self) -> None:
+        if self.fallback is not None:
+            await self.fallback.close()
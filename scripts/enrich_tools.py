@@ -15,6 +15,13 @@ import aiohttp
 import pandas as pd
 import requests
 
+from adaptive_concurrency import AdaptiveLimiter
+from crawl_metrics import CrawlMetrics
+from dns_stage import DnsEntry, PreResolvedResolver
+from host_scheduler import HostScheduler
+from probe import probe_url
+from sheet_loader import load_table
+
 SOURCE_URLS = [
     "https://raw.githubusercontent.com/mahseema/awesome-ai-tools/main/README.md",
     "https://raw.githubusercontent.com/tankvn/awesome-ai-tools/master/README.md",
@@ -183,39 +190,42 @@ def parse_markdown_sources(existing_roots: set[str]) -> pd.DataFrame:
     return pd.DataFrame(records).drop_duplicates(subset=["domain"])
 
 
-async def validate_urls(urls: list[str], concurrency: int) -> dict[str, int]:
+async def validate_urls(
+    urls: list[str],
+    concurrency: int,
+    per_host: int = 4,
+    per_domain: int = 8,
+    dns_entries: dict[str, DnsEntry] | None = None,
+    trace_configs: list[aiohttp.TraceConfig] | None = None,
+    metrics: CrawlMetrics | None = None,
+    limiter: AdaptiveLimiter | None = None,
+) -> dict[str, int]:
+    trace_configs = list(trace_configs or [])
+    if metrics is not None:
+        trace_configs.append(metrics.trace_config())
+    scheduler = HostScheduler(concurrency, per_host=per_host, per_domain=per_domain, limiter=limiter)
     timeout = aiohttp.ClientTimeout(total=14, connect=6, sock_connect=6, sock_read=8)
-    connector = aiohttp.TCPConnector(limit=max(concurrency + 20, 40), ttl_dns_cache=300)
-    semaphore = asyncio.Semaphore(concurrency)
+    connector = aiohttp.TCPConnector(
+        limit=max(scheduler.capacity + 20, 40),
+        ttl_dns_cache=300,
+        resolver=PreResolvedResolver(dns_entries) if dns_entries else None,
+    )
     statuses: dict[str, int] = {}
     headers = {"User-Agent": "Mozilla/5.0 (compatible; FindAIDirBot/1.0)"}
 
-    retry_statuses = {400, 401, 403, 405, 406, 409, 418, 421, 429, 500, 501, 502, 503, 504, 520, 521, 525, 526, 530}
-
-    async with aiohttp.ClientSession(timeout=timeout, connector=connector, headers=headers) as session:
+    async with aiohttp.ClientSession(
+        timeout=timeout, connector=connector, headers=headers, trace_configs=trace_configs
+    ) as session:
         async def check(url: str) -> tuple[str, int]:
-            async with semaphore:
-                status = -1
-                try:
-                    async with session.head(url, allow_redirects=True) as response:
-                        status = response.status
-                    if status in retry_statuses:
-                        async with session.get(url, allow_redirects=True, headers={"Range": "bytes=0-512"}) as response:
-                            status = response.status
-                except Exception:
-                    try:
-                        async with session.get(url, allow_redirects=True, headers={"Range": "bytes=0-512"}) as response:
-                            status = response.status
-                    except Exception:
-                        status = -1
-                return url, status
+            result = await probe_url(session, scheduler, url, metrics=metrics)
+            return url, result.status
 
         tasks = [check(url) for url in urls]
         for idx, result in enumerate(await asyncio.gather(*tasks), 1):
             url, status = result
             statuses[url] = status
             if idx % 100 == 0 or idx == len(urls):
-                print(f"validated={idx}/{len(urls)}")
+                print(f"validated={idx}/{len(urls)} concurrency={scheduler.level}")
 
     return statuses
 
@@ -226,7 +236,16 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--out-csv", type=Path, default=Path("audit/new_tools_verified.csv"))
     parser.add_argument("--max-checks", type=int, default=900, help="Max candidate homepages to validate")
     parser.add_argument("--max-add", type=int, default=220, help="Max validated tools to output")
-    parser.add_argument("--concurrency", type=int, default=60)
+    parser.add_argument("--concurrency", type=int, default=60, help="Concurrent checks (starting level when adaptive)")
+    parser.add_argument("--max-concurrency", type=int, default=400, help="Ceiling for the adaptive limit")
+    parser.add_argument(
+        "--adaptive",
+        action=argparse.BooleanOptionalAction,
+        default=True,
+        help="Tune the in-flight limit from timeout/error rate and latency (AIMD)",
+    )
+    parser.add_argument("--per-host", type=int, default=4, help="Concurrent checks per host")
+    parser.add_argument("--per-domain", type=int, default=8, help="Concurrent checks per registrable domain")
     return parser.parse_args()
 
 
@@ -235,7 +254,7 @@ def main() -> None:
     started = time.time()
     args.out_csv.parent.mkdir(parents=True, exist_ok=True)
 
-    existing = pd.read_csv(args.existing_csv)
+    existing = load_table(args.existing_csv, ["domain"])
     existing_roots = set(existing["domain"].astype(str).apply(root_domain))
 
     candidates = parse_markdown_sources(existing_roots)
@@ -245,7 +264,19 @@ def main() -> None:
         return
 
     candidates = candidates.sort_values(by=["score", "name"], ascending=[False, True]).head(args.max_checks).copy()
-    statuses = asyncio.run(validate_urls(candidates["website"].tolist(), args.concurrency))
+    metrics = CrawlMetrics("enrich_tools")
+    metrics.limiter = AdaptiveLimiter.from_args(args.concurrency, args.max_concurrency, args.adaptive)
+    statuses = asyncio.run(
+        validate_urls(
+            candidates["website"].tolist(),
+            args.concurrency,
+            args.per_host,
+            args.per_domain,
+            metrics=metrics,
+            limiter=metrics.limiter,
+        )
+    )
+    metrics.write(args.out_csv.parent, "enrich_crawl_metrics")
     candidates["status"] = candidates["website"].map(statuses).fillna(-1).astype(int)
 
     accepted = candidates[(candidates["status"] >= 200) & (candidates["status"] < 400)].copy().head(args.max_add)
@@ -0,0 +1,130 @@
+"""Host-aware request scheduling for the async crawl scripts."""
+
+from __future__ import annotations
+
+import asyncio
+import random
+import time
+from contextlib import asynccontextmanager
+from email.utils import parsedate_to_datetime
+from typing import AsyncIterator, Mapping
+from urllib.parse import urlparse
+
+from adaptive_concurrency import AdaptiveLimiter
+
+BACKOFF_STATUSES = {429, 503}
+
+
+def registrable_domain(host: str) -> str:
+    host = host.lower().strip()
+    if host.startswith("www."):
+        host = host[4:]
+    parts = host.split(".")
+    if len(parts) <= 2:
+        return host
+    if (
+        parts[-1] in {"uk", "au", "in", "jp", "nz", "za", "br"}
+        and parts[-2] in {"co", "com", "org", "net", "gov", "edu"}
+        and len(parts) >= 3
+    ):
+        return ".".join(parts[-3:])
+    return ".".join(parts[-2:])
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at is None:
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+class HostScheduler:
+    """Caps in-flight requests globally, per host and per registrable domain.
+
+    Requests wait for their host and domain slots (and any active backoff) before
+    taking a global slot, so a throttled host never idles the shared pool. With a
+    ``limiter`` the global cap is adaptive and ``concurrency`` is ignored.
+    """
+
+    def __init__(
+        self,
+        concurrency: int,
+        per_host: int = 4,
+        per_domain: int = 8,
+        base_backoff: float = 1.0,
+        max_backoff: float = 60.0,
+        max_retries: int = 3,
+        limiter: AdaptiveLimiter | None = None,
+    ) -> None:
+        self.concurrency = concurrency
+        self.limiter = limiter
+        self.global_sem = asyncio.Semaphore(concurrency)
+        self.per_host = per_host
+        self.per_domain = per_domain
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+        self.max_retries = max_retries
+        self.host_sems: dict[str, asyncio.Semaphore] = {}
+        self.domain_sems: dict[str, asyncio.Semaphore] = {}
+        self.not_before: dict[str, float] = {}
+        self.failures: dict[str, int] = {}
+        self.backoffs = 0
+
+    @property
+    def capacity(self) -> int:
+        """Most requests that can ever be in flight at once."""
+        return self.limiter.ceiling if self.limiter else self.concurrency
+
+    @property
+    def level(self) -> int:
+        return self.limiter.limit if self.limiter else self.concurrency
+
+    @staticmethod
+    def host_of(url: str) -> str:
+        return (urlparse(url).hostname or "").lower()
+
+    @asynccontextmanager
+    async def slot(self, url: str) -> AsyncIterator[None]:
+        host = self.host_of(url)
+        domain = registrable_domain(host)
+        domain_sem = self.domain_sems.setdefault(domain, asyncio.Semaphore(self.per_domain))
+        host_sem = self.host_sems.setdefault(host, asyncio.Semaphore(self.per_host))
+        async with domain_sem, host_sem:
+            while True:
+                wait = self.not_before.get(host, 0.0) - time.monotonic()
+                if wait <= 0:
+                    break
+                await asyncio.sleep(wait)
+            if self.limiter is None:
+                async with self.global_sem:
+                    yield
+            else:
+                async with self.limiter.slot():
+                    yield
+
+    def record(self, url: str, status: int, headers: Mapping[str, str] | None = None) -> float:
+        """Update host backoff from a response and return the delay imposed (0 when none)."""
+        host = self.host_of(url)
+        if status not in BACKOFF_STATUSES:
+            if status > 0:
+                self.failures.pop(host, None)
+            return 0.0
+
+        failures = self.failures.get(host, 0) + 1
+        self.failures[host] = failures
+        delay = parse_retry_after((headers or {}).get("Retry-After"))
+        if delay is None:
+            delay = self.base_backoff * (2 ** (failures - 1))
+            delay += random.uniform(0, delay / 4)
+        delay = min(delay, self.max_backoff)
+        self.not_before[host] = max(self.not_before.get(host, 0.0), time.monotonic() + delay)
+        self.backoffs += 1
+        return delay
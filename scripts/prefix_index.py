@@ -0,0 +1,164 @@
+"""Static autocomplete index over tool names, tags and categories, sharded by term prefix."""
+
+from __future__ import annotations
+
+import json
+import unicodedata
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from static_snapshot import API_FIELDS, publish_version
+
+# Queries shorter than this are not looked up; root shards are keyed by this many characters.
+MIN_PREFIX_CHARS = 2
+# Split shards stop growing a character here; deeper terms are truncated to fit the size cap.
+MAX_PREFIX_CHARS = 8
+MAX_TERM_CHARS = 48
+# Suffixes of a name are indexed from each of its first words, so "gpt" finds "Chat GPT Writer".
+MAX_NAME_WORDS = 4
+IDS_PER_TERM = 6
+# A shard over the size cap keeps its best terms for queries that end at its prefix and hands
+# longer queries to one child shard per next character.
+TOP_TERMS = 40
+DEFAULT_SHARD_BYTES = 6_000
+# n: name starts with the term, w: a later word does, t: tag, c: category. Same order in public/app.js.
+KIND_ORDER = {"n": 0, "w": 1, "t": 2, "c": 3}
+
+
+@lru_cache(maxsize=1 << 16)
+def normalize(text: str) -> str:
+    """Lowercase, strip diacritics and keep letter/digit runs separated by one space (as public/app.js)."""
+    decomposed = unicodedata.normalize("NFKD", str(text).lower())
+    chars = []
+    for char in decomposed:
+        category = unicodedata.category(char)
+        if category[0] in "LN":
+            chars.append(char)
+        elif category[0] != "M" and chars and chars[-1] != " ":
+            chars.append(" ")
+    return "".join(chars).strip()
+
+
+def shard_name(prefix: str) -> str:
+    return prefix.encode().hex() + ".json"
+
+
+def term_table(items: pd.DataFrame) -> pd.DataFrame:
+    """One row per (term, kind): tool count, best tool ids (positions in ``items``) and a display label."""
+    # Shorter names first: "Notion" ranks above "Notion AI Meeting Notes" for "not".
+    order = np.lexsort((items["name"].to_numpy(), items["name"].str.len().to_numpy()))
+    preference = np.empty(len(items), dtype=np.int64)
+    preference[order] = np.arange(len(items))
+
+    rows = []
+    for tool, (name, category, tags) in enumerate(items[["name", "category", "tags"]].itertuples(index=False)):
+        words = normalize(name).split(" ")
+        for position in range(min(len(words), MAX_NAME_WORDS)):
+            rows.append((" ".join(words[position:])[:MAX_TERM_CHARS].rstrip(), "w" if position else "n", tool, ""))
+        for tag in str(tags).split(","):
+            if tag.strip():
+                rows.append((normalize(tag)[:MAX_TERM_CHARS].rstrip(), "t", tool, tag.strip()))
+        rows.append((normalize(category)[:MAX_TERM_CHARS].rstrip(), "c", tool, category))
+    terms = pd.DataFrame(rows, columns=["term", "kind", "tool", "label"])
+    terms = terms[terms["term"].str.len() >= MIN_PREFIX_CHARS]
+    terms = terms.assign(preference=preference[terms["tool"].to_numpy()]).sort_values(["term", "kind", "preference"])
+    terms = terms.drop_duplicates(["term", "kind", "tool"])
+
+    grouped = terms.groupby(["term", "kind"], sort=False)
+    table = grouped.agg(count=("tool", "size"), label=("label", "first")).reset_index()
+    ids = terms[grouped.cumcount() < IDS_PER_TERM].groupby(["term", "kind"], sort=False)["tool"].agg(list)
+    table = table.join(ids.rename("ids"), on=["term", "kind"])
+    table.loc[table["kind"].isin(["t", "c"]), "ids"] = None
+
+    rank = table.assign(
+        kind_order=table["kind"].map(KIND_ORDER), negative_count=-table["count"], length=table["term"].str.len()
+    ).sort_values(["kind_order", "negative_count", "length", "term"])
+    table["rank"] = pd.Series(np.arange(len(table)), index=rank.index)
+    return table.sort_values(["term", "rank"], ignore_index=True)
+
+
+def _shard_body(records: list[list], picked: list[int], tools: list[list[str]], split: bool) -> bytes:
+    local: dict[int, int] = {}
+    terms = []
+    for index in picked:
+        term, kind, count, ids, label = records[index]
+        if ids is None:
+            terms.append([term, kind, count, label])
+        else:
+            terms.append([term, kind, count, [local.setdefault(tool, len(local)) for tool in ids]])
+    payload = {"tools": [tools[tool] for tool in local], "terms": terms}
+    if split:
+        payload["split"] = True
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+def _prefix_ranges(terms: list[str], lo: int, hi: int, length: int):
+    """``(prefix, start, end)`` runs of sorted ``terms[lo:hi]`` sharing their first ``length`` characters."""
+    start = lo
+    while start < hi and len(terms[start]) < length:
+        start += 1
+    while start < hi:
+        prefix = terms[start][:length]
+        end = start + 1
+        while end < hi and terms[end].startswith(prefix):
+            end += 1
+        yield prefix, start, end
+        start = end
+
+
+def build_shards(table: pd.DataFrame, items: pd.DataFrame, max_bytes: int = DEFAULT_SHARD_BYTES) -> dict[str, bytes]:
+    """``{"<hex prefix>.json": payload}``: every shard is at most ``max_bytes`` unless one term alone is larger."""
+    terms = table["term"].tolist()
+    ids = [None if value is None else [int(tool) for tool in value] for value in table["ids"]]
+    records = [list(row) for row in zip(terms, table["kind"], table["count"].astype(int).tolist(), ids, table["label"])]
+    rank = table["rank"].to_numpy()
+    tools = items[["slug", "name"]].to_numpy().tolist()
+    # Bytes of the term entries alone: a lower bound on the shard, to split big ranges without serializing them.
+    term_bytes = np.cumsum([0] + [len(json.dumps(record, ensure_ascii=False).encode()) for record in records])
+
+    def best(lo: int, hi: int, limit: int) -> list[int]:
+        if hi - lo <= limit:
+            return list(range(lo, hi))
+        return sorted((lo + np.argpartition(rank[lo:hi], limit - 1)[:limit]).tolist())
+
+    files = {}
+    pending = list(_prefix_ranges(terms, 0, len(terms), MIN_PREFIX_CHARS))
+    while pending:
+        prefix, lo, hi = pending.pop()
+        picked = list(range(lo, hi))
+        body = _shard_body(records, picked, tools, False) if term_bytes[hi] - term_bytes[lo] <= max_bytes else None
+        split = (body is None or len(body) > max_bytes) and len(prefix) < MAX_PREFIX_CHARS
+        if split:
+            pending += _prefix_ranges(terms, lo, hi, len(prefix) + 1)
+            picked = best(lo, hi, TOP_TERMS)
+            body = _shard_body(records, picked, tools, True)
+        limit = len(picked)
+        while (body is None or len(body) > max_bytes) and limit > 1:
+            limit //= 2
+            picked = best(lo, hi, limit)
+            body = _shard_body(records, picked, tools, split)
+        files[shard_name(prefix)] = body
+    return files
+
+
+def write_prefix_index(rows: pd.DataFrame, out_dir: Path, max_bytes: int = DEFAULT_SHARD_BYTES) -> dict:
+    """Write ``v/<version>/<hex prefix>.json`` shards plus ``manifest.json`` under ``out_dir``."""
+    items = rows[list(API_FIELDS)].rename(columns=API_FIELDS).astype(str)
+    items = items[~items["quality_status"].str.startswith("invalid")].reset_index(drop=True)
+    table = term_table(items)
+    files = build_shards(table, items, max_bytes)
+    manifest = {"minChars": MIN_PREFIX_CHARS, "maxTermChars": MAX_TERM_CHARS}
+    version, previous = publish_version(files, out_dir, manifest)
+    sizes = sorted(len(body) for body in files.values())
+    return {
+        "version": version,
+        "previous_version": previous,
+        "terms": len(table),
+        "files": len(files),
+        "bytes": sum(sizes),
+        "max_shard_bytes": sizes[-1] if sizes else 0,
+        "median_shard_bytes": sizes[len(sizes) // 2] if sizes else 0,
+    }
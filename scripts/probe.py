@@ -0,0 +1,114 @@
+"""Single-pass async URL probe shared by the audit, enrich and placeholder scripts."""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass, field
+
+import aiohttp
+
+from crawl_metrics import CrawlMetrics
+from host_scheduler import BACKOFF_STATUSES, HostScheduler
+
+RETRY_STATUSES = {400, 401, 403, 405, 406, 409, 418, 421, 429, 500, 501, 502, 503, 504, 520, 521, 525, 526, 530}
+LIVENESS_RANGE_BYTES = 1024
+
+
+@dataclass
+class ProbeResult:
+    url: str
+    status: int = -1
+    method: str = "HEAD"
+    path: str = "HEAD"
+    final_url: str = ""
+    redirect_chain: list[str] = field(default_factory=list)
+    elapsed_ms: float = 0.0
+    body: str = ""
+    etag: str = ""
+    last_modified: str = ""
+    attempts: int = 0
+    error: str = ""
+
+    @property
+    def ok(self) -> bool:
+        return 200 <= self.status < 400
+
+
+def _apply_response(result: ProbeResult, response: aiohttp.ClientResponse) -> None:
+    result.status = response.status
+    result.final_url = str(response.url)
+    result.redirect_chain = [str(hop.url) for hop in response.history]
+    result.etag = response.headers.get("ETag", "")
+    result.last_modified = response.headers.get("Last-Modified", "")
+
+
+async def _get(
+    session: aiohttp.ClientSession,
+    scheduler: HostScheduler,
+    result: ProbeResult,
+    body_bytes: int,
+) -> None:
+    range_bytes = body_bytes or LIVENESS_RANGE_BYTES
+    result.method = "GET"
+    result.path = "GET" if body_bytes else "HEAD>GET"
+    for _ in range(scheduler.max_retries + 1):
+        result.attempts += 1
+        async with scheduler.slot(result.url):
+            started = time.perf_counter()
+            try:
+                async with session.get(
+                    result.url, allow_redirects=True, headers={"Range": f"bytes=0-{range_bytes - 1}"}
+                ) as response:
+                    _apply_response(result, response)
+                    scheduler.record(result.url, response.status, response.headers)
+                    if body_bytes and response.status not in BACKOFF_STATUSES:
+                        # Servers that ignore Range still only cost body_bytes of reading.
+                        raw = await response.content.read(body_bytes)
+                        result.body = raw.decode(response.charset or "utf-8", errors="ignore")
+            finally:
+                result.elapsed_ms += (time.perf_counter() - started) * 1000
+        if result.status not in BACKOFF_STATUSES:
+            return
+
+
+async def probe_url(
+    session: aiohttp.ClientSession,
+    scheduler: HostScheduler,
+    url: str,
+    body_bytes: int = 0,
+    conditional: dict[str, str] | None = None,
+    metrics: CrawlMetrics | None = None,
+) -> ProbeResult:
+    """Probe ``url`` once for liveness and, when ``body_bytes`` is set, a bounded body prefix.
+
+    Without a body the probe starts with HEAD and falls back to a ranged GET on
+    retryable statuses or errors. With a body a single ranged GET serves both.
+    A conditional HEAD answered with 304 is returned as-is for the caller to resolve.
+    """
+    result = ProbeResult(url=url, final_url=url)
+    try:
+        if not body_bytes:
+            result.attempts += 1
+            try:
+                async with scheduler.slot(url):
+                    started = time.perf_counter()
+                    try:
+                        async with session.head(url, allow_redirects=True, headers=conditional or {}) as response:
+                            _apply_response(result, response)
+                            scheduler.record(url, response.status, response.headers)
+                    finally:
+                        result.elapsed_ms += (time.perf_counter() - started) * 1000
+                if result.status not in RETRY_STATUSES:
+                    return _finish(result, metrics)
+            except Exception:  # noqa: BLE001
+                pass
+        await _get(session, scheduler, result, body_bytes)
+    except Exception as exc:  # noqa: BLE001
+        result.error = str(exc).replace("\n", " ")[:220]
+    return _finish(result, metrics)
+
+
+def _finish(result: ProbeResult, metrics: CrawlMetrics | None) -> ProbeResult:
+    if metrics is not None:
+        metrics.record_probe(result.path if not result.error else f"{result.path}:error", result.attempts)
+    return result
@@ -4,19 +4,27 @@
 from __future__ import annotations
 
 import argparse
-import concurrent.futures
+import asyncio
 import json
 import re
 import subprocess
 import time
+from collections import Counter
 from dataclasses import asdict, dataclass
 from pathlib import Path
-from typing import Iterable
-from urllib.parse import parse_qs, unquote, urlparse
+from typing import Awaitable, Callable, Iterable, Sequence
+from urllib.parse import urlparse
 
+import aiohttp
 import pandas as pd
-import requests
-from bs4 import BeautifulSoup
+
+from adaptive_concurrency import AdaptiveLimiter
+from crawl_metrics import CrawlMetrics
+from dns_stage import DnsEntry, PreResolvedResolver
+from host_scheduler import HostScheduler
+from search_backends import DuckDuckGoBackend, FixtureBackend, SearchBackend, SearchCache, SearchHit, TokenBucket
+from sheet_loader import load_table
+from url_cache import CachedCheck, UrlHealthCache
 
 
 DIRECTORY_DOMAIN_BLACKLIST = {
@@ -36,6 +44,14 @@ DIRECTORY_DOMAIN_BLACKLIST = {
 }
 
 
+@dataclass
+class Candidate:
+    url: str
+    domain: str
+    title: str
+    confidence: float
+
+
 @dataclass
 class RecoveryRow:
     tool_name: str
@@ -53,18 +69,6 @@ def normalize_text(value: str) -> str:
     return re.sub(r"\s+", " ", cleaned)
 
 
-def extract_ddg_target(href: str) -> str:
-    if not href:
-        return ""
-    if href.startswith("//duckduckgo.com/l/?"):
-        href = "https:" + href
-    if "duckduckgo.com/l/?" not in href:
-        return href
-    query = parse_qs(urlparse(href).query)
-    uddg = query.get("uddg", [""])[0]
-    return unquote(uddg)
-
-
 def is_blacklisted(domain: str) -> bool:
     domain = domain.lower()
     return domain in DIRECTORY_DOMAIN_BLACKLIST
@@ -79,6 +83,113 @@ def curl_status(url: str) -> int:
         return -1
 
 
+async def head_status(session: aiohttp.ClientSession, scheduler: HostScheduler, url: str) -> int:
+    """In-process equivalent of ``curl_status``: final status of a redirect-following HEAD, -1 on failure."""
+    try:
+        async with scheduler.slot(url):
+            async with session.head(url, allow_redirects=True, max_redirects=50) as response:
+                scheduler.record(url, response.status, response.headers)
+                # curl reports 000 (mapped to -1 above) when it gets no status line at all.
+                return response.status or -1
+    except Exception:  # noqa: BLE001
+        return -1
+
+
+def open_session(
+    scheduler: HostScheduler,
+    dns_entries: dict[str, DnsEntry] | None = None,
+    trace_configs: list[aiohttp.TraceConfig] | None = None,
+    extra_connections: int = 0,
+) -> aiohttp.ClientSession:
+    connector = aiohttp.TCPConnector(
+        limit=max(scheduler.capacity + extra_connections + 20, 40),
+        ttl_dns_cache=300,
+        resolver=PreResolvedResolver(dns_entries) if dns_entries else None,
+    )
+    return aiohttp.ClientSession(
+        timeout=aiohttp.ClientTimeout(total=12),
+        connector=connector,
+        headers={"User-Agent": "Mozilla/5.0 (compatible; AIToolsDirectoryRecovery/1.0)"},
+        trace_configs=trace_configs,
+    )
+
+
+class CandidateValidator:
+    """Candidate statuses from the cache or a single shared HEAD per URL, however many tools list it."""
+
+    def __init__(
+        self,
+        session: aiohttp.ClientSession,
+        scheduler: HostScheduler,
+        cache: UrlHealthCache | None = None,
+        cache_ttl_sec: float = 0.0,
+        metrics: CrawlMetrics | None = None,
+    ) -> None:
+        self.session = session
+        self.scheduler = scheduler
+        self.cache = cache
+        self.cache_ttl_sec = cache_ttl_sec
+        self.metrics = metrics
+        self.checks: dict[str, asyncio.Task[int]] = {}
+        self.completed = 0
+
+    async def _check(self, url: str) -> int:
+        status = await head_status(self.session, self.scheduler, url)
+        if self.metrics is not None:
+            self.metrics.record_probe("HEAD" if status != -1 else "HEAD:error", 1)
+        self.completed += 1
+        if self.completed % 250 == 0:
+            print(f"validated={self.completed} concurrency={self.scheduler.level}")
+        return status
+
+    async def status(self, url: str) -> int:
+        return (await self.statuses([url]))[url]
+
+    async def statuses(self, urls: Iterable[str]) -> dict[str, int]:
+        unique = list(dict.fromkeys(urls))
+        found: dict[str, int] = {}
+        if self.cache is not None:
+            found = {
+                url: entry.status
+                for url, entry in self.cache.get_many(unique).items()
+                if entry.is_fresh(self.cache_ttl_sec)
+            }
+        started = []
+        for url in unique:
+            if url not in found and url not in self.checks:
+                self.checks[url] = asyncio.ensure_future(self._check(url))
+                started.append(url)
+        pending = [url for url in unique if url not in found]
+        for url, status in zip(pending, await asyncio.gather(*(self.checks[url] for url in pending))):
+            found[url] = status
+        if self.cache is not None and started:
+            now = time.time()
+            self.cache.put_many(CachedCheck(url, found[url], url, "", "", now) for url in started)
+        return found
+
+
+async def validate_candidates(
+    urls: Iterable[str],
+    concurrency: int,
+    per_host: int = 4,
+    per_domain: int = 8,
+    dns_entries: dict[str, DnsEntry] | None = None,
+    trace_configs: list[aiohttp.TraceConfig] | None = None,
+    metrics: CrawlMetrics | None = None,
+    limiter: AdaptiveLimiter | None = None,
+    cache: UrlHealthCache | None = None,
+    cache_ttl_sec: float = 0.0,
+) -> dict[str, int]:
+    """Check a batch of candidate URLs over one connection pool, reusing fresh cached statuses."""
+    trace_configs = list(trace_configs or [])
+    if metrics is not None:
+        trace_configs.append(metrics.trace_config())
+    scheduler = HostScheduler(concurrency, per_host=per_host, per_domain=per_domain, limiter=limiter)
+    async with open_session(scheduler, dns_entries, trace_configs) as session:
+        validator = CandidateValidator(session, scheduler, cache, cache_ttl_sec, metrics)
+        return await validator.statuses(urls)
+
+
 def score_candidate(tool_name: str, title: str, domain: str, url: str) -> float:
     tool = normalize_text(tool_name)
     title_norm = normalize_text(title)
@@ -102,116 +213,349 @@ def score_candidate(tool_name: str, title: str, domain: str, url: str) -> float:
     return min(score, 1.0)
 
 
-def fetch_candidates(session: requests.Session, tool_name: str, limit: int) -> list[tuple[str, str, str]]:
-    query = f"{tool_name} official website"
-    response = session.get(
-        "https://duckduckgo.com/html/",
-        params={"q": query},
-        timeout=15,
-        headers={"User-Agent": "Mozilla/5.0 (compatible; AIToolsDirectoryRecovery/1.0)"},
+def empty_row(tool_name: str, old_url: str, reason: str) -> RecoveryRow:
+    return RecoveryRow(
+        tool_name=tool_name,
+        old_url=old_url,
+        candidate_url="",
+        candidate_domain="",
+        http_status=-1,
+        confidence=0.0,
+        accepted=0,
+        reason=reason,
     )
-    response.raise_for_status()
-
-    soup = BeautifulSoup(response.text, "html.parser")
-    rows: list[tuple[str, str, str]] = []
-    for result in soup.select(".result"):
-        anchor = result.select_one(".result__a")
-        if not anchor:
-            continue
-        raw_href = anchor.get("href", "")
-        target = extract_ddg_target(raw_href)
-        if not target.startswith(("http://", "https://")):
-            continue
-        parsed = urlparse(target)
-        domain = parsed.netloc.lower()
-        if not domain or is_blacklisted(domain):
-            continue
-        title = anchor.get_text(" ", strip=True)
-        rows.append((target, domain, title))
-        if len(rows) >= limit:
-            break
-    return rows
 
 
-def choose_replacement(tool_name: str, old_url: str, candidates: Iterable[tuple[str, str, str]], min_confidence: float) -> RecoveryRow:
+def search_query(tool_name: str) -> str:
+    return f"{tool_name} official website"
+
+
+def filter_hits(hits: Iterable[SearchHit], limit: int) -> list[SearchHit]:
+    return [hit for hit in hits if not is_blacklisted(hit[1])][:limit]
+
+
+def score_candidates(tool_name: str, old_url: str, hits: Iterable[SearchHit]) -> list[Candidate]:
     old_domain = urlparse(old_url).netloc.lower()
-    best_row = RecoveryRow(
+    return [
+        Candidate(url, domain, title, score_candidate(tool_name, title, domain, url))
+        for url, domain, title in hits
+        if domain != old_domain
+    ]
+
+
+def rank_candidates(candidates: Iterable[Candidate], min_confidence: float) -> tuple[list[Candidate], list[Candidate]]:
+    """Split into candidates that could be accepted (best first) and those that never can."""
+    ranked = sorted(candidates, key=lambda candidate: candidate.confidence, reverse=True)
+    viable = [candidate for candidate in ranked if candidate.confidence >= min_confidence]
+    return viable, ranked[len(viable) :]
+
+
+def low_confidence_row(tool_name: str, old_url: str, best: Candidate) -> RecoveryRow:
+    """Report the best unreachable candidate for review; it is never fetched, so its status stays -1."""
+    return RecoveryRow(
         tool_name=tool_name,
         old_url=old_url,
-        candidate_url="",
-        candidate_domain="",
+        candidate_url=best.url,
+        candidate_domain=best.domain,
         http_status=-1,
-        confidence=0.0,
+        confidence=best.confidence,
         accepted=0,
-        reason="no_candidate",
+        reason="low_confidence",
     )
 
-    for url, domain, title in candidates:
-        if domain == old_domain:
-            continue
-        status = curl_status(url)
-        if status < 200 or status >= 400:
-            continue
-        confidence = score_candidate(tool_name, title, domain, url)
-        reason = "accepted" if confidence >= min_confidence else "low_confidence"
-        row = RecoveryRow(
-            tool_name=tool_name,
-            old_url=old_url,
-            candidate_url=url,
-            candidate_domain=domain,
-            http_status=status,
-            confidence=confidence,
-            accepted=1 if confidence >= min_confidence else 0,
-            reason=reason,
-        )
-        if row.confidence > best_row.confidence:
-            best_row = row
-        if row.accepted == 1:
-            return row
-
-    if best_row.candidate_url:
-        return best_row
-    return best_row
-
-
-def recover_one(tool_name: str, old_url: str, candidate_limit: int, min_confidence: float) -> RecoveryRow:
-    with requests.Session() as session:
-        try:
-            candidates = fetch_candidates(session, tool_name, candidate_limit)
-            if not candidates:
-                return RecoveryRow(
-                    tool_name=tool_name,
-                    old_url=old_url,
-                    candidate_url="",
-                    candidate_domain="",
-                    http_status=-1,
-                    confidence=0.0,
-                    accepted=0,
-                    reason="no_search_result",
-                )
-            return choose_replacement(tool_name, old_url, candidates, min_confidence)
-        except Exception as exc:
+
+async def choose_replacement(
+    tool_name: str,
+    old_url: str,
+    viable: list[Candidate],
+    status_of: Callable[[str], Awaitable[int]],
+    stats: Counter[str] | None = None,
+    pruned: Sequence[Candidate] = (),
+) -> RecoveryRow:
+    """Validate ``viable`` candidates in order and accept the first one that responds 2xx/3xx.
+
+    When every viable candidate is dead the row reports the best ``pruned`` candidate as
+    ``low_confidence``, exactly as when nothing was viable, or else the best dead candidate
+    as ``all_candidates_dead``.
+    """
+    stats = stats if stats is not None else Counter()
+    best_status = -1
+    for checked, candidate in enumerate(viable, 1):
+        status = await status_of(candidate.url)
+        stats["status_lookups"] += 1
+        if checked == 1:
+            best_status = status
+        if 200 <= status < 400:
+            stats["skipped_after_accept"] += len(viable) - checked
             return RecoveryRow(
                 tool_name=tool_name,
                 old_url=old_url,
-                candidate_url="",
-                candidate_domain="",
-                http_status=-1,
-                confidence=0.0,
-                accepted=0,
-                reason=f"error:{str(exc)[:80]}",
+                candidate_url=candidate.url,
+                candidate_domain=candidate.domain,
+                http_status=status,
+                confidence=candidate.confidence,
+                accepted=1,
+                reason="accepted",
             )
+    if pruned:
+        return low_confidence_row(tool_name, old_url, pruned[0])
+    if not viable:
+        return empty_row(tool_name, old_url, "no_candidate")
+    return RecoveryRow(
+        tool_name=tool_name,
+        old_url=old_url,
+        candidate_url=viable[0].url,
+        candidate_domain=viable[0].domain,
+        http_status=best_status,
+        confidence=viable[0].confidence,
+        accepted=0,
+        reason="all_candidates_dead",
+    )
 
 
-def parse_args() -> argparse.Namespace:
+def is_retryable(reason: str) -> bool:
+    return reason.startswith("error:") or reason == "no_search_result"
+
+
+class RecoveryJournal:
+    """Append-only JSON-lines log of finished recovery rows, written as each target completes.
+
+    Rows with an ``error:`` or ``no_search_result`` reason are logged but not treated as done, so
+    --resume retries them (an empty result page is usually a rate limit, not an answer).
+    """
+
+    def __init__(self, path: Path, resume: bool) -> None:
+        self.path = path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        rows = load_journal(path) if resume else []
+        self.done = {(row.tool_name, row.old_url) for row in rows if not is_retryable(row.reason)}
+        needs_newline = False
+        if resume and path.exists() and path.stat().st_size:
+            # A run killed mid-write leaves a partial last line; start ours on a fresh one.
+            with path.open("rb") as handle:
+                handle.seek(-1, 2)
+                needs_newline = handle.read(1) != b"\n"
+        self.handle = path.open("a" if resume else "w", encoding="utf-8")
+        if needs_newline:
+            self.handle.write("\n")
+        self.written = 0
+
+    def write(self, row: RecoveryRow) -> None:
+        self.handle.write(json.dumps(asdict(row)) + "\n")
+        self.handle.flush()
+        self.written += 1
+
+    def close(self) -> None:
+        self.handle.close()
+
+
+def load_journal(path: Path) -> list[RecoveryRow]:
+    """Latest row per (tool_name, old_url), skipping lines cut short by an interrupted run."""
+    if not path.exists():
+        return []
+    rows: dict[tuple[str, str], RecoveryRow] = {}
+    with path.open(encoding="utf-8") as handle:
+        for line in handle:
+            try:
+                row = RecoveryRow(**json.loads(line))
+            except (ValueError, TypeError):
+                continue
+            rows[(row.tool_name, row.old_url)] = row
+    return list(rows.values())
+
+
+def make_backend(args: argparse.Namespace) -> SearchBackend:
+    if args.search_backend == "fixture":
+        return FixtureBackend(args.fixtures_dir)
+    if args.record_fixtures:
+        return FixtureBackend(args.fixtures_dir, record=DuckDuckGoBackend())
+    return DuckDuckGoBackend()
+
+
+async def run_stage(
+    inbox: asyncio.Queue,
+    workers: int,
+    handle: Callable[..., Awaitable[None]],
+    outbox: asyncio.Queue | None = None,
+    downstream_workers: int = 0,
+) -> None:
+    """Run ``workers`` consumers of ``inbox`` until each sees a None, then close ``outbox`` the same way."""
+
+    async def consume() -> None:
+        while (item := await inbox.get()) is not None:
+            await handle(*item)
+
+    await asyncio.gather(*(consume() for _ in range(workers)))
+    if outbox is not None:
+        for _ in range(downstream_workers):
+            await outbox.put(None)
+
+
+async def recover(
+    targets: list[tuple[str, str]],
+    backend: SearchBackend,
+    args: argparse.Namespace,
+    search_cache: SearchCache | None = None,
+    status_cache: UrlHealthCache | None = None,
+    metrics: CrawlMetrics | None = None,
+    dns_entries: dict[str, DnsEntry] | None = None,
+    stats: Counter[str] | None = None,
+    journal: RecoveryJournal | None = None,
+) -> list[RecoveryRow]:
+    """Staged pipeline: search -> parse -> score -> validate, each stage with its own concurrency.
+
+    Searches share one token bucket, so the whole run is paced by --search-rate; parsing and
+    scoring are single consumers; validation runs on the shared pool under the host scheduler.
+    Candidates below --min-confidence are never fetched, and the rest are checked best first
+    until one is live. Each finished row goes to ``journal`` as soon as it is known.
+    """
+    started = time.time()
+    stats = stats if stats is not None else Counter()
+    bucket = TokenBucket(args.search_rate, args.search_burst)
+    scheduler = HostScheduler(
+        args.concurrency,
+        per_host=args.per_host,
+        per_domain=args.per_domain,
+        limiter=metrics.limiter if metrics else None,
+    )
+    validate_workers = scheduler.capacity
+    depth = max(64, args.search_concurrency * 4)
+    to_search: asyncio.Queue = asyncio.Queue(maxsize=depth)
+    to_parse: asyncio.Queue = asyncio.Queue(maxsize=depth)
+    to_score: asyncio.Queue = asyncio.Queue(maxsize=depth)
+    to_validate: asyncio.Queue = asyncio.Queue(maxsize=validate_workers * 2)
+    rows: list[RecoveryRow] = []
+
+    def finish(row: RecoveryRow) -> None:
+        rows.append(row)
+        if journal is not None:
+            journal.write(row)
+        if len(rows) % 50 == 0 or len(rows) == len(targets):
+            print(f"progress={len(rows)}/{len(targets)} elapsed_sec={time.time() - started:.1f}")
+
+    trace_configs = [metrics.trace_config()] if metrics else []
+    async with open_session(scheduler, dns_entries, trace_configs, args.search_concurrency) as session:
+        validator = CandidateValidator(
+            session, scheduler, status_cache, args.status_cache_ttl_hours * 3600, metrics
+        )
+
+        async def search(tool: str, old_url: str) -> None:
+            query = search_query(tool)
+            hits = search_cache.get(backend.name, query, args.candidate_limit) if search_cache else None
+            if hits is not None:
+                await to_score.put((tool, old_url, hits))
+                return
+            await bucket.acquire()
+            try:
+                page = await backend.fetch(session, query)
+            except Exception as exc:  # noqa: BLE001
+                finish(empty_row(tool, old_url, f"error:{str(exc)[:80]}"))
+                return
+            await to_parse.put((tool, old_url, page))
+
+        async def parse(tool: str, old_url: str, page: str) -> None:
+            try:
+                # Directory sites do not count towards the limit, so the extractor reads on until it has
+                # --candidate-limit usable hits; SearchCache.put marks such early stops with hit_limit.
+                hits = backend.parse(page, args.candidate_limit, lambda hit: not is_blacklisted(hit[1]))
+            except Exception as exc:  # noqa: BLE001
+                finish(empty_row(tool, old_url, f"error:{str(exc)[:80]}"))
+                return
+            if search_cache:
+                search_cache.put(backend.name, search_query(tool), hits, args.candidate_limit)
+            await to_score.put((tool, old_url, hits))
+
+        async def score(tool: str, old_url: str, hits: list[SearchHit]) -> None:
+            hits = filter_hits(hits, args.candidate_limit)
+            if not hits:
+                finish(empty_row(tool, old_url, "no_search_result"))
+                return
+            candidates = score_candidates(tool, old_url, hits)
+            viable, pruned = rank_candidates(candidates, args.min_confidence)
+            stats["candidates_scored"] += len(candidates)
+            stats["pruned_below_confidence"] += len(pruned)
+            if not viable:
+                finish(low_confidence_row(tool, old_url, pruned[0]) if pruned else empty_row(tool, old_url, "no_candidate"))
+                return
+            await to_validate.put((tool, old_url, viable, pruned))
+
+        async def validate(tool: str, old_url: str, viable: list[Candidate], pruned: list[Candidate]) -> None:
+            finish(await choose_replacement(tool, old_url, viable, validator.status, stats, pruned))
+
+        async def feed() -> None:
+            for target in targets:
+                await to_search.put(target)
+            for _ in range(args.search_concurrency):
+                await to_search.put(None)
+
+        await asyncio.gather(
+            feed(),
+            run_stage(to_search, args.search_concurrency, search, to_parse, 1),
+            run_stage(to_parse, 1, parse, to_score, 1),
+            run_stage(to_score, 1, score, to_validate, validate_workers),
+            run_stage(to_validate, validate_workers, validate),
+        )
+
+    stats["validations_avoided"] = stats["pruned_below_confidence"] + stats["skipped_after_accept"]
+    print(f"search_rate_wait_sec={bucket.waited_sec:.1f} validated_urls={len(validator.checks)}")
+    return rows
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
     parser = argparse.ArgumentParser(description=__doc__)
     parser.add_argument("--audit-csv", required=True, type=Path, help="Path to tools_with_audit.csv")
     parser.add_argument("--out-csv", default=Path("audit/recovered_links.csv"), type=Path)
-    parser.add_argument("--workers", default=10, type=int, help="Concurrent recovery jobs")
+    parser.add_argument("--search-rate", default=2.0, type=float, help="Search requests per second (0 = unlimited)")
+    parser.add_argument("--search-burst", default=4, type=int, help="Searches allowed back to back before pacing")
+    parser.add_argument("--search-concurrency", default=8, type=int, help="Search requests in flight")
+    parser.add_argument(
+        "--concurrency", default=60, type=int, help="Concurrent candidate checks (starting level when adaptive)"
+    )
+    parser.add_argument("--max-concurrency", default=400, type=int, help="Ceiling for the adaptive limit")
+    parser.add_argument(
+        "--adaptive",
+        action=argparse.BooleanOptionalAction,
+        default=True,
+        help="Tune the in-flight limit from timeout/error rate and latency (AIMD)",
+    )
+    parser.add_argument("--per-host", default=4, type=int, help="Concurrent candidate checks per host")
+    parser.add_argument("--per-domain", default=8, type=int, help="Concurrent candidate checks per registrable domain")
     parser.add_argument("--candidate-limit", default=5, type=int, help="Max search results to evaluate")
     parser.add_argument("--min-confidence", default=0.62, type=float, help="Auto-accept threshold")
     parser.add_argument("--max-rows", default=0, type=int, help="Optional cap on rows to process (0 means all)")
-    return parser.parse_args()
+    parser.add_argument(
+        "--search-backend",
+        choices=("ddg", "fixture"),
+        default="ddg",
+        help="Live DuckDuckGo HTML search, or saved result pages from --fixtures-dir",
+    )
+    parser.add_argument("--fixtures-dir", default=Path("audit/search_fixtures"), type=Path)
+    parser.add_argument(
+        "--record-fixtures",
+        action="store_true",
+        help="With --search-backend ddg, save every fetched result page into --fixtures-dir",
+    )
+    parser.add_argument("--search-cache-db", default=Path("audit/search_cache.sqlite"), type=Path)
+    parser.add_argument("--search-cache-ttl-hours", default=168.0, type=float, help="Reuse search results within this window")
+    parser.add_argument(
+        "--status-cache-db",
+        default=Path("audit/candidate_status_cache.sqlite"),
+        type=Path,
+        help="SQLite cache of candidate HEAD statuses reused across runs",
+    )
+    parser.add_argument("--status-cache-ttl-hours", default=24.0, type=float, help="Reuse candidate statuses within this window")
+    parser.add_argument("--no-cache", action="store_true", help="Ignore and do not update the search and status caches")
+    parser.add_argument(
+        "--journal",
+        type=Path,
+        help="Append-only log of finished rows (defaults to <out-csv stem>.journal.jsonl next to --out-csv)",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Keep rows already in the journal and only search the remaining (tool, old URL) pairs",
+    )
+    return parser.parse_args(argv)
 
 
 def main() -> None:
@@ -219,40 +563,62 @@ def main() -> None:
     out_path = args.out_csv
     out_path.parent.mkdir(parents=True, exist_ok=True)
 
-    df = pd.read_csv(args.audit_csv)
+    df = load_table(args.audit_csv, ["Tool Name", "Website Link", "ok"])
     invalid_rows = df[df["ok"] != 1][["Tool Name", "Website Link"]].drop_duplicates()
     if args.max_rows > 0:
         invalid_rows = invalid_rows.head(args.max_rows)
 
     targets = list(invalid_rows.itertuples(index=False, name=None))
     total = len(targets)
-    print(f"recover_targets={total} workers={args.workers} min_confidence={args.min_confidence}")
+    print(
+        f"recover_targets={total} search_rate={args.search_rate}/s "
+        f"concurrency={args.concurrency} min_confidence={args.min_confidence}"
+    )
     started = time.time()
 
-    recovered: list[RecoveryRow] = []
-    with concurrent.futures.ThreadPoolExecutor(max_workers=args.workers) as executor:
-        future_to_target = {
-            executor.submit(recover_one, tool, old_url, args.candidate_limit, args.min_confidence): (tool, old_url)
-            for tool, old_url in targets
-        }
-        completed = 0
-        for future in concurrent.futures.as_completed(future_to_target):
-            completed += 1
-            row = future.result()
-            recovered.append(row)
-            if completed % 50 == 0 or completed == total:
-                elapsed = time.time() - started
-                print(f"progress={completed}/{total} elapsed_sec={elapsed:.1f}")
-
-    out_df = pd.DataFrame([asdict(row) for row in recovered]).sort_values(["accepted", "confidence"], ascending=[False, False])
+    journal_path = args.journal or out_path.with_name(f"{out_path.stem}.journal.jsonl")
+    journal = RecoveryJournal(journal_path, args.resume)
+    pending = [target for target in targets if target not in journal.done]
+    resumed = total - len(pending)
+    print(f"resumed={resumed} pending={len(pending)} journal={journal_path}")
+
+    search_cache = None if args.no_cache else SearchCache(args.search_cache_db, args.search_cache_ttl_hours * 3600)
+    status_cache = None if args.no_cache else UrlHealthCache(args.status_cache_db)
+    metrics = CrawlMetrics("recover_links")
+    metrics.limiter = AdaptiveLimiter.from_args(args.concurrency, args.max_concurrency, args.adaptive)
+    stats: Counter[str] = Counter()
+    try:
+        asyncio.run(
+            recover(pending, make_backend(args), args, search_cache, status_cache, metrics, stats=stats, journal=journal)
+        )
+    finally:
+        journal.close()
+        if status_cache:
+            status_cache.close()
+    metrics.write(out_path.parent, "recover_crawl_metrics")
+
+    wanted = set(targets)
+    recovered = [row for row in load_journal(journal_path) if (row.tool_name, row.old_url) in wanted]
+    out_df = pd.DataFrame([asdict(row) for row in recovered], columns=list(RecoveryRow.__dataclass_fields__))
+    out_df = out_df.sort_values(["accepted", "confidence"], ascending=[False, False])
     out_df.to_csv(out_path, index=False)
 
     summary = {
         "recover_targets": int(total),
+        "resumed_targets": int(resumed),
         "accepted_replacements": int(out_df["accepted"].sum()) if not out_df.empty else 0,
         "accept_rate": round(float(out_df["accepted"].mean()) if not out_df.empty else 0.0, 4),
+        "candidates_scored": stats["candidates_scored"],
+        "pruned_below_confidence": stats["pruned_below_confidence"],
+        "skipped_after_accept": stats["skipped_after_accept"],
+        "validations_avoided": stats["validations_avoided"],
+        "status_lookups": stats["status_lookups"],
+        "probed_candidates": metrics.probes,
+        "search_cache": search_cache.summary() if search_cache else None,
         "elapsed_sec": round(time.time() - started, 2),
     }
+    if search_cache:
+        search_cache.close()
     print(json.dumps(summary, indent=2))
 
 
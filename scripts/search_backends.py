@@ -0,0 +1,221 @@
+"""Pluggable web search backends for link recovery, with a persistent result cache."""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import re
+import sqlite3
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Callable, Protocol
+from urllib.parse import urlparse
+
+import aiohttp
+from bs4 import BeautifulSoup
+
+from ddg_extract import extract_ddg_target, extract_results
+
+# (url, domain, title) for one organic result, in page order.
+SearchHit = tuple[str, str, str]
+
+DDG_HTML_URL = "https://duckduckgo.com/html/"
+USER_AGENT = "Mozilla/5.0 (compatible; AIToolsDirectoryRecovery/1.0)"
+
+
+class SearchBackend(Protocol):
+    name: str
+
+    async def fetch(self, session: aiohttp.ClientSession, query: str) -> str:
+        """Return the raw results page for ``query``."""
+
+    def parse(
+        self, page: str, limit: int | None = None, keep: Callable[[SearchHit], bool] | None = None
+    ) -> list[SearchHit]:
+        """Return organic results on ``page`` in order, stopping after ``limit`` that pass ``keep``."""
+
+
+class TokenBucket:
+    """Async token bucket: ``rate`` acquisitions per second on average, bursts of up to ``burst``."""
+
+    def __init__(self, rate: float, burst: int = 1) -> None:
+        self.rate = rate
+        self.capacity = float(max(1, burst))
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.lock = asyncio.Lock()
+        self.waited_sec = 0.0
+
+    async def acquire(self) -> None:
+        if self.rate <= 0:
+            return
+        async with self.lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+                self.waited_sec += wait
+                await asyncio.sleep(wait)
+
+
+def normalize_query(query: str) -> str:
+    return re.sub(r"\s+", " ", query.lower()).strip()
+
+
+def parse_ddg_results(html: str) -> list[SearchHit]:
+    """Full BeautifulSoup parse, kept as the reference for ``ddg_extract.extract_results``."""
+    soup = BeautifulSoup(html, "html.parser")
+    hits: list[SearchHit] = []
+    for result in soup.select(".result"):
+        anchor = result.select_one(".result__a")
+        if not anchor:
+            continue
+        target = extract_ddg_target(anchor.get("href", ""))
+        if not target.startswith(("http://", "https://")):
+            continue
+        domain = urlparse(target).netloc.lower()
+        if not domain:
+            continue
+        hits.append((target, domain, anchor.get_text(" ", strip=True)))
+    return hits
+
+
+class DuckDuckGoBackend:
+    name = "ddg"
+
+    def __init__(self, timeout: float = 15.0) -> None:
+        self.timeout = aiohttp.ClientTimeout(total=timeout)
+
+    async def fetch(self, session: aiohttp.ClientSession, query: str) -> str:
+        async with session.get(
+            DDG_HTML_URL, params={"q": query}, timeout=self.timeout, headers={"User-Agent": USER_AGENT}
+        ) as response:
+            response.raise_for_status()
+            return await response.text()
+
+    def parse(
+        self, page: str, limit: int | None = None, keep: Callable[[SearchHit], bool] | None = None
+    ) -> list[SearchHit]:
+        return extract_results(page, limit, keep)
+
+
+class FixtureBackend:
+    """Serves saved DuckDuckGo result pages from a directory, one HTML file per normalised query.
+
+    With ``record`` set, missing pages are fetched from that backend and saved, so a live
+    run can capture fixtures for later offline runs and benchmarks.
+    """
+
+    def __init__(self, directory: Path, record: DuckDuckGoBackend | None = None) -> None:
+        self.directory = directory
+        self.record = record
+        # Recorded pages are live results, so they share the live backend's cache entries.
+        self.name = record.name if record else "fixture"
+
+    def path_for(self, query: str) -> Path:
+        normalized = normalize_query(query)
+        slug = re.sub(r"[^a-z0-9]+", "-", normalized).strip("-")[:60]
+        digest = hashlib.sha1(normalized.encode("utf-8")).hexdigest()[:10]
+        return self.directory / f"{slug}-{digest}.html"
+
+    async def fetch(self, session: aiohttp.ClientSession, query: str) -> str:
+        path = self.path_for(query)
+        if path.exists():
+            return path.read_text(encoding="utf-8")
+        if self.record is None:
+            raise FileNotFoundError(f"no search fixture for {query!r} ({path.name})")
+        page = await self.record.fetch(session, query)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path.write_text(page, encoding="utf-8")
+        return page
+
+    def parse(
+        self, page: str, limit: int | None = None, keep: Callable[[SearchHit], bool] | None = None
+    ) -> list[SearchHit]:
+        return extract_results(page, limit, keep)
+
+
+class SearchCache:
+    """Search results keyed by backend and normalised query, shared across runs.
+
+    Pages parsed with a limit store it as ``hit_limit``; such entries only answer lookups
+    that need no more hits than were kept.
+    """
+
+    def __init__(self, path: Path, ttl_sec: float) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.ttl_sec = ttl_sec
+        self.stats: Counter[str] = Counter()
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS search_results (
+              backend TEXT NOT NULL,
+              query TEXT NOT NULL,
+              hits TEXT NOT NULL,
+              fetched_at REAL NOT NULL,
+              hit_limit INTEGER,
+              PRIMARY KEY (backend, query)
+            )
+            """
+        )
+        columns = {row[1] for row in self.conn.execute("PRAGMA table_info(search_results)")}
+        if "hit_limit" not in columns:
+            self.conn.execute("ALTER TABLE search_results ADD COLUMN hit_limit INTEGER")
+        self.conn.commit()
+
+    def get(self, backend: str, query: str, limit: int | None = None) -> list[SearchHit] | None:
+        row = self.conn.execute(
+            "SELECT hits, fetched_at, hit_limit FROM search_results WHERE backend = ? AND query = ?",
+            (backend, normalize_query(query)),
+        ).fetchone()
+        if row is None or row[0] == "[]":
+            # Empty entries are no longer written; ones left by older runs are ignored too.
+            self.stats["misses"] += 1
+            return None
+        if time.time() - row[1] >= self.ttl_sec:
+            self.stats["expired"] += 1
+            return None
+        if row[2] is not None and (limit is None or row[2] < limit):
+            self.stats["truncated"] += 1
+            return None
+        self.stats["hits"] += 1
+        return [tuple(hit) for hit in json.loads(row[0])]
+
+    def put(self, backend: str, query: str, hits: list[SearchHit], limit: int | None = None) -> None:
+        if not hits:
+            # Rate-limit and anomaly pages come back as 200s with no results; retry them next run.
+            self.stats["empty_skipped"] += 1
+            return
+        # The extractor only stops early once it has ``limit`` kept hits; fewer means the whole page was read.
+        hit_limit = limit if limit is not None and len(hits) >= limit else None
+        with self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO search_results (backend, query, hits, fetched_at, hit_limit) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (backend, normalize_query(query), json.dumps(hits), time.time(), hit_limit),
+            )
+            self.stats["stored"] += 1
+
+    def summary(self) -> dict[str, float]:
+        lookups = self.stats["hits"] + self.stats["misses"] + self.stats["expired"] + self.stats["truncated"]
+        return {
+            "hits": self.stats["hits"],
+            "misses": self.stats["misses"],
+            "expired": self.stats["expired"],
+            "truncated": self.stats["truncated"],
+            "stored": self.stats["stored"],
+            "empty_skipped": self.stats["empty_skipped"],
+            "hit_rate": round(self.stats["hits"] / lookups, 4) if lookups else 0.0,
+        }
+
+    def close(self) -> None:
+        self.conn.close()
+
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""Apply the chunked D1 seed written by build_dataset.py, one wrangler call per chunk in manifest order."""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import shlex
+import shutil
+import subprocess
+import time
+from pathlib import Path
+
+from d1_seed import DEPLOYED_DIR
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--seed-dir", default=Path("data/seed"), type=Path, help="Directory holding manifest.json")
+    parser.add_argument("--database", default="ai_tools_directory", help="D1 database name")
+    parser.add_argument("--remote", action="store_true", help="Seed the remote database instead of the local one")
+    parser.add_argument("--start-at", default=1, type=int, help="1-based chunk to start from, to resume a failed run")
+    parser.add_argument("--wrangler", default="npx wrangler", help="Command used to invoke wrangler")
+    parser.add_argument("--dry-run", action="store_true", help="Print the commands without running them")
+    parser.add_argument(
+        "--deployed-dir",
+        type=Path,
+        help="Where a successful --remote seed records its tools_seed.json and tool_similar.csv, the default "
+        "--previous-seed of the next build (defaults to <seed-dir>/../deployed)",
+    )
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    manifest = json.loads((args.seed_dir / "manifest.json").read_text(encoding="utf-8"))
+    chunks = manifest["chunks"]
+    # The build outputs these chunks came from; checked now so a partial rebuild is caught before seeding.
+    sources = [args.seed_dir.parent / name for name in manifest.get("sources", {})]
+    for path in sources:
+        if not path.exists() or hashlib.sha256(path.read_bytes()).hexdigest() != manifest["sources"][path.name]:
+            raise SystemExit(f"{path} changed since {args.seed_dir} was built; rebuild the seed before applying it")
+    started = time.time()
+    applied = 0
+    for idx, chunk in enumerate(chunks, 1):
+        if idx < args.start_at:
+            continue
+        path = args.seed_dir / chunk["file"]
+        if hashlib.sha256(path.read_bytes()).hexdigest() != chunk["sha256"]:
+            raise SystemExit(f"{path} does not match manifest.json; rebuild the seed before applying it")
+        command = [*shlex.split(args.wrangler), "d1", "execute", args.database, f"--file={path}", "--yes"]
+        command.append("--remote" if args.remote else "--local")
+        print(f"chunk={idx}/{len(chunks)} statements={chunk['statements']} bytes={chunk['bytes']} file={chunk['file']}")
+        if args.dry_run:
+            print(" ".join(shlex.quote(part) for part in command))
+            continue
+        result = subprocess.run(command, check=False)
+        if result.returncode != 0:
+            raise SystemExit(f"chunk {idx} failed; resume with --start-at {idx}")
+        applied += 1
+
+    deployed = None
+    if args.remote and not args.dry_run:
+        deployed = args.deployed_dir or args.seed_dir.parent / DEPLOYED_DIR
+        deployed.mkdir(parents=True, exist_ok=True)
+        for path in sources:
+            shutil.copyfile(path, deployed / path.name)
+
+    summary = {
+        "chunks": len(chunks),
+        "applied_chunks": applied,
+        "statements": manifest["total_statements"],
+        "deployed_dir": str(deployed) if deployed else None,
+        "elapsed_sec": round(time.time() - started, 2),
+    }
+    print(json.dumps(summary, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""Cached tabular loading for the pipeline scripts.
+
+Spreadsheets are streamed with openpyxl in read-only mode and CSVs are read with
+only the requested columns. Spreadsheet results are saved as a columnar snapshot
+keyed by the source path and content hash, so later runs skip parsing entirely;
+CSVs are cheap to parse and mostly rewritten every run, so they are not cached.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from pathlib import Path
+from typing import Sequence
+
+import pandas as pd
+
+SNAPSHOT_VERSION = 1
+DEFAULT_CACHE_DIR = Path(".cache/tables")
+# Columns of All_ai_tools.xlsx that the pipeline reads; audit_links carries them into tools_with_audit.csv.
+SHEET_COLUMNS = ["Tool Name", "Category", "Tags", "Description", "Website Link"]
+
+
+def file_digest(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as handle:
+        for chunk in iter(lambda: handle.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+SPREADSHEET_SUFFIXES = (".xlsx", ".xlsm")
+
+
+def _wanted(header: Sequence[str], columns: Sequence[str] | None, optional: Sequence[str]) -> list[str]:
+    if columns is None:
+        return [name for name in header if name]
+    missing = [name for name in columns if name not in header]
+    if missing:
+        raise KeyError(f"missing columns: {', '.join(missing)}")
+    return [*columns, *(name for name in optional if name in header and name not in columns)]
+
+
+def read_xlsx(
+    path: Path,
+    columns: Sequence[str] | None = None,
+    sheet: str | None = None,
+    optional: Sequence[str] = (),
+) -> pd.DataFrame:
+    from openpyxl import load_workbook
+
+    workbook = load_workbook(path, read_only=True, data_only=True)
+    try:
+        worksheet = workbook[sheet] if sheet else workbook.worksheets[0]
+        rows = worksheet.iter_rows(values_only=True)
+        header = [str(value).strip() if value is not None else "" for value in next(rows, ())]
+        try:
+            wanted = _wanted(header, columns, optional)
+        except KeyError as exc:
+            raise KeyError(f"{path} is {exc.args[0]}") from None
+        indexes = [header.index(name) for name in wanted]
+        data: dict[str, list] = {name: [] for name in wanted}
+        for row in rows:
+            if row is None or all(value is None for value in row):
+                continue
+            for name, idx in zip(wanted, indexes):
+                data[name].append(row[idx] if idx < len(row) else None)
+    finally:
+        workbook.close()
+    return pd.DataFrame(data, columns=wanted)
+
+
+def read_csv(path: Path, columns: Sequence[str] | None = None, optional: Sequence[str] = ()) -> pd.DataFrame:
+    header = pd.read_csv(path, nrows=0).columns.tolist()
+    try:
+        wanted = _wanted(header, columns, optional)
+    except KeyError as exc:
+        raise KeyError(f"{path} is {exc.args[0]}") from None
+    return pd.read_csv(path, usecols=wanted)[wanted]
+
+
+def _read_source(path: Path, columns: Sequence[str] | None, optional: Sequence[str]) -> pd.DataFrame:
+    if path.suffix.lower() in SPREADSHEET_SUFFIXES:
+        return read_xlsx(path, columns, optional=optional)
+    return read_csv(path, columns, optional)
+
+
+def load_table(
+    path: Path,
+    columns: Sequence[str] | None = None,
+    cache_dir: Path | None = DEFAULT_CACHE_DIR,
+    optional: Sequence[str] = (),
+) -> pd.DataFrame:
+    """Load ``columns`` (all when None) plus whichever ``optional`` columns exist from an xlsx/csv file.
+
+    Spreadsheets reuse a snapshot when the file content is unchanged; pass ``cache_dir=None``
+    to always parse the source.
+    """
+    if cache_dir is None or path.suffix.lower() not in SPREADSHEET_SUFFIXES:
+        return _read_source(path, columns, optional)
+
+    # Keyed by the resolved path so same-named inputs in different directories keep their own snapshot.
+    source_key = json.dumps([str(path.resolve()), list(columns) if columns is not None else None, list(optional)])
+    prefix = f"{path.stem}-{hashlib.sha256(source_key.encode()).hexdigest()[:8]}-v{SNAPSHOT_VERSION}"
+    name = f"{prefix}-{file_digest(path)[:24]}"
+    for suffix, reader in ((".feather", pd.read_feather), (".pkl", pd.read_pickle)):
+        snapshot = cache_dir / f"{name}{suffix}"
+        if snapshot.exists():
+            return reader(snapshot)
+
+    frame = _read_source(path, columns, optional)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    for stale in cache_dir.glob(f"{prefix}-*"):
+        stale.unlink()
+    _write_snapshot(frame, cache_dir, name)
+    return frame
+
+
+def _write_snapshot(frame: pd.DataFrame, cache_dir: Path, name: str) -> None:
+    tmp = cache_dir / f"{name}.tmp"
+    try:
+        # Feather needs pyarrow and uniformly typed columns; anything else falls back to pickle.
+        frame.reset_index(drop=True).to_feather(tmp)
+        tmp.replace(cache_dir / f"{name}.feather")
+    except Exception:  # noqa: BLE001
+        frame.to_pickle(tmp)
+        tmp.replace(cache_dir / f"{name}.pkl")
@@ -0,0 +1,138 @@
+"""Offline "similar tools" lists: pruned TF-IDF cosine over name, tags and description."""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+TOKEN = r"[a-z0-9]+"
+# Term frequency weight per field: a shared name word says more than a shared description word.
+FIELD_WEIGHTS = {"tool_name": 3.0, "tags": 2.0, "description": 1.0}
+SIMILAR_COLUMNS = ("slug", "similar_slug", "rank", "score")
+
+DEFAULT_TOP_K = 9
+# Terms in more than this share of tools ("ai", "the", "tool") neither find nor score neighbours.
+DEFAULT_MAX_DF = 0.05
+# Candidates come from each tool's strongest terms, matched against the strongest tools per term.
+DEFAULT_TERMS_PER_TOOL = 12
+DEFAULT_POSTING_CAP = 64
+DEFAULT_BLOCK_TOOLS = 2048
+# Similarities are summed as fixed-point integers so they can share a sort key with the pair.
+SCORE_BITS = 31
+SCORE_MASK = (1 << SCORE_BITS) - 1
+SCORE_SCALE = float(SCORE_MASK)
+
+
+def term_weights(frame: pd.DataFrame) -> tuple[np.ndarray, np.ndarray, np.ndarray, int]:
+    """``(tool, term, weight, n_terms)`` postings with L2-normalised TF-IDF weights; tool is the row position."""
+    parts = []
+    for column, weight in FIELD_WEIGHTS.items():
+        tokens = frame[column].astype(str).str.lower().reset_index(drop=True).str.findall(TOKEN).explode().dropna()
+        parts.append(pd.DataFrame({"tool": tokens.index.to_numpy(), "term": tokens.to_numpy(dtype=object), "tf": weight}))
+    postings = pd.concat(parts, ignore_index=True).groupby(["tool", "term"], sort=False)["tf"].sum().reset_index()
+    tools = postings["tool"].to_numpy(dtype=np.int64)
+    terms, vocabulary = pd.factorize(postings["term"])
+    df = np.bincount(terms, minlength=len(vocabulary))
+    idf = np.log((1 + len(frame)) / (1 + df)) + 1.0
+    weights = postings["tf"].to_numpy() * idf[terms]
+    norms = np.sqrt(np.bincount(tools, weights=weights**2, minlength=len(frame)))
+    weights = weights / norms[tools]
+    return tools, terms.astype(np.int64), weights, len(vocabulary)
+
+
+def _top_per_group(groups: np.ndarray, weights: np.ndarray, limit: int | None) -> np.ndarray:
+    """Indices sorted by group then weight (desc), keeping at most ``limit`` per group."""
+    order = np.lexsort((-weights, groups))
+    if limit is None:
+        return order
+    sorted_groups = groups[order]
+    starts = np.flatnonzero(np.r_[True, sorted_groups[1:] != sorted_groups[:-1]])
+    rank = np.arange(len(order)) - np.repeat(starts, np.diff(np.r_[starts, len(order)]))
+    return order[rank < limit]
+
+
+def similar_pairs(
+    frame: pd.DataFrame,
+    top_k: int = DEFAULT_TOP_K,
+    max_df: float = DEFAULT_MAX_DF,
+    terms_per_tool: int | None = DEFAULT_TERMS_PER_TOOL,
+    posting_cap: int | None = DEFAULT_POSTING_CAP,
+    block_tools: int = DEFAULT_BLOCK_TOOLS,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Top ``top_k`` neighbours per row of ``frame`` as ``(tool, neighbour, score)`` arrays, ranked per tool.
+
+    ``terms_per_tool=None, posting_cap=None, max_df=1.0`` gives exact cosine similarity; the defaults
+    prune both sides of the inverted index so each block of tools joins a bounded number of postings.
+    """
+    rows = len(frame)
+    tools, terms, weights, n_terms = term_weights(frame)
+    df = np.bincount(terms, minlength=n_terms)
+    keep = (df >= 2) & (df <= max(2, max_df * rows))
+    kept = keep[terms]
+    tools, terms, weights = tools[kept], terms[kept], weights[kept]
+
+    # Inverted index over the strongest tools per term, as CSR: term -> slice of (tool, weight).
+    index = _top_per_group(terms, weights, posting_cap)
+    index = index[np.argsort(terms[index], kind="stable")]
+    index_tools, index_weights = tools[index], weights[index]
+    pointers = np.searchsorted(terms[index], np.arange(n_terms + 1))
+
+    queries = _top_per_group(tools, weights, terms_per_tool)
+    query_tools, query_terms, query_weights = tools[queries], terms[queries], weights[queries]
+    # Pairs are packed into int64 keys and sorted with np.sort, which is several times faster than
+    # argsort: (block offset, neighbour, score) to sum, then (block offset, -score, neighbour) to rank.
+    neighbour_bits = max(1, (rows - 1).bit_length())
+    block = max(1, min(block_tools, 2 ** (63 - SCORE_BITS - neighbour_bits)))
+    block_starts = np.searchsorted(query_tools, np.arange(0, rows + block, block))
+
+    out_tools, out_neighbours, out_scores = [], [], []
+    for first_tool, lo, hi in zip(range(0, rows, block), block_starts[:-1], block_starts[1:]):
+        if lo == hi:
+            continue
+        starts = pointers[query_terms[lo:hi]]
+        lengths = pointers[query_terms[lo:hi] + 1] - starts
+        offsets = np.arange(lengths.sum()) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+        positions = np.repeat(starts, lengths) + offsets
+        left = np.repeat(query_tools[lo:hi] - first_tool, lengths)
+        right = index_tools[positions]
+        products = np.repeat(query_weights[lo:hi], lengths) * index_weights[positions]
+        distinct = left + first_tool != right
+        pairs = (left[distinct] << neighbour_bits) | right[distinct]
+        packed = np.sort((pairs << SCORE_BITS) | np.round(products[distinct] * SCORE_SCALE).astype(np.int64))
+        pairs = packed >> SCORE_BITS
+        firsts = np.flatnonzero(np.r_[True, pairs[1:] != pairs[:-1]])
+        quantized = np.minimum(np.add.reduceat(packed & SCORE_MASK, firsts), SCORE_MASK)
+        pairs = pairs[firsts]
+        left, right = pairs >> neighbour_bits, pairs & ((1 << neighbour_bits) - 1)
+
+        ranked = np.sort(
+            (left << (SCORE_BITS + neighbour_bits)) | ((SCORE_MASK - quantized) << neighbour_bits) | right
+        )
+        left = ranked >> (SCORE_BITS + neighbour_bits)
+        group_starts = np.flatnonzero(np.r_[True, left[1:] != left[:-1]])
+        rank = np.arange(len(ranked)) - np.repeat(group_starts, np.diff(np.r_[group_starts, len(ranked)]))
+        ranked = ranked[rank < top_k]
+        out_tools.append((ranked >> (SCORE_BITS + neighbour_bits)) + first_tool)
+        out_neighbours.append(ranked & ((1 << neighbour_bits) - 1))
+        out_scores.append((SCORE_MASK - ((ranked >> neighbour_bits) & SCORE_MASK)) / SCORE_SCALE)
+    if not out_tools:
+        empty = np.array([], dtype=np.int64)
+        return empty, empty, np.array([], dtype=float)
+    return np.concatenate(out_tools), np.concatenate(out_neighbours), np.concatenate(out_scores)
+
+
+def similar_tools(frame: pd.DataFrame, top_k: int = DEFAULT_TOP_K, **options) -> pd.DataFrame:
+    """``tool_similar`` rows (slug, similar_slug, rank, score) for a frame with ``tool_slug`` and the text fields."""
+    tools, neighbours, scores = similar_pairs(frame, top_k, **options)
+    slugs = frame["tool_slug"].astype(str).to_numpy(dtype=object)
+    starts = np.flatnonzero(np.r_[True, tools[1:] != tools[:-1]]) if len(tools) else np.array([], dtype=np.int64)
+    rank = np.arange(len(tools)) - np.repeat(starts, np.diff(np.r_[starts, len(tools)]))
+    return pd.DataFrame(
+        {
+            "slug": slugs[tools],
+            "similar_slug": slugs[neighbours],
+            "rank": rank + 1,
+            "score": np.round(scores, 4),
+        },
+        columns=list(SIMILAR_COLUMNS),
+    )
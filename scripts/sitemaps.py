@@ -0,0 +1,83 @@
+"""Sharded, gzip-compressed sitemaps whose lastmod only moves when a tool's seeded content changes."""
+
+from __future__ import annotations
+
+import gzip
+from pathlib import Path
+
+import pandas as pd
+
+SITE_ORIGIN = "https://findaidir.com"
+# Same pages and hints as functions/sitemap.xml.js.
+STATIC_PAGES = [("/", "daily", "1.0"), ("/submit-tool", "weekly", "0.6"), ("/contact", "monthly", "0.4")]
+# Protocol limits: 50,000 URLs and 50 MB uncompressed per sitemap file.
+MAX_URLS_PER_SITEMAP = 50_000
+SLUG_PATTERN = r"[a-z0-9-]{1,110}"
+XMLNS = "http://www.sitemaps.org/schemas/sitemap/0.9"
+
+
+def carry_lastmod(hashes: pd.Series, state_path: Path, today: str) -> pd.DataFrame:
+    """``slug, content_hash, lastmod`` per tool: lastmod is kept from ``state_path`` while the hash is unchanged."""
+    state = pd.DataFrame({"slug": hashes.index.astype(str), "content_hash": hashes.to_numpy().astype(str), "lastmod": today})
+    if state_path.exists():
+        previous = pd.read_csv(state_path, dtype=str, keep_default_na=False).set_index("slug")
+        same = previous["content_hash"].reindex(state["slug"]).to_numpy() == state["content_hash"].to_numpy()
+        state.loc[same, "lastmod"] = previous["lastmod"].reindex(state["slug"]).to_numpy()[same]
+    return state
+
+
+def _write_if_changed(path: Path, body: bytes) -> bool:
+    if path.exists() and path.read_bytes() == body:
+        return False
+    path.write_bytes(body)
+    return True
+
+
+def _gzip(text: str) -> bytes:
+    # mtime=0 keeps unchanged shards byte-identical between builds.
+    return gzip.compress(text.encode(), compresslevel=9, mtime=0)
+
+
+def write_sitemaps(
+    state: pd.DataFrame,
+    public_dir: Path,
+    origin: str = SITE_ORIGIN,
+    max_urls: int = MAX_URLS_PER_SITEMAP,
+) -> dict:
+    """Write ``sitemaps/tools-NNNN.xml.gz`` shards, ``sitemaps/pages.xml.gz`` and the ``sitemap.xml`` index.
+
+    Tools are sharded in slug order, so a rebuild only rewrites shards whose URLs or lastmods moved.
+    """
+    shard_dir = public_dir / "sitemaps"
+    shard_dir.mkdir(parents=True, exist_ok=True)
+    tools = state[state["slug"].str.fullmatch(SLUG_PATTERN)].sort_values("slug")
+    entries = (
+        "<url><loc>" + origin + "/tool/" + tools["slug"] + "</loc><lastmod>" + tools["lastmod"]
+        + "</lastmod><changefreq>weekly</changefreq><priority>0.7</priority></url>"
+    ).tolist()
+    lastmods = tools["lastmod"].tolist()
+    newest = max(lastmods, default="")
+
+    pages = [
+        f"<url><loc>{origin}{path}</loc><changefreq>{changefreq}</changefreq><priority>{priority}</priority></url>"
+        for path, changefreq, priority in STATIC_PAGES
+    ]
+    shards = {"pages.xml.gz": (pages, newest)}
+    for number, start in enumerate(range(0, len(entries), max_urls), 1):
+        shards[f"tools-{number:04d}.xml.gz"] = (entries[start : start + max_urls], max(lastmods[start : start + max_urls]))
+
+    written = 0
+    for name, (urls, _) in shards.items():
+        xml = f'<?xml version="1.0" encoding="UTF-8"?>\n<urlset xmlns="{XMLNS}">\n' + "\n".join(urls) + "\n</urlset>\n"
+        written += _write_if_changed(shard_dir / name, _gzip(xml))
+    for stale in shard_dir.glob("tools-*.xml.gz"):
+        if stale.name not in shards:
+            stale.unlink()
+
+    index = "\n".join(
+        f"<sitemap><loc>{origin}/sitemaps/{name}</loc>" + (f"<lastmod>{lastmod}</lastmod>" if lastmod else "") + "</sitemap>"
+        for name, (_, lastmod) in shards.items()
+    )
+    xml = f'<?xml version="1.0" encoding="UTF-8"?>\n<sitemapindex xmlns="{XMLNS}">\n{index}\n</sitemapindex>\n'
+    written += _write_if_changed(public_dir / "sitemap.xml", xml.encode())
+    return {"urls": len(entries) + len(pages), "shards": len(shards), "files_written": written}
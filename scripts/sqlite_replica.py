@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""Local SQLite replica of the D1 database, built from the migrations and the cleaned dataset."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import re
+import sqlite3
+import time
+from pathlib import Path
+from typing import Iterable, Sequence
+
+from d1_seed import TOOL_COLUMNS
+from similar_tools import SIMILAR_COLUMNS
+
+DEFAULT_MIGRATIONS_DIR = Path("migrations")
+INDEX_NAME = re.compile(r"CREATE\s+(?:UNIQUE\s+)?INDEX\s+(?:IF\s+NOT\s+EXISTS\s+)?(\w+)", re.IGNORECASE)
+FTS_TABLE = re.compile(r"CREATE\s+VIRTUAL\s+TABLE\s+(?:IF\s+NOT\s+EXISTS\s+)?(\w+)\s+USING\s+fts5", re.IGNORECASE)
+TRIGGER = re.compile(r"CREATE\s+TRIGGER\s+(?:IF\s+NOT\s+EXISTS\s+)?(\w+)\b.*?\bEND;", re.IGNORECASE | re.DOTALL)
+
+
+def migration_files(migrations_dir: Path) -> list[Path]:
+    return sorted(migrations_dir.glob("*.sql"))
+
+
+def fts_tables(migrations_dir: Path) -> list[str]:
+    return [
+        name
+        for migration in migration_files(migrations_dir)
+        for name in FTS_TABLE.findall(migration.read_text(encoding="utf-8"))
+    ]
+
+
+def fts_triggers(migrations_dir: Path) -> dict[str, str]:
+    """``{name: CREATE TRIGGER statement}`` for the triggers that write into an FTS table."""
+    tables = fts_tables(migrations_dir)
+    triggers = {}
+    for migration in migration_files(migrations_dir):
+        for match in TRIGGER.finditer(migration.read_text(encoding="utf-8")):
+            if any(re.search(rf"INSERT\s+INTO\s+{table}\b", match.group(0), re.IGNORECASE) for table in tables):
+                triggers[match.group(1)] = match.group(0)
+    return triggers
+
+
+def insert_sql(table: str, columns: Sequence[str]) -> str:
+    return f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({', '.join('?' for _ in columns)})"
+
+
+def build_replica(
+    path: Path,
+    rows: Iterable[Sequence[object]],
+    migrations_dir: Path = DEFAULT_MIGRATIONS_DIR,
+    similar: Iterable[Sequence[object]] = (),
+) -> dict:
+    """Apply every migration to a fresh database and load ``rows`` into tools (and ``similar`` into
+    tool_similar) in one transaction.
+
+    The file is built next to ``path`` and renamed into place, so readers never see a partial replica.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{path.name}.tmp")
+    tmp.unlink(missing_ok=True)
+    started = time.perf_counter()
+    conn = sqlite3.connect(tmp, isolation_level=None)
+    try:
+        # A throwaway build artifact: no rollback journal or fsync needed until the final rename.
+        conn.execute("PRAGMA journal_mode = OFF")
+        conn.execute("PRAGMA synchronous = OFF")
+        for migration in migration_files(migrations_dir):
+            conn.executescript(migration.read_text(encoding="utf-8"))
+        # Indexing row by row through the triggers costs ~10x a single rebuild after the load.
+        triggers = fts_triggers(migrations_dir)
+        for name in triggers:
+            conn.execute(f"DROP TRIGGER {name}")
+        conn.execute("BEGIN")
+        loaded = conn.executemany(insert_sql("tools", TOOL_COLUMNS), rows).rowcount
+        similar = list(similar)
+        if similar:
+            conn.executemany(insert_sql("tool_similar", SIMILAR_COLUMNS), similar)
+        conn.execute("COMMIT")
+        conn.executescript("\n".join(triggers.values()))
+        for table in fts_tables(migrations_dir):
+            conn.execute(f"INSERT INTO {table}({table}) VALUES ('rebuild')")
+            conn.execute(f"INSERT INTO {table}({table}, rank) VALUES ('integrity-check', 1)")
+        conn.execute("ANALYZE")
+    finally:
+        conn.close()
+    tmp.replace(path)
+    return {"path": str(path), "rows": loaded, "load_sec": round(time.perf_counter() - started, 3)}
+
+
+def check_replica(path: Path, summary: dict, migrations_dir: Path = DEFAULT_MIGRATIONS_DIR) -> list[str]:
+    """Return a list of problems; empty when the replica matches the schema and the build summary."""
+    problems = []
+    conn = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+    try:
+        integrity = conn.execute("PRAGMA integrity_check").fetchone()[0]
+        if integrity != "ok":
+            problems.append(f"integrity_check: {integrity}")
+        if conn.execute("PRAGMA foreign_key_check").fetchall():
+            problems.append("foreign_key_check reported violations")
+
+        rows, slugs = conn.execute("SELECT COUNT(*), COUNT(DISTINCT slug) FROM tools").fetchone()
+        if rows != slugs:
+            problems.append(f"duplicate slugs: {rows - slugs}")
+        if rows != summary.get("seed_tool_count"):
+            problems.append(f"tools has {rows} rows, dataset_summary says {summary.get('seed_tool_count')}")
+        categories = conn.execute("SELECT COUNT(DISTINCT category) FROM tools").fetchone()[0]
+        if "categories" in summary and categories != summary["categories"]:
+            problems.append(f"tools has {categories} categories, dataset_summary says {summary['categories']}")
+
+        expected = {
+            name
+            for migration in migration_files(migrations_dir)
+            for name in INDEX_NAME.findall(migration.read_text(encoding="utf-8"))
+        }
+        present = {name for (name,) in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+        for name in sorted(expected - present):
+            problems.append(f"missing index: {name}")
+        if conn.execute("SELECT 1 FROM sqlite_master WHERE name = 'tool_similar'").fetchone():
+            dangling = conn.execute(
+                "SELECT COUNT(*) FROM tool_similar WHERE slug NOT IN (SELECT slug FROM tools)"
+                " OR similar_slug NOT IN (SELECT slug FROM tools) OR slug = similar_slug"
+            ).fetchone()[0]
+            if dangling:
+                problems.append(f"tool_similar has {dangling} rows pointing at missing tools or at themselves")
+            similar_rows = summary.get("similar", {}).get("rows")
+            if similar_rows is not None and similar_rows != conn.execute("SELECT COUNT(*) FROM tool_similar").fetchone()[0]:
+                problems.append(f"tool_similar row count differs from dataset_summary ({similar_rows})")
+        for table in fts_tables(migrations_dir):
+            # One docsize row per indexed document; fewer means the search index is missing tools.
+            indexed = conn.execute(f"SELECT COUNT(*) FROM {table}_docsize").fetchone()[0]
+            if indexed != rows:
+                problems.append(f"{table} indexes {indexed} rows, tools has {rows}")
+    finally:
+        conn.close()
+    return problems
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Check a replica built by build_dataset.py")
+    parser.add_argument("--db", default=Path("data/tools.sqlite"), type=Path)
+    parser.add_argument("--summary", default=Path("data/dataset_summary.json"), type=Path)
+    parser.add_argument("--migrations", default=DEFAULT_MIGRATIONS_DIR, type=Path)
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    summary = json.loads(args.summary.read_text(encoding="utf-8"))
+    problems = check_replica(args.db, summary, args.migrations)
+    print(json.dumps({"db": str(args.db), "ok": not problems, "problems": problems}, indent=2))
+    if problems:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""Static JSON snapshot of the unfiltered and per-category tool listings, served from Pages instead of D1."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import shutil
+from pathlib import Path
+
+import pandas as pd
+
+# Field names as returned by /api/tools (functions/api/[[path]].js).
+API_FIELDS = {
+    "tool_slug": "slug",
+    "tool_name": "name",
+    "category": "category",
+    "tags": "tags",
+    "description": "description",
+    "website_link": "website_url",
+    "domain": "domain",
+    "quality_status": "quality_status",
+}
+# "newest" is id order in D1, which depends on the seeding history rather than on the dataset.
+SNAPSHOT_SORTS = ("name_asc", "name_desc")
+DEFAULT_PAGE_SIZE = 20
+MAX_CATEGORIES = 300
+
+
+def _dump(payload: object) -> bytes:
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+def listing_key(category: str | None) -> str:
+    if category is None:
+        return "all"
+    return "c-" + hashlib.sha1(category.encode()).hexdigest()[:12]
+
+
+def listing_pages(items: pd.DataFrame, page_size: int, max_pages: int) -> dict[str, bytes]:
+    """``{"<sort>-<page>.json": payload}`` for one listing, in the /api/tools response shape."""
+    total = len(items)
+    total_pages = max(1, -(-total // page_size))
+    pages = total_pages if max_pages <= 0 else min(total_pages, max_pages)
+    # Stable sort over seed order matches D1 walking idx_tools_name (ties in rowid order).
+    ascending = items.sort_values("name", kind="stable")
+    orders = {"name_asc": ascending, "name_desc": ascending.iloc[::-1]}
+    files = {}
+    for sort in SNAPSHOT_SORTS:
+        records = orders[sort].to_dict("records")
+        for page in range(1, pages + 1):
+            payload = {
+                "items": records[(page - 1) * page_size : page * page_size],
+                "page": page,
+                "pageSize": page_size,
+                "total": total,
+                "totalPages": total_pages,
+            }
+            files[f"{sort}-{page}.json"] = _dump(payload)
+    return files
+
+
+def publish_version(files: dict[str, bytes], out_dir: Path, manifest: dict) -> tuple[str, str | None]:
+    """Write ``files`` under ``out_dir/v/<version>/`` and point ``manifest.json`` at them.
+
+    The version is a hash of the file contents, so shard URLs are immutable; only the small
+    manifest needs revalidation. Versions older than the previous build are removed.
+    Returns ``(version, previous_version)``.
+    """
+    digest = hashlib.sha256()
+    for name in sorted(files):
+        digest.update(name.encode() + b"\0" + files[name] + b"\0")
+    version = digest.hexdigest()[:16]
+
+    version_dir = out_dir / "v" / version
+    if not version_dir.exists():
+        tmp = version_dir.with_name(f"{version}.tmp")
+        shutil.rmtree(tmp, ignore_errors=True)
+        for name, body in files.items():
+            path = tmp / name
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(body)
+        tmp.replace(version_dir)
+
+    manifest_path = out_dir / "manifest.json"
+    previous = json.loads(manifest_path.read_text(encoding="utf-8")).get("version") if manifest_path.exists() else None
+    manifest_path.write_bytes(_dump({"version": version, **manifest}))
+
+    # Keep the previous version so pages loaded before the deploy can still fetch their shards.
+    keep = {version, previous}
+    for stale in (out_dir / "v").iterdir():
+        if stale.name not in keep:
+            shutil.rmtree(stale)
+    return version, previous
+
+
+def write_snapshot(
+    rows: pd.DataFrame,
+    out_dir: Path,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    max_pages: int = 0,
+) -> dict:
+    """Write ``v/<version>/...`` shards plus ``manifest.json`` under ``out_dir``; returns a size summary."""
+    items = rows[list(API_FIELDS)].rename(columns=API_FIELDS).astype(str)
+    items = items[~items["quality_status"].str.startswith("invalid")].reset_index(drop=True)
+
+    counts = items["category"].value_counts()
+    categories = sorted(counts.items(), key=lambda pair: (-pair[1], pair[0]))[:MAX_CATEGORIES]
+    files = {"categories.json": _dump({"items": [{"category": name, "count": int(count)} for name, count in categories]})}
+    listings = {}
+    for category, group in [(None, items), *items.groupby("category", sort=True)]:
+        key = listing_key(category)
+        shards = listing_pages(group, page_size, max_pages)
+        files.update({f"{key}/{name}": body for name, body in shards.items()})
+        entry = {"key": key, "count": len(group), "pages": len(shards) // len(SNAPSHOT_SORTS)}
+        if category is None:
+            listings["all"] = entry
+        else:
+            listings.setdefault("categories", {})[category] = entry
+
+    manifest_path = out_dir / "manifest.json"
+    manifest = {
+        "pageSize": page_size,
+        "sorts": list(SNAPSHOT_SORTS),
+        "total": len(items),
+        "all": listings["all"],
+        "categories": listings.get("categories", {}),
+    }
+    version, previous = publish_version(files, out_dir, manifest)
+    return {
+        "version": version,
+        "previous_version": previous,
+        "files": len(files),
+        "bytes": sum(len(body) for body in files.values()),
+        "manifest_bytes": manifest_path.stat().st_size,
+    }
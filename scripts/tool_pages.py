@@ -0,0 +1,404 @@
+"""Static /tool/:slug pages rendered at build time, mirroring functions/tool/[slug].js.
+
+A standalone artifact: nothing serves these files by default, and the page function does not look for them.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import re
+from pathlib import Path
+from string import Template
+from urllib.parse import quote, urlsplit
+
+import pandas as pd
+
+SITE_ORIGIN = "https://findaidir.com"
+SLUG_PATTERN = r"[a-z0-9-]{1,110}"
+# The page function tops up from live queries below MIN_SIMILAR precomputed neighbours; those
+# pages are skipped rather than re-implementing the fallback here.
+MIN_SIMILAR = 6
+MAX_SIMILAR = 9
+# Editing this module (the templates below) re-renders every page.
+TEMPLATE_VERSION = hashlib.sha256(Path(__file__).read_bytes()).hexdigest()[:16]
+# Characters encodeURIComponent leaves alone, besides letters and digits.
+URI_COMPONENT_SAFE = "-_.!~*'()"
+# WHATWG URL parsing: host code points that make ``new URL`` throw, and the printable ASCII each
+# component percent-encodes (non-ASCII is always encoded).
+FORBIDDEN_HOST_CHARS = set("#%/:<>?@[\\]^|")
+PATH_UNSAFE = '"#<>?`{}'
+QUERY_UNSAFE = "\"#<>'"
+FRAGMENT_UNSAFE = '"<>`'
+
+LAYOUT = Template(
+    """<!doctype html>
+<html lang="en">
+  <head>
+    <meta charset="UTF-8" />
+    <meta name="viewport" content="width=device-width, initial-scale=1.0" />
+    <title>${title}</title>
+    <meta name="description" content="${description}" />
+    <meta name="robots" content="index,follow,max-image-preview:large" />
+    <link rel="canonical" href="${canonical}" />
+    <meta property="og:type" content="website" />
+    <meta property="og:title" content="${title}" />
+    <meta property="og:description" content="${description}" />
+    <meta property="og:url" content="${canonical}" />
+    <meta name="theme-color" content="#0f6f5c" />
+    <style>
+      :root{--ink:#0c1624;--line:rgba(12,22,36,.15);--muted:#465666;--accent:#0f6f5c}
+      body{font-family:"IBM Plex Sans",system-ui,-apple-system,Segoe UI,sans-serif;background:linear-gradient(140deg,#d8e4ca 0%,#f4f6ef 42%,#dce7ec 100%);color:var(--ink);margin:0}
+      .wrap{max-width:1060px;margin:0 auto;padding:1rem}
+      .top{display:flex;justify-content:space-between;gap:.8rem;align-items:center;margin-bottom:.8rem}
+      .brand{display:inline-flex;align-items:center;gap:.45rem;font-weight:700;font-size:1.08rem;color:#0c1624;text-decoration:none}
+      .brand-logo{width:28px;height:28px;border-radius:7px;box-shadow:0 3px 8px rgba(12,22,36,.15)}
+      .nav{display:flex;gap:.5rem;flex-wrap:wrap}
+      .nav a{text-decoration:none;color:#0c1624;border:1px solid var(--line);border-radius:999px;padding:.32rem .64rem;font-size:.82rem;background:rgba(255,255,255,.68)}
+      .panel{background:rgba(255,255,255,.9);border:1px solid var(--line);border-radius:16px;padding:1rem;box-shadow:0 14px 30px rgba(9,20,34,.1)}
+      .tool-head{display:grid;grid-template-columns:58px 1fr;gap:.7rem;align-items:center}
+      .logo{width:58px;height:58px;border-radius:14px;border:1px solid var(--line);background:#fff;overflow:hidden;display:flex;align-items:center;justify-content:center}
+      .logo img{width:100%;height:100%;object-fit:cover}
+      .logo-fallback,.similar-fallback{display:none;align-items:center;justify-content:center;width:100%;height:100%;font-weight:700;color:#35516a}
+      h1{font-family:"Space Grotesk","Avenir Next",sans-serif;margin:0;font-size:clamp(1.6rem,4vw,2.3rem);line-height:1.1}
+      .subtitle{margin:.5rem 0 0;color:#33485c;line-height:1.45}
+      .pills{display:flex;flex-wrap:wrap;gap:.46rem;margin:.7rem 0 0}
+      .pill{display:inline-block;background:rgba(15,111,92,.12);color:#0c5a4b;padding:.24rem .52rem;border-radius:999px;font-size:.75rem}
+      .actions{display:flex;gap:.56rem;flex-wrap:wrap;margin-top:.88rem}
+      .btn{text-decoration:none;display:inline-flex;align-items:center;justify-content:center;border-radius:10px;padding:.5rem .78rem;font-weight:600;font-size:.9rem;border:1px solid transparent}
+      .btn-primary{background:linear-gradient(120deg,#0d5a4b 0%,#176f8e 100%);color:#fff}
+      .btn-ghost{background:transparent;color:#0c1624;border-color:var(--line)}
+      .facts{margin-top:.86rem;display:grid;grid-template-columns:repeat(3,minmax(0,1fr));gap:.55rem}
+      .fact{border:1px solid var(--line);border-radius:12px;padding:.62rem;background:rgba(255,255,255,.8)}
+      .fact strong{display:block;font-size:.74rem;text-transform:uppercase;letter-spacing:.04em;color:#3a5469}
+      .fact span{display:block;margin-top:.28rem;font-size:.92rem;color:#1b3246;word-break:break-word}
+      .section-title{font-family:"Space Grotesk","Avenir Next",sans-serif;margin:1rem 0 .66rem;font-size:1.22rem}
+      .similar-grid{list-style:none;margin:0;padding:0;display:grid;grid-template-columns:repeat(3,minmax(0,1fr));gap:.7rem}
+      .similar-card{background:rgba(255,255,255,.9);border:1px solid var(--line);border-radius:14px;padding:.76rem}
+      .similar-head{display:grid;grid-template-columns:36px 1fr;gap:.52rem;align-items:center}
+      .similar-logo{width:36px;height:36px;border-radius:10px;border:1px solid var(--line);overflow:hidden;background:#fff}
+      .similar-logo img{width:100%;height:100%;object-fit:cover}
+      .similar-card h3{margin:0;font-size:.98rem;font-family:"Space Grotesk","Avenir Next",sans-serif}
+      .similar-card p{margin:.44rem 0 0;color:#33485c;font-size:.88rem;line-height:1.4}
+      .similar-links{display:flex;gap:.6rem;margin-top:.58rem}
+      .similar-links a{text-decoration:none;color:#0b4f43;font-weight:600;font-size:.85rem}
+      @media (max-width:960px){.similar-grid{grid-template-columns:repeat(2,minmax(0,1fr))}.facts{grid-template-columns:1fr 1fr}}
+      @media (max-width:660px){.top{flex-direction:column;align-items:flex-start}.tool-head{grid-template-columns:48px 1fr}.logo{width:48px;height:48px}.similar-grid{grid-template-columns:1fr}.facts{grid-template-columns:1fr}}
+    </style>
+    <link rel="preconnect" href="https://fonts.googleapis.com" />
+    <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin />
+    <link
+      href="https://fonts.googleapis.com/css2?family=Space+Grotesk:wght@400;500;700&family=IBM+Plex+Sans:wght@400;500;600&display=swap"
+      rel="stylesheet"
+    />
+  </head>
+  <body>
+    <main class="wrap">
+      ${body}
+    </main>
+  </body>
+</html>"""
+)
+BODY = Template(
+    """
+    <div class="top">
+      <a class="brand" href="https://findaidir.com/">
+        <img class="brand-logo" src="https://findaidir.com/logo-findaidir.svg" alt="" width="28" height="28" />
+        <span>FindAIDir</span>
+      </a>
+      <nav class="nav" aria-label="Primary navigation">
+        <a href="https://findaidir.com/">Browse tools</a>
+        <a href="https://findaidir.com/submit-tool">List your tool</a>
+        <a href="https://findaidir.com/contact">Contact</a>
+      </nav>
+    </div>
+    <article class="panel">
+      <div class="tool-head">
+        ${logo}
+        <div>
+          <h1>${name}</h1>
+          <p class="subtitle">${subtitle}</p>
+        </div>
+      </div>
+
+      <div class="pills">
+        <span class="pill">${category}</span>
+        <span class="pill">${domain}</span>
+        ${quality_pill}
+      </div>
+
+      <div class="actions">
+        ${visit}
+        <a class="btn btn-ghost" href="https://findaidir.com/">Back to directory</a>
+      </div>
+
+      <div class="facts">
+        <div class="fact"><strong>Category</strong><span>${category}</span></div>
+        <div class="fact"><strong>Domain</strong><span>${domain}</span></div>
+        <div class="fact"><strong>Tags</strong><span>${tags}</span></div>
+      </div>
+
+      <script type="application/ld+json">${schema}</script>
+    </article>
+
+    <section>
+      <h2 class="section-title">Similar tools you may like</h2>
+      ${similar}
+    </section>
+  """
+)
+SIMILAR_CARD = Template(
+    """<li class="similar-card">
+        <div class="similar-head">
+          ${logo}
+          <h3><a href="https://findaidir.com/tool/${slug}">${name}</a></h3>
+        </div>
+        <p>${description}</p>
+        <div class="similar-links">
+          <a href="https://findaidir.com/tool/${slug}">View details</a>
+          ${visit}
+        </div>
+      </li>"""
+)
+LOGO = Template(
+    """<span class="${wrapper_class}">
+    <img src="${primary}" alt="${name} logo" loading="lazy" decoding="async" onerror="${on_error}" />
+    <span class="${fallback_class}">${fallback_char}</span>
+  </span>"""
+)
+LOGO_FALLBACK_ONLY = Template(
+    '<span class="${wrapper_class}"><span class="${fallback_class}" style="display:flex">${fallback_char}</span></span>'
+)
+LOGO_ON_ERROR = Template(
+    "if(!this.dataset.fallback){this.dataset.fallback='1';this.src='${fallback}';}"
+    "else{this.remove();this.nextElementSibling.style.display='flex';}"
+)
+NO_SIMILAR = '<p>No similar tools found yet. <a href="https://findaidir.com/">Browse all tools</a>.</p>'
+
+
+def escape_html(value: object) -> str:
+    return (
+        str(value)
+        .replace("&", "&amp;")
+        .replace("<", "&lt;")
+        .replace(">", "&gt;")
+        .replace('"', "&quot;")
+        .replace("'", "&#39;")
+    )
+
+
+def truncate(text: str, max_len: int = 170) -> str:
+    value = str(text or "").strip()
+    # JS string lengths count UTF-16 code units.
+    units = value.encode("utf-16-le")
+    if len(units) // 2 <= max_len:
+        return value
+    return units[: 2 * (max_len - 1)].decode("utf-16-le", errors="ignore") + "..."
+
+
+def _absolute(raw: str) -> str:
+    return raw if raw.startswith("http://") or raw.startswith("https://") else f"https://{raw}"
+
+
+def _url_host(url: str) -> str:
+    """WHATWG ``URL.hostname`` for an http(s) URL; raises ValueError where ``new URL`` would throw."""
+    host = urlsplit(url).hostname
+    if not host or any(char in FORBIDDEN_HOST_CHARS or ord(char) <= 0x20 for char in host):
+        raise ValueError(f"invalid host: {host!r}")
+    try:
+        return host.encode("idna").decode("ascii")
+    except UnicodeError as exc:
+        raise ValueError(f"invalid host: {host!r}") from exc
+
+
+def _percent_encode(value: str, unsafe: str) -> str:
+    return quote(value, safe="".join(chr(code) for code in range(0x21, 0x7F) if chr(code) not in unsafe))
+
+
+def normalize_external_url(raw: str) -> str:
+    """``new URL(...).toString()`` for the http(s) URLs the dataset holds; "" when it would not parse."""
+    raw = str(raw or "").strip()
+    if not raw:
+        return ""
+    try:
+        url = _absolute(raw)
+        parts = urlsplit(url)
+        host = _url_host(url)
+        port = parts.port
+    except ValueError:
+        return ""
+    netloc = host
+    if port is not None and port != (443 if parts.scheme == "https" else 80):
+        netloc = f"{host}:{port}"
+    if "@" in parts.netloc:
+        netloc = f"{parts.netloc.rsplit('@', 1)[0]}@{netloc}"
+    url = f"{parts.scheme}://{netloc}{_percent_encode(parts.path, PATH_UNSAFE) or '/'}"
+    if parts.query:
+        url += f"?{_percent_encode(parts.query, QUERY_UNSAFE)}"
+    if parts.fragment:
+        url += f"#{_percent_encode(parts.fragment, FRAGMENT_UNSAFE)}"
+    return url
+
+
+def logo_sources(domain: str, website_url: str) -> tuple[str, str]:
+    raw = str(domain or "").strip() or str(website_url or "").strip()
+    if not raw:
+        return "", ""
+    try:
+        host = _url_host(_absolute(raw))
+    except ValueError:
+        host = raw
+    safe_host = quote(re.sub(r"^www\.", "", host, flags=re.IGNORECASE), safe=URI_COMPONENT_SAFE)
+    return (
+        f"https://logo.clearbit.com/{safe_host}",
+        f"https://www.google.com/s2/favicons?domain={safe_host}&sz=128",
+    )
+
+
+def render_logo(name: str, domain: str, website_url: str, wrapper_class: str, fallback_class: str) -> str:
+    primary, fallback = logo_sources(domain, website_url)
+    fallback_char = escape_html(str(name or "?")[:1].upper())
+    if not primary:
+        return LOGO_FALLBACK_ONLY.substitute(
+            wrapper_class=escape_html(wrapper_class), fallback_class=escape_html(fallback_class), fallback_char=fallback_char
+        )
+    on_error = LOGO_ON_ERROR.substitute(fallback=fallback.replace("\\", "\\\\").replace("'", "\\'"))
+    return LOGO.substitute(
+        wrapper_class=escape_html(wrapper_class),
+        primary=escape_html(primary),
+        name=escape_html(name),
+        on_error=escape_html(on_error),
+        fallback_class=escape_html(fallback_class),
+        fallback_char=fallback_char,
+    )
+
+
+def render_similar_cards(items: list[dict]) -> str:
+    if not items:
+        return NO_SIMILAR
+    cards = []
+    for item in items:
+        url = normalize_external_url(item["website_url"])
+        visit = (
+            f'<a href="{escape_html(url)}" target="_blank" rel="noopener noreferrer nofollow">Visit site</a>' if url else ""
+        )
+        cards.append(
+            SIMILAR_CARD.substitute(
+                logo=render_logo(item["name"], item["domain"], item["website_url"], "similar-logo", "similar-fallback"),
+                slug=quote(item["slug"], safe=URI_COMPONENT_SAFE),
+                name=escape_html(item["name"]),
+                description=escape_html(truncate(item["description"], 130)),
+                visit=visit,
+            )
+        )
+    return f'<ul class="similar-grid">{"".join(cards)}</ul>'
+
+
+def render_tool_page(row: dict, similar: list[dict]) -> str:
+    """The HTML functions/tool/[slug].js returns for ``row``."""
+    tags = [tag.strip() for tag in str(row["tags"] or "").split(",") if tag.strip()]
+    url = normalize_external_url(row["website_url"])
+    schema = {
+        "@context": "https://schema.org",
+        "@type": "SoftwareApplication",
+        "name": row["name"],
+        "applicationCategory": row["category"],
+        "description": row["description"],
+        "url": row["website_url"],
+        "provider": {"@type": "Organization", "name": row["domain"]},
+    }
+    body = BODY.substitute(
+        logo=render_logo(row["name"], row["domain"], row["website_url"], "logo", "logo-fallback"),
+        name=escape_html(row["name"]),
+        subtitle=escape_html(row["description"] or "No description available."),
+        category=escape_html(row["category"]),
+        domain=escape_html(row["domain"]),
+        quality_pill=f'<span class="pill">{escape_html(row["quality_status"])}</span>' if row["quality_status"] else "",
+        visit=(
+            f'<a class="btn btn-primary" href="{escape_html(url)}" target="_blank" rel="noopener noreferrer nofollow">'
+            "Visit official website</a>"
+            if url
+            else ""
+        ),
+        tags=escape_html(", ".join(tags) or row["category"]),
+        schema=json.dumps(schema, ensure_ascii=False, separators=(",", ":")),
+        similar=render_similar_cards(similar),
+    )
+    return LAYOUT.substitute(
+        title=escape_html(f"{row['name']} | FindAIDir"),
+        description=escape_html(row["description"] or f"{row['name']} listed on FindAIDir."),
+        canonical=escape_html(f"{SITE_ORIGIN}/tool/{row['slug']}"),
+        body=body,
+    )
+
+
+def render_tool_pages(
+    tools: pd.DataFrame,
+    row_hashes: pd.Series,
+    similar: pd.DataFrame,
+    out_dir: Path,
+    state_path: Path,
+) -> dict:
+    """Write ``<out_dir>/<slug>.html`` for every tool whose page inputs changed since the last render.
+
+    ``tools`` uses the /api/tools field names, ``row_hashes`` is the seeded-content hash per slug and
+    ``similar`` holds tool_similar rows. A page's inputs are its own row, its neighbours' rows and this
+    module's source; ``state_path`` keeps their hash per slug between builds.
+    """
+    out_dir.mkdir(parents=True, exist_ok=True)
+    listed = tools[~tools["quality_status"].str.startswith("invalid")]
+    # Same neighbours as the function's query: listed tools only, first MAX_SIMILAR by rank.
+    similar = similar[similar["similar_slug"].isin(listed["slug"])].sort_values(["slug", "rank"])
+    similar = similar[similar.groupby("slug", sort=False).cumcount() < MAX_SIMILAR]
+    counts = similar["slug"].value_counts()
+    pages = listed[listed["slug"].str.fullmatch(SLUG_PATTERN)]
+    eligible = (counts.reindex(pages["slug"], fill_value=0) >= MIN_SIMILAR).to_numpy()
+    skipped_few_similar = int((~eligible).sum())
+    tools, cards = pages[eligible], listed.set_index("slug", drop=False)
+    similar = similar[similar["slug"].isin(tools["slug"])]
+
+    hashes = row_hashes.astype(str)
+    inputs = pd.DataFrame(
+        {
+            "row": hashes.reindex(tools["slug"]).to_numpy(),
+            "similar": (similar["similar_slug"] + ":" + hashes.reindex(similar["similar_slug"]).to_numpy())
+            .groupby(similar["slug"], sort=False)
+            .agg(" ".join)
+            .reindex(tools["slug"])
+            .to_numpy(),
+        },
+        index=tools["slug"].to_numpy(),
+    )
+    page_hashes = pd.util.hash_pandas_object(inputs, index=True, hash_key=TEMPLATE_VERSION).astype(str)
+
+    previous = pd.Series(dtype=str)
+    if state_path.exists():
+        previous = pd.read_csv(state_path, dtype=str, keep_default_na=False).set_index("slug")["page_hash"]
+    paths = [out_dir / f"{slug}.html" for slug in page_hashes.index]
+    stale = (previous.reindex(page_hashes.index) != page_hashes).to_numpy()
+    todo = [slug for slug, path, changed in zip(page_hashes.index, paths, stale) if changed or not path.exists()]
+
+    removed = 0
+    keep = set(page_hashes.index)
+    for path in out_dir.glob("*.html"):
+        if path.stem not in keep:
+            path.unlink()
+            removed += 1
+
+    if todo:
+        rows = tools.set_index("slug", drop=False).loc[todo].to_dict("index")
+        lists = similar[similar["slug"].isin(rows)].groupby("slug", sort=False)["similar_slug"].agg(list)
+        cards = cards.loc[pd.unique(similar["similar_slug"][similar["slug"].isin(rows)])].to_dict("index")
+        for slug in todo:
+            html = render_tool_page(rows[slug], [cards[neighbour] for neighbour in lists[slug]])
+            (out_dir / f"{slug}.html").write_text(html, encoding="utf-8")
+
+    state_path.parent.mkdir(parents=True, exist_ok=True)
+    page_hashes.rename_axis("slug").rename("page_hash").to_csv(state_path)
+    return {
+        "pages": len(page_hashes),
+        "rendered": len(todo),
+        "unchanged": len(page_hashes) - len(todo),
+        "removed": removed,
+        "skipped_few_similar": skipped_few_similar,
+    }
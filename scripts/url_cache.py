@@ -0,0 +1,91 @@
+"""SQLite-backed URL health cache shared across link audit runs."""
+
+from __future__ import annotations
+
+import sqlite3
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable
+
+SQLITE_MAX_VARIABLES = 900
+
+
+@dataclass
+class CachedCheck:
+    url: str
+    status: int
+    final_url: str
+    etag: str
+    last_modified: str
+    checked_at: float
+
+    def is_fresh(self, ttl_sec: float, now: float | None = None) -> bool:
+        now = time.time() if now is None else now
+        return now - self.checked_at < ttl_sec
+
+    def conditional_headers(self) -> dict[str, str]:
+        headers: dict[str, str] = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class UrlHealthCache:
+    def __init__(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS url_health (
+              url TEXT PRIMARY KEY,
+              status INTEGER NOT NULL,
+              final_url TEXT NOT NULL,
+              etag TEXT NOT NULL DEFAULT '',
+              last_modified TEXT NOT NULL DEFAULT '',
+              checked_at REAL NOT NULL
+            )
+            """
+        )
+        self.conn.commit()
+
+    def __enter__(self) -> UrlHealthCache:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def get_many(self, urls: Iterable[str]) -> dict[str, CachedCheck]:
+        unique = list(dict.fromkeys(urls))
+        found: dict[str, CachedCheck] = {}
+        for start in range(0, len(unique), SQLITE_MAX_VARIABLES):
+            batch = unique[start : start + SQLITE_MAX_VARIABLES]
+            placeholders = ",".join("?" for _ in batch)
+            rows = self.conn.execute(
+                "SELECT url, status, final_url, etag, last_modified, checked_at "
+                f"FROM url_health WHERE url IN ({placeholders})",
+                batch,
+            )
+            for row in rows:
+                found[row[0]] = CachedCheck(*row)
+        return found
+
+    def put_many(self, checks: Iterable[CachedCheck]) -> int:
+        rows = [
+            (check.url, check.status, check.final_url, check.etag, check.last_modified, check.checked_at)
+            for check in checks
+        ]
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO url_health (url, status, final_url, etag, last_modified, checked_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+        return len(rows)
+
+    def close(self) -> None:
+        self.conn.close()
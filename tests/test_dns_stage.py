@@ -0,0 +1,70 @@
+"""DNS pre-resolution stage in scripts/dns_stage.py, driven by the in-memory resolver."""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "scripts"))
+
+from dns_stage import DnsCache, DnsEntry, StaticResolver, SystemResolver, resolve_hosts  # noqa: E402
+
+TABLE = {"ok.example": ["192.0.2.1", "2001:db8::1"], "gone.example": "nxdomain", "broken.example": "servfail", "slow.example": "timeout"}
+
+
+class RaisingResolver(StaticResolver):
+    """Raises something other than DnsLookupError for one host."""
+
+    async def resolve(self, host: str) -> list[str]:
+        if host == "bad.example":
+            raise UnicodeError("label empty or too long")
+        return await super().resolve(host)
+
+
+def outcomes(entries: dict[str, DnsEntry]) -> dict[str, str]:
+    return {host: entry.outcome for host, entry in entries.items()}
+
+
+def test_outcomes_from_the_resolver() -> None:
+    entries = asyncio.run(resolve_hosts([*TABLE, "ok.example", ""], StaticResolver(TABLE)))
+    assert outcomes(entries) == {"ok.example": "ok", "gone.example": "nxdomain", "broken.example": "servfail", "slow.example": "timeout"}
+    assert entries["ok.example"].addresses == ["192.0.2.1", "2001:db8::1"]
+    assert entries["gone.example"].dead and entries["broken.example"].dead
+    assert not entries["slow.example"].dead
+
+
+def test_raising_resolver_is_one_error_row() -> None:
+    entries = asyncio.run(resolve_hosts(["bad.example", "ok.example"], RaisingResolver(TABLE)))
+    assert outcomes(entries) == {"bad.example": "error", "ok.example": "ok"}
+
+
+def test_system_resolver_maps_idna_errors() -> None:
+    entries = asyncio.run(resolve_hosts(["ex..com", "x" * 64 + ".com"], SystemResolver(timeout=1.0)))
+    assert set(outcomes(entries).values()) == {"error"}
+
+
+def test_cache_reuse_within_ttl(tmp_path: Path) -> None:
+    cache = DnsCache(tmp_path / "dns.sqlite")
+    first = StaticResolver(TABLE)
+    asyncio.run(resolve_hosts(TABLE, first, cache=cache))
+    assert first.lookups == 4
+
+    second = StaticResolver(TABLE)
+    entries = asyncio.run(resolve_hosts(TABLE, second, cache=cache))
+    # ok/nxdomain/servfail come from the cache; the timeout is looked up again.
+    assert second.lookups == 1
+    assert outcomes(entries) == outcomes(asyncio.run(resolve_hosts(TABLE, StaticResolver(TABLE))))
+
+    expired = StaticResolver(TABLE)
+    asyncio.run(resolve_hosts(TABLE, expired, cache=cache, ttl_sec=0))
+    assert expired.lookups == 4
+    cache.close()
+
+
+def test_transient_errors_are_not_persisted(tmp_path: Path) -> None:
+    cache = DnsCache(tmp_path / "dns.sqlite")
+    asyncio.run(resolve_hosts([*TABLE, "bad.example"], RaisingResolver(TABLE), cache=cache))
+    stored = cache.get_many([*TABLE, "bad.example"])
+    assert outcomes(stored) == {"ok.example": "ok", "gone.example": "nxdomain", "broken.example": "servfail"}
+    cache.close()
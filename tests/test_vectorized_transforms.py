@@ -0,0 +1,84 @@
+"""The column transforms in scripts/build_dataset.py must agree with the per-row functions they replaced."""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+from urllib.parse import urlparse
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "scripts"))
+
+from build_dataset import (  # noqa: E402
+    canonical_homepage,
+    canonical_homepage_series,
+    netloc_series,
+    root_domain,
+    root_domain_series,
+    slugify,
+    slugify_series,
+)
+
+NAMES = ["", "  ", np.nan, None, "ChatGPT", "The AI Tool", "Ünïcödé Tööl", "İstanbul GPT", "a--b__c", "x" * 200, "nan"]
+URLS = [
+    "",
+    "   ",
+    np.nan,
+    None,
+    "https://example.com",
+    "https://Example.COM/path?q=1",
+    "  https://www.example.com/  ",
+    "HTTP://WWW.Example.co.uk",
+    "https://www.example.com.au?x=1",
+    "https://host.io:8443/x#frag",
+    "http://localhost:3000",
+    "https://user:pw@host.io:8443/",
+    "https://[::1]:8080/",
+    "https://bücher.de/",
+    "https://xn--bcher-kva.de/",
+    "https://例え.jp/path/",
+    "https://host.io/a b",
+    "https://host.io\\path",
+    "https://www./",
+    "https://",
+    "example.com",
+    "ftp://files.example.com/",
+    "mailto:someone@example.com",
+]
+
+
+def as_series(values: list) -> pd.Series:
+    # Build steps filter rows first, so the transforms must not assume a default index.
+    return pd.Series(values, index=np.arange(len(values)) * 3 + 7, dtype=object)
+
+
+@pytest.mark.parametrize("values", [NAMES, URLS], ids=["names", "urls"])
+def test_slugify_series(values: list) -> None:
+    assert slugify_series(as_series(values)).tolist() == [slugify(str(value)) for value in values]
+
+
+def test_canonical_homepage_series() -> None:
+    assert canonical_homepage_series(as_series(URLS)).tolist() == [canonical_homepage(url) for url in URLS]
+
+
+def test_netloc_series() -> None:
+    homepages = [canonical_homepage(url) for url in URLS]
+    assert netloc_series(as_series(homepages)).tolist() == [urlparse(url).netloc.lower() for url in homepages]
+
+
+def test_root_domain_series() -> None:
+    domains = [urlparse(canonical_homepage(url)).netloc.lower() for url in URLS]
+    domains += ["www.example.com", "sub.deep.example.org.uk", "Example.COM", "localhost", "", np.nan]
+    assert root_domain_series(as_series(domains)).tolist() == [root_domain(str(domain)) for domain in domains]
+
+
+@pytest.mark.parametrize(
+    "transform", [slugify_series, canonical_homepage_series, netloc_series, root_domain_series]
+)
+def test_empty_and_all_fallback_columns(transform) -> None:
+    assert transform(pd.Series([], dtype=object)).tolist() == []
+    # Every row takes the per-row fallback path.
+    assert len(transform(as_series(["Ünï", np.nan, "ftp://x.io/"]))) == 3